@@ -0,0 +1,66 @@
+import http from 'http';
+import { NextRequest, NextResponse } from 'next/server';
+import { getSessionUser, getSessionTenantId } from '@/lib/auth';
+
+export const runtime = 'nodejs';
+
+// The manual is built by the local manual server (python manual_server.py), which keeps
+// the generator warm between requests. It listens on MANUAL_SERVER_SOCKET if set,
+// otherwise on MANUAL_SERVER_HOST:MANUAL_SERVER_PORT (default 127.0.0.1:8765).
+const MANUAL_SERVER_TIMEOUT_MS = 60000;
+
+interface ManualResponse {
+  status: number;
+  headers: http.IncomingHttpHeaders;
+  body: Buffer;
+}
+
+function fetchManual(path: string): Promise<ManualResponse> {
+  const socketPath = process.env.MANUAL_SERVER_SOCKET;
+  const target = socketPath
+    ? { socketPath }
+    : { host: process.env.MANUAL_SERVER_HOST || '127.0.0.1', port: Number(process.env.MANUAL_SERVER_PORT || 8765) };
+
+  return new Promise((resolve, reject) => {
+    const req = http.request({ ...target, path, method: 'GET', timeout: MANUAL_SERVER_TIMEOUT_MS }, res => {
+      const chunks: Buffer[] = [];
+      res.on('data', chunk => chunks.push(chunk));
+      res.on('end', () => resolve({ status: res.statusCode || 500, headers: res.headers, body: Buffer.concat(chunks) }));
+      res.on('error', reject);
+    });
+    req.on('timeout', () => req.destroy(new Error('Manual server timed out')));
+    req.on('error', reject);
+    req.end();
+  });
+}
+
+export async function GET(req: NextRequest) {
+  if (!getSessionUser()) return NextResponse.json({error:'Unauthorized'},{status:401});
+
+  const tenantId = getSessionTenantId();
+  const locale = req.nextUrl.searchParams.get('locale') || 'en';
+  const params = new URLSearchParams({ locale });
+  if (tenantId) params.set('tenant', tenantId);
+
+  let res: ManualResponse;
+  try {
+    res = await fetchManual(`/manual?${params.toString()}`);
+  } catch (err: any) {
+    return NextResponse.json({error: `Manual server unavailable: ${err?.message || err}`}, {status: 503});
+  }
+
+  if (res.status !== 200) {
+    let error = 'Manual build failed';
+    try { error = JSON.parse(res.body.toString('utf-8')).error || error; } catch {}
+    return NextResponse.json({error}, {status: res.status});
+  }
+
+  return new NextResponse(res.body, {
+    status: 200,
+    headers: {
+      'Content-Type': String(res.headers['content-type'] || 'application/octet-stream'),
+      'Content-Disposition': String(res.headers['content-disposition'] || 'attachment; filename="user-manual.docx"'),
+      'Cache-Control': 'no-store',
+    }
+  });
+}
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Artifact Store for the Cartup CxP manual tools.
+Generated artifacts (manual DOCX files, HTML bundles, reports) are stored on disk under
+the fingerprint of their inputs, so a repeat request is a file read instead of a
+rebuild. The store is bounded in size and evicts the least recently used artifacts
+first; concurrent requests for the same fingerprint wait for the one build in flight
+instead of starting their own.
+
+    python artifact_store.py             # list stored artifacts
+    python artifact_store.py --clear     # remove them all
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+STORE_DIR = os.path.join(ROOT_DIR, '.cache', 'artifacts')
+DEFAULT_MAX_BYTES = 512 * 1024 ** 2
+
+def fingerprint(**inputs):
+    """Stable SHA-256 of an artifact's inputs (any JSON-serializable values)"""
+    canonical = json.dumps(inputs, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+class ArtifactStore:
+    """Size-bounded, content-addressed artifact cache with LRU eviction and build coalescing"""
+
+    def __init__(self, root=STORE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._in_flight = {}        # fingerprint -> Future of the build
+        self._entries = OrderedDict()  # fingerprint -> size, least recently used first
+        self._total = 0
+        self._load()
+
+    def _load(self):
+        """Index artifacts already on disk, using modification time as last use"""
+        os.makedirs(self.root, exist_ok=True)
+        found = []
+        for name in os.listdir(self.root):
+            if name.endswith('.tmp'):
+                # Left behind by an interrupted write
+                self._remove(os.path.join(self.root, name))
+                continue
+            st = os.stat(os.path.join(self.root, name))
+            found.append((st.st_mtime_ns, name, st.st_size))
+        for _, name, size in sorted(found):
+            self._entries[name] = size
+            self._total += size
+
+    def path(self, key):
+        """File of an artifact"""
+        return os.path.join(self.root, key)
+
+    def get(self, key):
+        """Stored bytes of an artifact, or None"""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+        try:
+            with open(self.path(key), 'rb') as f:
+                data = f.read()
+            # Record the use on disk too, so the LRU order survives restarts
+            os.utime(self.path(key))
+            return data
+        except OSError:
+            with self._lock:
+                self._forget(key)
+            return None
+
+    def put(self, key, data):
+        """Store an artifact and evict least recently used ones beyond max_bytes. An artifact
+        larger than max_bytes on its own is not stored; returns whether it was"""
+        if len(data) > self.max_bytes:
+            with self._lock:
+                self._forget(key)
+                self._remove(self.path(key))
+            return False
+        tmp = f'{self.path(key)}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, self.path(key))
+        with self._lock:
+            self._forget(key)
+            self._entries[key] = len(data)
+            self._total += len(data)
+            self._evict(keep=key)
+        return True
+
+    def get_or_build(self, key, build):
+        """Artifact bytes for `key`, calling build() only if no stored or in-flight copy exists.
+
+        Callers that ask for a key while it is being built wait for that build and get its
+        result (or its exception).
+        """
+        while True:
+            data = self.get(key)
+            if data is not None:
+                with self._lock:
+                    self.hits += 1
+                return data
+
+            with self._lock:
+                future = self._in_flight.get(key)
+                if future is None and key not in self._entries:
+                    future = self._in_flight[key] = Future()
+                    self.misses += 1
+                    break
+                if future is not None:
+                    self.hits += 1
+            if future is not None:
+                return future.result()
+            # Another build stored it since get() missed: read that copy
+
+        try:
+            data = build()
+            self.put(key, data)
+            future.set_result(data)
+            return data
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def clear(self):
+        """Remove every stored artifact"""
+        with self._lock:
+            for key in list(self._entries):
+                self._forget(key)
+                self._remove(self.path(key))
+
+    def stats(self):
+        """Counts and sizes for status pages"""
+        with self._lock:
+            return {
+                'artifacts': len(self._entries),
+                'bytes': self._total,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'in_flight': len(self._in_flight),
+            }
+
+    def entries(self):
+        """(fingerprint, size, last used) of every artifact, most recently used first"""
+        with self._lock:
+            keys = list(reversed(self._entries.items()))
+        result = []
+        for key, size in keys:
+            try:
+                result.append((key, size, os.path.getmtime(self.path(key))))
+            except OSError:
+                pass
+        return result
+
+    def _evict(self, keep=None):
+        """Drop least recently used artifacts until the store fits max_bytes (lock held)"""
+        for key in list(self._entries):
+            if self._total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self._forget(key)
+            self._remove(self.path(key))
+
+    def _forget(self, key):
+        """Remove an artifact from the index (lock held)"""
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._total -= size
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+if __name__ == '__main__':
+    from size_report import format_size
+
+    parser = argparse.ArgumentParser(description='Inspect or clear the generated artifact store')
+    parser.add_argument('--root', default=STORE_DIR, help='Store directory (default: .cache/artifacts)')
+    parser.add_argument('--clear', action='store_true', help='Remove every stored artifact')
+    args = parser.parse_args()
+
+    store = ArtifactStore(args.root, max_bytes=float('inf'))
+    if args.clear:
+        count = len(store.entries())
+        store.clear()
+        print(f"🧹 Removed {count} artifacts from {args.root}")
+    else:
+        entries = store.entries()
+        print(f"📦 {args.root}: {len(entries)} artifacts, {format_size(store.stats()['bytes'])}")
+        for key, size, used in entries:
+            print(f"{format_size(size):>10}  {time.strftime('%Y-%m-%d %H:%M', time.localtime(used))}  {key}")
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Calendar Feeds for the Cartup CxP Roster Management System.
+Writes the roster as iCalendar (.ics) feeds that employees subscribe to from their phone
+or desktop calendar: one per employee with their own shifts, and one per team with
+everyone's. Shift times and names come from the Shift Codes Reference table of the manual
+(the tenant's shift definitions and manual_content/appendix.yaml); days off, leave and
+codes without times become all-day events, blank cells are skipped.
+
+    employees/SLL-88818.ics     teams/VOICE.ics     manifest.json
+
+Feeds are streamed to disk event by event and written by a pool of worker processes. The
+manifest records a digest of each feed's roster rows, so a rebuild only rewrites the feeds
+of employees (and teams) whose rows changed.
+
+    python calendar_feeds.py --tenant <tenant-id>       # -> data/tenants/<id>/calendars/
+    python calendar_feeds.py roster.csv -o calendars/ --timezone Asia/Dhaka
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from i18n import _
+from manual_content import load_content
+from roster import combine_grids, grid_days, roster_grid, shift_times
+from tenant_data import DATA_DIR, DEFAULT_SHIFT_DEFINITIONS, get_tenant_data_dir, load_tenant, shift_code_rows
+
+FEEDS_VERSION = 1
+MANIFEST = 'manifest.json'
+UID_DOMAIN = 'roster.cartup-cxp'
+PRODID = '-//Cartup CxP//Roster Calendar Feeds//EN'
+# Feeds handed to a worker at a time
+CHUNK = 256
+
+def feed_name(kind, name):
+    """Path of a feed inside the output directory: employees/<id>.ics or teams/<team>.ics"""
+    return f"{kind}/{re.sub(r'[^A-Za-z0-9_-]', '_', name)}.ics"
+
+def escape(text):
+    """Text property value escaped for iCalendar"""
+    return (text.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+def fold(line):
+    """Content line folded to 75 octets and terminated with CRLF"""
+    data = line.encode('utf-8')
+    if len(data) <= 75:
+        return line + '\r\n'
+    parts = []
+    start, limit = 0, 75
+    while start < len(data):
+        end = min(start + limit, len(data))
+        # Never split a UTF-8 sequence
+        while end < len(data) and data[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(data[start:end].decode('utf-8'))
+        start, limit = end, 74
+    return '\r\n '.join(parts) + '\r\n'
+
+def code_events(grid, definitions):
+    """Per grid code: None for blank cells, else (summary, description, start, end) with
+    start/end minutes for shifts and None for all-day codes, from the shift code table"""
+    content = load_content()['appendix']
+    descriptions = {item['code']: item['description'] for item in content['shift_codes']}
+    table = {code.upper(): (time_type, description)
+             for code, time_type, description in shift_code_rows(descriptions, {'shift_definitions': definitions})}
+    times = shift_times(definitions)
+    events = []
+    for code in grid['codes']:
+        if not code:
+            events.append(None)
+            continue
+        time_type, description = table.get(code, (code, ''))
+        if code in times:
+            start, end = times[code]
+            events.append((f'{_(description or code)} ({code})', _(time_type), start, end))
+        else:
+            events.append((_(time_type), _(description), None, None))
+    return events
+
+def feed_digests(grid, events, timezone=None, year=None):
+    """{feed name: digest of everything the feed is built from}"""
+    common = hashlib.sha256(json.dumps([FEEDS_VERSION, events, timezone], sort_keys=True, ensure_ascii=False).encode())
+    common.update(np.asarray(grid_days(grid, year), dtype=np.int64).tobytes())
+    matrix = grid['matrix']
+    team_digests = {}
+    digests = {}
+    for row, emp in enumerate(grid['employees']):
+        if not emp.get('id'):
+            continue
+        digest = common.copy()
+        digest.update(json.dumps([emp['id'], emp.get('name')], ensure_ascii=False).encode())
+        digest.update(matrix[row].tobytes())
+        digests[feed_name('employees', emp['id'])] = digest.hexdigest()[:20]
+        team = grid['teams'][grid['team_index'][row]]
+        team_digests.setdefault(team, common.copy()).update(digest.digest())
+    for team, digest in team_digests.items():
+        digest.update(team.encode())
+        digests[feed_name('teams', team)] = digest.hexdigest()[:20]
+    return digests
+
+def read_manifest(output_dir):
+    """Manifest of a feeds directory, or an empty one"""
+    try:
+        with open(os.path.join(output_dir, MANIFEST), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('v') == FEEDS_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {'v': FEEDS_VERSION, 'feeds': {}}
+
+# Set in each worker by _init_worker()
+_context = None
+
+def _init_worker(context):
+    global _context
+    _context = context
+
+# YYYYMMDD of day ordinals
+_day_strings = {}
+
+def _day(ordinal):
+    if ordinal not in _day_strings:
+        _day_strings[ordinal] = datetime.date.fromordinal(ordinal).strftime('%Y%m%d')
+    return _day_strings[ordinal]
+
+def write_feed(stream, title, rows, with_names=False):
+    """Write one VCALENDAR with the events of grid `rows` to a text stream opened with newline=''"""
+    context = _context
+    grid, events, days = context['grid'], context['events'], context['days']
+    matrix, employees = grid['matrix'], grid['employees']
+    stamp = context['stamp']
+    stream.write('BEGIN:VCALENDAR\r\nVERSION:2.0\r\n' + fold(f'PRODID:{PRODID}')
+                 + 'CALSCALE:GREGORIAN\r\nMETHOD:PUBLISH\r\n' + fold(f'X-WR-CALNAME:{escape(title)}'))
+    if context['timezone']:
+        stream.write(fold(f"X-WR-TIMEZONE:{context['timezone']}"))
+    for row in rows:
+        emp = employees[row]
+        uid = f"{escape(emp['id'])}@{UID_DOMAIN}\r\n"
+        prefix = f"{emp.get('name') or emp['id']}: " if with_names else ''
+        # Folded SUMMARY/DESCRIPTION lines of each code for this employee
+        texts = {}
+        for column, number in enumerate(matrix[row].tolist()):
+            event = events[number]
+            if event is None:
+                continue
+            if number not in texts:
+                summary, description = event[0], event[1]
+                texts[number] = fold(f'SUMMARY:{escape(prefix + summary)}') \
+                    + (fold(f'DESCRIPTION:{escape(description)}') if description else '')
+            ordinal = days[column]
+            day = _day(ordinal)
+            start, end = event[2], event[3]
+            if start is None:
+                when = f'DTSTART;VALUE=DATE:{day}\r\nDTEND;VALUE=DATE:{_day(ordinal + 1)}\r\nTRANSP:TRANSPARENT\r\n'
+            else:
+                when = (f'DTSTART:{day}T{start // 60:02d}{start % 60:02d}00\r\n'
+                        f'DTEND:{_day(ordinal + end // 1440)}T{end % 1440 // 60:02d}{end % 60:02d}00\r\n')
+            stream.write(f'BEGIN:VEVENT\r\nUID:{day}-{uid}DTSTAMP:{stamp}\r\n{when}{texts[number]}END:VEVENT\r\n')
+    stream.write('END:VCALENDAR\r\n')
+
+def _write_feeds(output_dir, jobs):
+    """Write [(feed name, title, rows, with_names)] atomically; returns how many"""
+    for name, title, rows, with_names in jobs:
+        path = os.path.join(output_dir, name)
+        tmp = f'{path}.{os.getpid()}.tmp'
+        with open(tmp, 'w', encoding='utf-8', newline='') as f:
+            write_feed(f, title, rows, with_names)
+        os.replace(tmp, path)
+    return len(jobs)
+
+def build_feeds(grid, output_dir, definitions=DEFAULT_SHIFT_DEFINITIONS, year=None, timezone=None, jobs=None,
+                full=False):
+    """Write the feeds whose rows changed and the manifest: (written, unchanged, removed)"""
+    events = code_events(grid, definitions)
+    digests = feed_digests(grid, events, timezone, year)
+    manifest = read_manifest(output_dir)
+    for kind in ('employees', 'teams'):
+        os.makedirs(os.path.join(output_dir, kind), exist_ok=True)
+
+    members = {}
+    for row, emp in enumerate(grid['employees']):
+        if emp.get('id'):
+            members.setdefault(grid['teams'][grid['team_index'][row]], []).append(row)
+    feeds = [(feed_name('employees', grid['employees'][row]['id']),
+              _('{name} – Roster').format(name=grid['employees'][row].get('name') or grid['employees'][row]['id']),
+              [row], False)
+             for rows in members.values() for row in rows]
+    feeds += [(feed_name('teams', team), _('{team} Team Roster').format(team=team), rows, True)
+              for team, rows in members.items()]
+    stale = [feed for feed in feeds
+             if full or manifest['feeds'].get(feed[0]) != digests[feed[0]]
+             or not os.path.exists(os.path.join(output_dir, feed[0]))]
+
+    if stale:
+        context = {
+            'grid': {key: grid[key] for key in ('matrix', 'employees')},
+            'events': events,
+            'days': [int(day) for day in grid_days(grid, year)],
+            'timezone': timezone,
+            'stamp': time.strftime('%Y%m%dT%H%M%SZ', time.gmtime()),
+        }
+        chunks = [stale[idx:idx + CHUNK] for idx in range(0, len(stale), CHUNK)]
+        workers = min(jobs or os.cpu_count() or 1, len(chunks))
+        if workers <= 1:
+            _init_worker(context)
+            for chunk in chunks:
+                _write_feeds(output_dir, chunk)
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(context,)) as pool:
+                list(pool.map(_write_feeds, [output_dir] * len(chunks), chunks))
+
+    removed = [name for name in manifest['feeds'] if name not in digests]
+    for name in removed:
+        try:
+            os.remove(os.path.join(output_dir, name))
+        except OSError:
+            pass
+    path = os.path.join(output_dir, MANIFEST)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({'v': FEEDS_VERSION, 'feeds': digests}, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp, path)
+    return len(stale), len(feeds) - len(stale), len(removed)
+
+if __name__ == '__main__':
+    from i18n import available_locales, set_locale
+
+    parser = argparse.ArgumentParser(description='Write iCalendar feeds of every employee and team schedule')
+    parser.add_argument('csv', nargs='*', help='Roster sheet exports, oldest first (e.g. one per month)')
+    parser.add_argument('--tenant', help="Use a tenant's current roster and shift definitions")
+    parser.add_argument('--data-dir', default=DATA_DIR, help='Application data directory (default: data)')
+    parser.add_argument('--output', '-o', help='Feeds directory (default: data/tenants/<id>/calendars)')
+    parser.add_argument('--year', type=int, help='Year of the first date column (default: the roster ends at most a few months from now)')
+    parser.add_argument('--timezone', help='IANA time zone of the shift times, e.g. Asia/Dhaka (default: the subscriber\'s own)')
+    parser.add_argument('--locale', choices=available_locales(), help='Write event names in this language')
+    parser.add_argument('--jobs', '-j', type=int, help='Worker processes (default: one per core)')
+    parser.add_argument('--full', action='store_true', help='Rewrite every feed')
+    args = parser.parse_args()
+
+    if args.locale:
+        set_locale(args.locale)
+    if args.tenant:
+        tenant = load_tenant(args.tenant, args.data_dir)
+        grid, definitions = roster_grid(tenant['roster']), tenant['shift_definitions']
+        output = args.output or os.path.join(get_tenant_data_dir(args.tenant, args.data_dir), 'calendars')
+    elif args.csv and args.output:
+        # Months parsed by an earlier run come from the ingest cache, which this only adds to
+        from roster_ingest import load_months, parse_source
+        grid = combine_grids(load_months([parse_source(path) for path in args.csv]), args.year)
+        definitions, output = DEFAULT_SHIFT_DEFINITIONS, args.output
+    else:
+        parser.error('give --tenant, or roster CSV files and --output')
+
+    started = time.perf_counter()
+    written, unchanged, removed = build_feeds(grid, output, definitions, args.year, args.timezone, args.jobs, args.full)
+    print(f"📅 {output}: {written} feeds written, {unchanged} unchanged, {removed} removed "
+          f"in {time.perf_counter() - started:.1f}s")
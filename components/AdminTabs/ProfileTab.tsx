@@ -1,6 +1,6 @@
 "use client";
 import { useState, useEffect } from 'react';
-import { Lock, Save } from 'lucide-react';
+import { Lock, Save, Download } from 'lucide-react';
 
 interface Props { 
   id: string;
@@ -14,6 +14,8 @@ export default function ProfileTab({ id, currentUser }: Props) {
   const [confirmPassword, setConfirmPassword] = useState('');
   const [loading, setLoading] = useState(false);
   const [userDetails, setUserDetails] = useState<any>(null);
+  const [manualLocale, setManualLocale] = useState('en');
+  const [downloadingManual, setDownloadingManual] = useState(false);
 
   async function loadProfile() {
     const res = await fetch('/api/admin/users/list').then(r => r.json());
@@ -101,6 +103,29 @@ export default function ProfileTab({ id, currentUser }: Props) {
     }
   }
 
+  async function downloadManual() {
+    setDownloadingManual(true);
+    try {
+      const res = await fetch(`/api/admin/download-manual?locale=${manualLocale}`);
+      if (res.ok) {
+        const blob = await res.blob();
+        const url = window.URL.createObjectURL(blob);
+        const a = document.createElement('a');
+        a.href = url;
+        a.download = res.headers.get('Content-Disposition')?.split('filename=')[1]?.replace(/"/g, '') || 'user-manual.docx';
+        document.body.appendChild(a);
+        a.click();
+        a.remove();
+        window.URL.revokeObjectURL(url);
+      } else {
+        const err = await res.json().catch(() => ({}));
+        alert(err.error || 'Failed to download manual');
+      }
+    } finally {
+      setDownloadingManual(false);
+    }
+  }
+
   useEffect(() => { loadProfile(); }, []);
 
   return (
@@ -186,6 +211,25 @@ export default function ProfileTab({ id, currentUser }: Props) {
           </button>
         </div>
       </div>
+
+      <div className="section-card">
+        <h3>User Manual</h3>
+        <p>Download the user manual with your organization's teams, shift codes and roster.</p>
+        <div className="form-grid two">
+          <div>
+            <label>Language</label>
+            <select value={manualLocale} onChange={e => setManualLocale(e.target.value)}>
+              <option value="en">English</option>
+              <option value="bn">বাংলা (Bengali)</option>
+            </select>
+          </div>
+        </div>
+        <div className="actions-row">
+          <button className="btn primary" onClick={downloadManual} disabled={downloadingManual}>
+            {downloadingManual ? 'Preparing...' : <><Download size={16} style={{display:'inline', marginRight:6}} />Download Manual</>}
+          </button>
+        </div>
+      </div>
     </div>
   );
 }
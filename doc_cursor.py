@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Document Cursor for the Cartup CxP Roster Management System manual.
+python-docx finds the body's closing sectPr by scanning every block on each
+add_paragraph(), resolves style names through the styles part on every styled paragraph,
+scans every id in the document to number each picture and builds a list of every
+paragraph for doc.paragraphs[-1], so building the manual gets slower as it grows.
+DocCursor appends to the end of a Document with the same add_* methods, but inserts
+before a remembered sectPr, resolves each style name once, numbers pictures from a counter
+and keeps a handle to the last paragraph it added, so building a document is linear in its
+content. Everything else is passed through to the wrapped Document.
+
+    doc = DocCursor(Document())
+    doc.add_heading('Steps', 2)
+    doc.add_list(['Open the app', 'Log in'], style='List Number')
+    doc.add_list([('Refresh', 'reloads your roster')])    # bold "Refresh: " then the text
+"""
+
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_BREAK
+from docx.oxml.parser import OxmlElement
+from docx.oxml.shape import CT_Inline
+from docx.oxml.table import CT_Tbl
+from docx.shared import Emu, Inches
+from docx.shape import InlineShape
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+class DocCursor:
+    """Constant-time appends to the end of a python-docx Document"""
+
+    def __init__(self, document):
+        self.document = document
+        self.last_paragraph = None
+        self._body = document._body
+        self._element = document.element.body
+        self._sect_pr = self._element.sectPr
+        self._style_ids = {}
+        self._block_width = None
+        self._next_shape_id = None
+        self._blocks = None
+
+    def __getattr__(self, name):
+        return getattr(self.document, name)
+
+    def _append(self, element):
+        if self._sect_pr is not None and self._sect_pr.getparent() is self._element:
+            self._sect_pr.addprevious(element)
+        else:
+            self._sect_pr = self._element.sectPr
+            if self._sect_pr is not None:
+                self._sect_pr.addprevious(element)
+            else:
+                self._element.append(element)
+        if self._blocks is not None:
+            self._blocks += 1
+        return element
+
+    def next_shape_id(self):
+        """Unused drawing id; python-docx scans the whole document for one on every picture"""
+        # Blocks added behind the cursor's back (merged chapters) may carry ids of their own
+        if self._next_shape_id is None or self._blocks != len(self._element):
+            self._next_shape_id = self.document.part.next_id
+            self._blocks = len(self._element)
+        shape_id = self._next_shape_id
+        self._next_shape_id += 1
+        return shape_id
+
+    def style_id(self, style, style_type=WD_STYLE_TYPE.PARAGRAPH):
+        """Style ID of a style name (None for the default style), resolved once per name"""
+        if not isinstance(style, str):
+            return self.document.part.get_style_id(style, style_type)
+        key = (style, style_type)
+        if key not in self._style_ids:
+            self._style_ids[key] = self.document.part.get_style_id(style, style_type)
+        return self._style_ids[key]
+
+    def add_paragraph(self, text='', style=None):
+        """New paragraph at the end of the document"""
+        p = self._append(OxmlElement('w:p'))
+        if style is not None:
+            p.style = self.style_id(style)
+        paragraph = Paragraph(p, self._body)
+        if text:
+            paragraph.add_run(text)
+        self.last_paragraph = paragraph
+        return paragraph
+
+    def add_heading(self, text='', level=1):
+        """Heading paragraph, "Title" style for level 0 like Document.add_heading()"""
+        if not 0 <= level <= 9:
+            raise ValueError(f'level must be in range 0-9, got {level}')
+        return self.add_paragraph(text, 'Title' if level == 0 else f'Heading {level}')
+
+    def add_list(self, items, style='List Bullet'):
+        """One paragraph per item, all in `style`; a (label, text) item starts with a bold "label: " """
+        paragraphs = []
+        for item in items:
+            if isinstance(item, tuple):
+                label, text = item
+                paragraph = self.add_paragraph(style=style)
+                paragraph.add_run(f'{label}: ').bold = True
+                paragraph.add_run(text)
+            else:
+                paragraph = self.add_paragraph(item, style)
+            paragraphs.append(paragraph)
+        return paragraphs
+
+    def add_page_break(self):
+        """Paragraph holding only a page break"""
+        paragraph = self.add_paragraph()
+        paragraph.add_run().add_break(WD_BREAK.PAGE)
+        return paragraph
+
+    def add_picture(self, image_path_or_stream, width=None, height=None):
+        """Picture in its own paragraph (see last_paragraph); returns the inline shape"""
+        run = self.add_paragraph().add_run()
+        rId, image = self.document.part.get_or_add_image(image_path_or_stream)
+        cx, cy = image.scaled_dimensions(width, height)
+        inline = CT_Inline.new_pic_inline(self.next_shape_id(), rId, image.filename, cx, cy)
+        run._r.add_drawing(inline)
+        return InlineShape(inline)
+
+    def add_table(self, rows, cols, style=None):
+        """Table spanning the text width"""
+        if self._block_width is None:
+            section = self.document.sections[-1]
+            self._block_width = Emu((section.page_width or Inches(8.5)) - (section.left_margin or Inches(1))
+                                    - (section.right_margin or Inches(1)))
+        tbl = self._append(CT_Tbl.new_tbl(rows, cols, self._block_width))
+        table = Table(tbl, self._body)
+        if style is not None:
+            table._tbl.tblStyle_val = self.style_id(style, WD_STYLE_TYPE.TABLE)
+        return table
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Document Body Merging for the Cartup CxP manual generator.
+Appends the body of one python-docx Document (for example a chapter built in a worker
+process) to another, carrying over images, styles and numbering definitions and
+renumbering relationship ids, image part names, drawing ids and bookmark ids so the
+merged package stays valid.
+"""
+
+import copy
+import io
+import weakref
+
+from docx import Document
+from docx.image.image import Image
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml.ns import qn
+from lxml import etree
+
+RELATIONSHIP_ATTRS = (qn('r:embed'), qn('r:link'), qn('r:id'))
+
+# Image parts of each target package by SHA-1. python-docx's get_or_add_image re-hashes
+# every image already in the package for each image it adds, which is quadratic in a
+# screenshot-heavy manual; merges look images up here instead.
+_image_index = weakref.WeakKeyDictionary()
+
+def merge_document(target, source):
+    """Append the body of `source` (a Document or DOCX bytes) to the end of `target`"""
+    if isinstance(source, (bytes, bytearray)):
+        source = Document(io.BytesIO(source))
+
+    elements = [
+        copy.deepcopy(el) for el in source.element.body.iterchildren()
+        if el.tag != qn('w:sectPr')
+    ]
+    if not elements:
+        return
+
+    styles = _merge_styles(target, source, elements)
+    # Copied styles are remapped with the body but stay in styles.xml
+    _merge_numbering(target, source, elements + styles)
+    _merge_relationships(target, source, elements)
+    _renumber_ids(target, elements)
+
+    body = target.element.body
+    sect_pr = body.find(qn('w:sectPr'))
+    for el in elements:
+        if sect_pr is not None:
+            sect_pr.addprevious(el)
+        else:
+            body.append(el)
+
+def _xpath_all(elements, query):
+    """Run an xpath query over several elements and concatenate the results"""
+    results = []
+    for el in elements:
+        results.extend(el.xpath(query))
+    return results
+
+def _merge_styles(target, source, elements):
+    """Copy styles used by `elements` that the target does not define yet; returns the copies"""
+    target_styles = target.styles.element
+    source_styles = source.styles.element
+    pending = set(_xpath_all(elements, './/w:pStyle/@w:val | .//w:rStyle/@w:val | .//w:tblStyle/@w:val'))
+    seen = set()
+    copied = []
+    while pending:
+        style_id = pending.pop()
+        if style_id in seen:
+            continue
+        seen.add(style_id)
+        if target_styles.get_by_id(style_id) is not None:
+            continue
+        style = source_styles.get_by_id(style_id)
+        if style is None:
+            continue
+        style = copy.deepcopy(style)
+        target_styles.append(style)
+        copied.append(style)
+        pending.update(style.xpath('./w:basedOn/@w:val | ./w:next/@w:val | ./w:link/@w:val'))
+    return copied
+
+def _merge_numbering(target, source, elements):
+    """Carry over numbering definitions referenced by `elements`, renumbering on conflict"""
+    num_ids = set(_xpath_all(elements, './/w:numPr/w:numId/@w:val'))
+    if not num_ids:
+        return
+    target_numbering = target.part.numbering_part.element
+    source_numbering = source.part.numbering_part.element
+
+    remap = {}
+    for num_id in sorted(num_ids, key=int):
+        src_num = _find(source_numbering, 'w:num', 'w:numId', num_id)
+        if src_num is None:
+            continue
+        abstract_id = src_num.find(qn('w:abstractNumId')).get(qn('w:val'))
+        src_abstract = _find(source_numbering, 'w:abstractNum', 'w:abstractNumId', abstract_id)
+
+        tgt_num = _find(target_numbering, 'w:num', 'w:numId', num_id)
+        if tgt_num is not None and _same(tgt_num, src_num):
+            tgt_abstract = _find(target_numbering, 'w:abstractNum', 'w:abstractNumId', abstract_id)
+            if tgt_abstract is not None and _same(tgt_abstract, src_abstract):
+                continue
+
+        new_abstract_id = str(_next_id(target_numbering, 'w:abstractNum', 'w:abstractNumId'))
+        new_num_id = str(_next_id(target_numbering, 'w:num', 'w:numId'))
+        if src_abstract is not None:
+            new_abstract = copy.deepcopy(src_abstract)
+            new_abstract.set(qn('w:abstractNumId'), new_abstract_id)
+            # abstractNum definitions must precede every num element
+            first_num = target_numbering.find(qn('w:num'))
+            if first_num is not None:
+                first_num.addprevious(new_abstract)
+            else:
+                target_numbering.append(new_abstract)
+        new_num = copy.deepcopy(src_num)
+        new_num.set(qn('w:numId'), new_num_id)
+        new_num.find(qn('w:abstractNumId')).set(qn('w:val'), new_abstract_id)
+        target_numbering.append(new_num)
+        remap[num_id] = new_num_id
+
+    if remap:
+        for node in _xpath_all(elements, './/w:numPr/w:numId'):
+            val = node.get(qn('w:val'))
+            if val in remap:
+                node.set(qn('w:val'), remap[val])
+
+def _merge_relationships(target, source, elements):
+    """Re-create every relationship `elements` point at in the target part"""
+    remap = {}
+    for el in elements:
+        for node in el.iter():
+            for attr in RELATIONSHIP_ATTRS:
+                r_id = node.get(attr)
+                if r_id is None:
+                    continue
+                if r_id not in remap:
+                    remap[r_id] = _copy_relationship(target, source, r_id)
+                node.set(attr, remap[r_id])
+
+def _copy_relationship(target, source, r_id):
+    """Relate the target part to whatever `r_id` points at in the source and return the new rId"""
+    rel = source.part.rels[r_id]
+    if rel.is_external:
+        return target.part.relate_to(rel.target_ref, rel.reltype, is_external=True)
+    if rel.reltype == RT.IMAGE:
+        return target.part.relate_to(_image_part(target, rel.target_part.blob), RT.IMAGE)
+    raise ValueError(f'Cannot merge relationship {r_id} of type {rel.reltype}')
+
+def _image_part(target, blob):
+    """The target's image part holding `blob`, added under the next free
+    /word/media/imageN name unless an identical image is already there"""
+    image_parts = target.part.package.image_parts
+    known, by_sha1 = _image_index.get(image_parts, (0, {}))
+    if known != len(image_parts):
+        # Images were added some other way (e.g. add_picture) since the last merge
+        by_sha1 = {part.sha1: part for part in image_parts}
+    image = Image.from_blob(blob)
+    part = by_sha1.get(image.sha1)
+    if part is None:
+        part = image_parts._add_image_part(image)
+        by_sha1[image.sha1] = part
+    _image_index[image_parts] = (len(image_parts), by_sha1)
+    return part
+
+def _renumber_ids(target, elements):
+    """Give drawings and bookmarks ids that are unique within the target document"""
+    next_id = target.part.next_id
+    for node in _xpath_all(elements, './/wp:docPr'):
+        node.set('id', str(next_id))
+        next_id += 1
+
+    used = target.element.body.xpath('.//w:bookmarkStart/@w:id')
+    next_bookmark = max([int(v) for v in used if v.isdigit()] + [-1]) + 1
+    remap = {}
+    for node in _xpath_all(elements, './/w:bookmarkStart | .//w:bookmarkEnd'):
+        old = node.get(qn('w:id'))
+        if old not in remap:
+            remap[old] = str(next_bookmark)
+            next_bookmark += 1
+        node.set(qn('w:id'), remap[old])
+
+def _find(parent, tag, id_attr, value):
+    """Child `tag` element of `parent` whose `id_attr` equals `value`"""
+    for node in parent.iterchildren(qn(tag)):
+        if node.get(qn(id_attr)) == value:
+            return node
+    return None
+
+def _next_id(parent, tag, id_attr):
+    """One more than the largest `id_attr` used by `tag` children of `parent`"""
+    ids = [int(node.get(qn(id_attr))) for node in parent.iterchildren(qn(tag))]
+    return max(ids + [0]) + 1
+
+def _same(a, b):
+    """True if two elements serialize identically"""
+    return etree.tostring(a) == etree.tostring(b)
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Employee Search Index for the Cartup CxP Roster Management System.
+The client panel's employee search filters the whole employee list on every keystroke.
+This builds an index of the roster for the app to load instead: employee IDs are matched
+by prefix ("88818", "sll-888" and "SLL-88818" all find SLL-88818) and names by trigrams,
+so partial and misspelled names ("tanvin hasn", "jannatul") still match.
+
+Employees are stored in order of their ID without separators, which works as a flattened
+prefix trie: one binary search finds the range of IDs starting with what was typed (a
+second list orders them by ID number). Each name word is split into
+trigrams padded with two spaces in front, so the first letters typed already form
+trigrams; the last query word is treated as a prefix. Posting lists are delta-encoded in
+the JSON, which lib/employeeSearch.ts loads.
+
+    python employee_search.py --tenant <tenant-id>       # -> data/tenants/<id>/employee_index.json
+    python employee_search.py roster.csv -o employee_index.json --query "tanvin hasn"
+"""
+
+import argparse
+import bisect
+import json
+import math
+import os
+import re
+import time
+import unicodedata
+
+import numpy as np
+
+from roster_rules import load_rosters
+from tenant_data import DATA_DIR, active_employees, get_tenant_data_dir, load_tenant
+
+INDEX_VERSION = 1
+INDEX_FILE = 'employee_index.json'
+# Share of a query's trigrams a name must contain to match
+MIN_SCORE = 0.5
+# Queries with this many trigrams or fewer must match all of them
+EXACT_TRIGRAMS = 3
+
+WORD_RE = re.compile(r'[^\W_]+', re.UNICODE)
+
+def normalize_name(text):
+    """Lowercased words of a name without accents: "Jannatúl  Alam" -> ['jannatul', 'alam']"""
+    text = unicodedata.normalize('NFKD', text or '').lower()
+    text = ''.join(char for char in text if not unicodedata.category(char).startswith('M'))
+    return WORD_RE.findall(text)
+
+def id_key(employee_id):
+    """Prefix key of an employee ID: lowercased, without separators ("SLL-88818" -> "sll88818")"""
+    return re.sub(r'[^0-9a-z]', '', (employee_id or '').lower())
+
+def id_number(key):
+    """Trailing number of an ID key, which can be typed on its own ("sll88818" -> "88818")"""
+    match = re.search(r'\d+$', key)
+    return match.group() if match else ''
+
+def trigrams(words, prefix=False):
+    """Trigrams of name words, each word padded with two leading spaces and one trailing
+    space; with `prefix` the last word gets no trailing space, as it may be half typed"""
+    grams = []
+    for idx, word in enumerate(words):
+        padded = '  ' + word + ('' if prefix and idx == len(words) - 1 else ' ')
+        grams += [padded[pos:pos + 3] for pos in range(len(padded) - 2)]
+    return list(dict.fromkeys(grams))
+
+def build_index(employees):
+    """Serializable index of [{'id', 'name', 'team'}]"""
+    employees = sorted((emp for emp in employees if id_key(emp.get('id'))), key=lambda emp: id_key(emp['id']))
+    teams = sorted({emp.get('team') or '' for emp in employees})
+    team_number = {team: idx for idx, team in enumerate(teams)}
+    numbers = [id_number(id_key(emp['id'])) for emp in employees]
+    postings = {}
+    for number, emp in enumerate(employees):
+        for gram in trigrams(normalize_name(emp.get('name'))):
+            postings.setdefault(gram, []).append(number)
+    grams = sorted(postings)
+    return {
+        'v': INDEX_VERSION,
+        'teams': teams,
+        # Sorted by ID key, so employees themselves are the ID prefix list
+        'employees': [[emp['id'], emp.get('name') or '', team_number[emp.get('team') or '']] for emp in employees],
+        # Employees in order of their ID number, for searches by number alone
+        'by_number': sorted((idx for idx, number in enumerate(numbers) if number), key=lambda idx: numbers[idx]),
+        'trigrams': grams,
+        'postings': [np.diff(postings[gram], prepend=0).tolist() for gram in grams],
+    }
+
+def write_index(index, path):
+    """Write an index as compact JSON, atomically"""
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp, path)
+
+def load_index(path):
+    """Index written by write_index(), prepared for search()"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return prepare_index(json.load(f))
+
+def prepare_index(index):
+    """Index with the lookup structures search() needs: ID keys, decoded posting lists,
+    a trigram lookup and normalized names"""
+    keys = [id_key(emp[0]) for emp in index['employees']]
+    return dict(
+        index,
+        keys=keys,
+        numbers=[id_number(keys[idx]) for idx in index['by_number']],
+        postings=[np.cumsum(deltas, dtype=np.int32) for deltas in index['postings']],
+        lookup={gram: idx for idx, gram in enumerate(index['trigrams'])},
+        names=[' '.join(normalize_name(emp[1])) for emp in index['employees']],
+    )
+
+def _prefix_range(keys, prefix):
+    """Range of the sorted `keys` starting with `prefix`"""
+    start = bisect.bisect_left(keys, prefix)
+    return range(start, bisect.bisect_left(keys, prefix + '\uffff', start))
+
+def search_ids(index, query, limit=10):
+    """Employee numbers whose ID starts with `query`, or whose ID number does, in ID order"""
+    key = id_key(query)
+    if not key:
+        return []
+    found = list(_prefix_range(index['keys'], key)[:limit])
+    if len(found) < limit and key.isdigit():
+        by_number = index['by_number']
+        found += [by_number[pos] for pos in _prefix_range(index['numbers'], key)[:limit]]
+        found = sorted(set(found))[:limit]
+    return found
+
+def search_names(index, query, limit=10, min_score=MIN_SCORE):
+    """(employee number, score) of names sharing at least `min_score` of the query's
+    trigrams, best first: by score, then names starting with the query, then ID"""
+    words = normalize_name(query)
+    grams = trigrams(words, prefix=True)
+    lists = [index['postings'][index['lookup'][gram]] for gram in grams if gram in index['lookup']]
+    needed = len(grams) if len(grams) <= EXACT_TRIGRAMS else max(1, math.ceil(len(grams) * min_score))
+    if not grams or len(lists) < needed:
+        return []
+    hits = np.bincount(np.concatenate(lists), minlength=len(index['employees']))
+    phrase = ' '.join(words)
+    names = index['names']
+    results = []
+    for count in range(len(lists), needed - 1, -1):
+        leading, others = [], []
+        for number in np.flatnonzero(hits == count).tolist():
+            if names[number].startswith(phrase):
+                leading.append(number)
+                if len(results) + len(leading) >= limit:
+                    break
+            elif len(results) + len(others) < limit:
+                others.append(number)
+        results += [(number, count / len(grams)) for number in leading + others]
+        if len(results) >= limit:
+            break
+    return results[:limit]
+
+def search(index, query, limit=10):
+    """Best matches for what was typed in the search box: [(id, name, team)]"""
+    if re.search(r'\d', query):
+        numbers = search_ids(index, query, limit)
+    else:
+        numbers = [number for number, _ in search_names(index, query, limit)]
+    return [(emp[0], emp[1], index['teams'][emp[2]]) for emp in (index['employees'][number] for number in numbers)]
+
+def roster_employees(roster):
+    """{'id', 'name', 'team'} of a roster's active employees"""
+    return [{'id': emp.get('id'), 'name': (emp.get('name') or '').strip(),
+             'team': emp.get('currentTeam') or emp.get('team') or ''}
+            for emp in active_employees(roster['allEmployees'])]
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build the employee search index')
+    parser.add_argument('csv', nargs='*', help='Roster sheet exports (merged in order)')
+    parser.add_argument('--tenant', help="Index a tenant's current roster")
+    parser.add_argument('--data-dir', default=DATA_DIR, help='Application data directory (default: data)')
+    parser.add_argument('--output', '-o', help=f'Index file (default: data/tenants/<id>/{INDEX_FILE})')
+    parser.add_argument('--query', '-q', action='append', default=[], help='Search the new index (repeatable)')
+    args = parser.parse_args()
+
+    if args.tenant:
+        roster = load_tenant(args.tenant, args.data_dir)['roster']
+        output = args.output or os.path.join(get_tenant_data_dir(args.tenant, args.data_dir), INDEX_FILE)
+    elif args.csv and args.output:
+        roster, output = load_rosters(args.csv), args.output
+    else:
+        parser.error('give --tenant, or roster CSV files and --output')
+
+    index = build_index(roster_employees(roster))
+    write_index(index, output)
+    print(f"🔎 {output}: {len(index['employees'])} employees, {len(index['trigrams'])} trigrams, "
+          f"{os.path.getsize(output) / 1024:.0f} KB")
+    if args.query:
+        index = load_index(output)
+        for query in args.query:
+            started = time.perf_counter()
+            results = search(index, query)
+            elapsed = (time.perf_counter() - started) * 1e6
+            print(f"\n\"{query}\": {len(results)} results in {elapsed:.0f} µs")
+            for emp_id, name, team in results:
+                print(f"  {emp_id:<12} {name} ({team})")
@@ -9,18 +9,59 @@ from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.style import WD_STYLE_TYPE
 import os
+import io
 import glob
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 
-def add_screenshot(doc, image_path, caption=''):
-    """Add a screenshot image to the document with optional caption"""
+from docx_merge import merge_document
+from package_writer import save_document, DEFAULT_XML_LEVEL
+from manual_content import load_content, is_payload_literal, spec_digest
+from i18n import _, set_locale, get_locale, available_locales, catalog_path, DEFAULT_LOCALE
+from artifact_store import fingerprint
+from search_index import SearchIndexBuilder
+from html_manual import render_html
+from screenshot_annotations import annotated_screenshot, prerender
+from doc_cursor import DocCursor
+from roster import roster_grid
+from roster_analytics import employee_workload, team_workload
+
+from tenant_data import (
+    DATA_DIR, load_tenant, tenant_fingerprint, files_fingerprint, shift_code_rows, admin_user_rows, example_employee_id,
+    team_rows, roster_summary,
+)
+
+# Screenshot bytes keyed by path: (mtime_ns, size, data), so long-lived processes
+# (the manual server) read each screenshot from disk only once
+_screenshots = {}
+
+def read_screenshot(full_path):
+    """Bytes of a screenshot, reused while the file is unchanged"""
+    st = os.stat(full_path)
+    cached = _screenshots.get(full_path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    with open(full_path, 'rb') as f:
+        data = f.read()
+    _screenshots[full_path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+def add_screenshot(doc, image_path, caption='', annotations=None):
+    """Add a screenshot image to the document with optional caption and annotations
+    (arrows, boxes and callouts, see screenshot_annotations.py)"""
     full_path = os.path.join(os.getcwd(), image_path)
     if os.path.exists(full_path):
         try:
+            blob = read_screenshot(full_path)
+            if annotations:
+                blob = annotated_screenshot(blob, annotations)
             # Add the image with a reasonable width (6 inches)
-            doc.add_picture(full_path, width=Inches(6.0))
+            shape = doc.add_picture(io.BytesIO(blob), width=Inches(6.0))
+            # Record the source path and caption so reports can trace the image and the HTML has alt text
+            shape._inline.docPr.set('name', image_path)
+            shape._inline.docPr.set('descr', caption)
             # Center the image
-            last_paragraph = doc.paragraphs[-1]
-            last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            doc.last_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
             
             # Add caption if provided
             if caption:
@@ -32,312 +73,243 @@ def add_screenshot(doc, image_path, caption=''):
             
             doc.add_paragraph()  # Add spacing after image
         except Exception as e:
-            doc.add_paragraph(f'📸 Screenshot: {image_path} (Image could not be loaded: {e})')
+            doc.add_paragraph(_('📸 Screenshot: {path} (Image could not be loaded: {error})').format(path=image_path, error=e))
     else:
-        doc.add_paragraph(f'📸 Screenshot: {image_path} (Image file not found)')
+        doc.add_paragraph(_('📸 Screenshot: {path} (Image file not found)').format(path=image_path))
 
-def create_manual():
-    """Create the comprehensive user manual document"""
-    doc = Document()
+def create_manual(tenant_id=None, data_dir=DATA_DIR, output='USER_MANUAL.docx', jobs=None, search_index=True,
+                  html_dir=None, locale=None, assets_dir=None, xml_level=DEFAULT_XML_LEVEL):
+    """Create the comprehensive user manual document, optionally from a tenant's live data"""
+    if locale:
+        set_locale(locale)
+    index = SearchIndexBuilder() if search_index else None
+    doc = build_manual(tenant_id, data_dir, jobs, index)
+    
+    # Save document (screenshots stored as-is, XML parts deflated in parallel)
+    save_document(doc, output, xml_level)
+    print(f"✅ User manual generated successfully: {output}")
+    
+    if index:
+        index_path = os.path.splitext(output)[0] + '.search.json'
+        index.write(index_path)
+        print(f"🔎 Search index generated: {index_path}")
+    
+    if html_dir:
+        pages = render_html(doc, html_dir, get_locale(), assets_dir=assets_dir)
+        print(f"🌐 HTML help generated: {len(pages)} pages in {html_dir}")
+
+def build_manual(tenant_id=None, data_dir=DATA_DIR, jobs=None, index=None, fragments=None):
+    """Build the manual in the active locale and return the Document without saving it.
+
+    `fragments` is an optional dict of already built chapters (see add_chapters).
+    """
+    tenant = load_tenant(tenant_id, data_dir) if tenant_id else None
+    # Draw new or changed screenshot annotations in one parallel batch up front
+    prerender(jobs)
+    doc = DocCursor(Document())
     
     # Set document properties
-    doc.core_properties.title = "Cartup CxP Roster Management System - User Manual"
-    doc.core_properties.author = "Cartup CxP Team"
+    doc.core_properties.title = _("Cartup CxP Roster Management System - User Manual")
+    doc.core_properties.author = _("Cartup CxP Team")
     
     # Title Page
-    title = doc.add_heading('Cartup CxP Roster Management System', 0)
+    title = doc.add_heading(_('Cartup CxP Roster Management System'), 0)
     title.alignment = WD_ALIGN_PARAGRAPH.CENTER
     
-    subtitle = doc.add_paragraph('Complete User Manual')
+    subtitle = doc.add_paragraph(_('Complete User Manual'))
     subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
     subtitle.runs[0].font.size = Pt(18)
     
-    version = doc.add_paragraph('Version 1.0')
+    version = doc.add_paragraph(_('Version 1.0'))
     version.alignment = WD_ALIGN_PARAGRAPH.CENTER
     
+    if tenant:
+        org = doc.add_paragraph(_('Prepared for {organization}').format(organization=tenant['name']))
+        org.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    
     doc.add_page_break()
     
     # Table of Contents
-    doc.add_heading('Table of Contents', 1)
-    toc_items = [
-        ("1.", "Introduction", "4"),
-        ("  1.1", "About This Manual", "4"),
-        ("  1.2", "System Overview", "4"),
-        ("  1.3", "Key Features", "5"),
-        ("2.", "Client Panel User Guide", "6"),
-        ("  2.1", "Logging In", "6"),
-        ("  2.2", "Dashboard Overview", "7"),
-        ("  2.3", "Refresh Function", "8"),
-        ("  2.4", "Theme Customization", "9"),
-        ("  2.5", "Calendar Feature", "10"),
-        ("  2.6", "Requesting Shift Changes", "12"),
-        ("  2.7", "Requesting Shift Swaps", "15"),
-        ("  2.8", "Shift View", "18"),
-        ("  2.9", "Employee Search", "20"),
-        ("  2.10", "Statistics Cards", "22"),
-        ("3.", "Admin Panel User Guide", "25"),
-        ("  3.1", "Admin Login", "25"),
-        ("  3.2", "Dashboard Tab", "26"),
-        ("  3.3", "Schedule Requests Tab", "30"),
-        ("  3.4", "Data Sync Tab", "33"),
-        ("  3.5", "Google Sheets Tab", "35"),
-        ("  3.6", "Roster Data Tab", "37"),
-        ("  3.7", "CSV Import/Export Tab", "40"),
-        ("  3.8", "My Profile Tab", "43"),
-        ("  3.9", "Team Management Tab", "45"),
-        ("  3.10", "User Management Tab", "48"),
-        ("4.", "API Documentation", "51"),
-        ("  4.1", "Authentication APIs", "51"),
-        ("  4.2", "Schedule APIs", "53"),
-        ("  4.3", "Request APIs", "56"),
-        ("  4.4", "Admin APIs", "59"),
-        ("  4.5", "Data Sync APIs", "62"),
-        ("5.", "Frequently Asked Questions (FAQ)", "65"),
-        ("  5.1", "General Questions", "65"),
-        ("  5.2", "Client Panel Questions", "67"),
-        ("  5.3", "Admin Panel Questions", "69"),
-        ("  5.4", "Troubleshooting", "71"),
-        ("6.", "Appendices", "73"),
-        ("  6.1", "Shift Codes Reference", "73"),
-        ("  6.2", "Quick Reference Guide", "74"),
-    ]
+    doc.add_heading(_('Table of Contents'), 1)
+    content = load_content()
+    toc_items = content['toc']['items'] + (content['toc']['tenant_items'] if tenant else [])
     
     table = doc.add_table(rows=len(toc_items), cols=3)
     table.style = 'Light Grid Accent 1'
     
-    for idx, (num, title, page) in enumerate(toc_items):
+    for idx, item in enumerate(toc_items):
         row = table.rows[idx]
-        row.cells[0].text = num
-        row.cells[1].text = title
-        row.cells[2].text = page
+        # Sections are indented under their chapter: "1." then "  1.1"
+        row.cells[0].text = '  ' * item['number'].rstrip('.').count('.') + item['number']
+        row.cells[1].text = _(item['title'])
+        row.cells[2].text = item['page']
     
     doc.add_page_break()
     
     # CHAPTER 1: Introduction
-    doc.add_heading('1. Introduction', 1)
+    chapter_start = body_position(doc)
+    doc.add_heading(_('1. Introduction'), 1)
     
-    doc.add_heading('1.1 About This Manual', 2)
+    doc.add_heading(_('1.1 About This Manual'), 2)
     doc.add_paragraph(
-        'This comprehensive manual provides step-by-step instructions for using the Cartup CxP '
+        _('This comprehensive manual provides step-by-step instructions for using the Cartup CxP '
         'Roster Management System. Whether you are an employee accessing your schedule or an '
         'administrator managing team rosters, this guide will help you understand and utilize '
-        'all features of the system effectively.'
+        'all features of the system effectively.')
     )
     
-    doc.add_heading('1.2 System Overview', 2)
+    doc.add_heading(_('1.2 System Overview'), 2)
     doc.add_paragraph(
-        'The Cartup CxP Roster Management System is a modern web-based application designed to '
+        _('The Cartup CxP Roster Management System is a modern web-based application designed to '
         'streamline shift scheduling, request management, and team coordination. The system '
-        'consists of two main components:'
+        'consists of two main components:')
     )
     
-    features = [
-        ('Client Panel', 'For employees to view schedules, request changes, and manage their shifts'),
-        ('Admin Panel', 'For administrators to manage rosters, approve requests, and oversee operations'),
-    ]
+    doc.add_list([(_(panel['name']), _(panel['description'])) for panel in content['features']['panels']])
     
-    for feature, desc in features:
-        p = doc.add_paragraph(style='List Bullet')
-        p.add_run(f'{feature}: ').bold = True
-        p.add_run(desc)
-    
-    doc.add_heading('1.3 Key Features', 2)
-    
-    client_features = [
-        'Real-time schedule viewing',
-        'Interactive calendar for date selection',
-        'Shift change request submission',
-        'Shift swap requests with team members',
-        'Employee search functionality',
-        'Personal statistics and upcoming shifts',
-        'Multiple theme options for personalization',
-        'Mobile-responsive design',
-    ]
+    doc.add_heading(_('1.3 Key Features'), 2)
     
-    admin_features = [
-        'Comprehensive dashboard with analytics',
-        'Request approval/rejection workflow',
-        'Team and employee management',
-        'Google Sheets integration',
-        'CSV import/export capabilities',
-        'User management with role-based access',
-        'Activity logging and audit trails',
-        'Shift modification tracking',
-    ]
-    
-    doc.add_paragraph('Client Panel Features:').bold = True
-    for feature in client_features:
-        doc.add_paragraph(f'• {feature}', style='List Bullet 2')
+    doc.add_paragraph(_('Client Panel Features:')).bold = True
+    doc.add_list([f'• {_(feature)}' for feature in content['features']['client']], style='List Bullet 2')
     
-    doc.add_paragraph('Admin Panel Features:').bold = True
-    for feature in admin_features:
-        doc.add_paragraph(f'• {feature}', style='List Bullet 2')
+    doc.add_paragraph(_('Admin Panel Features:')).bold = True
+    doc.add_list([f'• {_(feature)}' for feature in content['features']['admin']], style='List Bullet 2')
     
     doc.add_page_break()
     
-    # CHAPTER 2: Client Panel
-    doc.add_heading('2. Client Panel User Guide', 1)
-    
-    add_client_panel_sections(doc)
+    if index:
+        index.add_document(doc, chapter_start)
     
-    # CHAPTER 3: Admin Panel
-    doc.add_heading('3. Admin Panel User Guide', 1)
-    
-    add_admin_panel_sections(doc)
-    
-    # CHAPTER 4: API Documentation
-    doc.add_heading('4. API Documentation', 1)
-    
-    add_api_documentation(doc)
-    
-    # CHAPTER 5: FAQ
-    doc.add_heading('5. Frequently Asked Questions (FAQ)', 1)
-    
-    add_faq_section(doc)
-    
-    # CHAPTER 6: Appendices
-    doc.add_heading('6. Appendices', 1)
-    
-    add_appendices(doc)
-    
-    # Save document
-    doc.save('USER_MANUAL.docx')
-    print("✅ User manual generated successfully: USER_MANUAL.docx")
+    # CHAPTERS 2-6: Client Panel, Admin Panel, API Documentation, FAQ, Appendices
+    add_chapters(doc, tenant, tenant_id, data_dir, jobs, index, fragments)
+    return doc.document
 
-def add_client_panel_sections(doc):
+def add_client_panel_sections(doc, tenant=None):
     """Add detailed client panel documentation"""
     
     # 2.1 Logging In
-    doc.add_heading('2.1 Logging In to the Client Panel', 2)
+    doc.add_heading(_('2.1 Logging In to the Client Panel'), 2)
     doc.add_paragraph(
-        'To access your schedule and manage your shifts, you need to log in to the Client Panel.'
+        _('To access your schedule and manage your shifts, you need to log in to the Client Panel.')
     )
     
-    doc.add_paragraph('Steps:').bold = True
+    doc.add_paragraph(_('Steps:')).bold = True
     steps = [
-        'Navigate to the application URL (http://localhost:3000 or your organization URL)',
-        'Enter your Full Name in the first field',
-        'Enter your Employee ID in the format SLL-XXXXX',
-        'The team password is pre-filled as "cartup123"',
-        'Click the "🔓 Access Roster" button',
-        'You will be redirected to your personal dashboard',
+        _('Navigate to the application URL (http://localhost:3000 or your organization URL)'),
+        _('Enter your Full Name in the first field'),
+        _('Enter your Employee ID in the format SLL-XXXXX'),
+        _('The team password is pre-filled as "cartup123"'),
+        _('Click the "🔓 Access Roster" button'),
+        _('You will be redirected to your personal dashboard'),
     ]
-    for step in steps:
-        doc.add_paragraph(step, style='List Number')
+    doc.add_list(steps, style='List Number')
     
     # Add screenshot
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/01_client_login_page.png', 'Client Login Page')
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/01_client_login_page.png', _('Client Login Page'))
     
     doc.add_paragraph()
     p = doc.add_paragraph()
-    p.add_run('Note: ').bold = True
-    p.add_run('The Employee ID is case-sensitive. Make sure to enter it exactly as provided.')
+    p.add_run(_('Note: ')).bold = True
+    p.add_run(_('The Employee ID is case-sensitive. Make sure to enter it exactly as provided.'))
     
     # 2.2 Dashboard Overview
-    doc.add_heading('2.2 Dashboard Overview', 2)
+    doc.add_heading(_('2.2 Dashboard Overview'), 2)
     doc.add_paragraph(
-        'Once logged in, you will see your personalized dashboard displaying:'
+        _('Once logged in, you will see your personalized dashboard displaying:')
     )
     
     dashboard_elements = [
-        ('Welcome Header', 'Shows your name and Employee ID'),
-        ('Action Buttons', 'Logout, Refresh, and Theme buttons'),
-        ('Current Shift Information', 'Today and tomorrow shift details'),
-        ('Selected Date Shift', 'Shows shift for any selected calendar date'),
-        ('Action Buttons Row', 'Request Shift Change, Request Swap, and Shift View buttons'),
-        ('Employee Search', 'Search bar to find and view other employees\' schedules'),
-        ('Statistics Cards', 'Upcoming Days, Planned Time Off, and Shift Changes'),
+        (_('Welcome Header'), _('Shows your name and Employee ID')),
+        (_('Action Buttons'), _('Logout, Refresh, and Theme buttons')),
+        (_('Current Shift Information'), _('Today and tomorrow shift details')),
+        (_('Selected Date Shift'), _('Shows shift for any selected calendar date')),
+        (_('Action Buttons Row'), _('Request Shift Change, Request Swap, and Shift View buttons')),
+        (_('Employee Search'), _('Search bar to find and view other employees\' schedules')),
+        (_('Statistics Cards'), _('Upcoming Days, Planned Time Off, and Shift Changes')),
     ]
     
-    for element, description in dashboard_elements:
-        p = doc.add_paragraph(style='List Bullet')
-        p.add_run(f'{element}: ').bold = True
-        p.add_run(description)
+    doc.add_list(dashboard_elements)
     
     # Add screenshot
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/02_client_dashboard_main.png', 'Client Dashboard Overview')
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/02_client_dashboard_main.png', _('Client Dashboard Overview'))
     
     # 2.3 Refresh Function
-    doc.add_heading('2.3 Refresh Function', 2)
+    doc.add_heading(_('2.3 Refresh Function'), 2)
     doc.add_paragraph(
-        'The Refresh button allows you to reload your schedule data to see the most up-to-date '
-        'information including any recently approved shift changes.'
+        _('The Refresh button allows you to reload your schedule data to see the most up-to-date '
+        'information including any recently approved shift changes.')
     )
     
-    doc.add_paragraph('How to use:').bold = True
+    doc.add_paragraph(_('How to use:')).bold = True
     refresh_steps = [
-        'Locate the "🔄 Refresh" button in the top action bar',
-        'Click the button',
-        'The system will reload all schedule data',
-        'The button will show "Refreshing..." while loading',
-        'Once complete, all information will be updated',
+        _('Locate the "🔄 Refresh" button in the top action bar'),
+        _('Click the button'),
+        _('The system will reload all schedule data'),
+        _('The button will show "Refreshing..." while loading'),
+        _('Once complete, all information will be updated'),
     ]
-    for step in refresh_steps:
-        doc.add_paragraph(step, style='List Number')
+    doc.add_list(refresh_steps, style='List Number')
     
     # Add screenshot
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/03_after_refresh.png', 'Dashboard After Refresh')
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/03_after_refresh.png', _('Dashboard After Refresh'))
     
     # 2.4 Theme Customization
-    doc.add_heading('2.4 Theme Customization', 2)
+    doc.add_heading(_('2.4 Theme Customization'), 2)
     doc.add_paragraph(
-        'The system offers multiple color themes to personalize your experience. You can switch '
-        'between different themes to find one that suits your preference.'
+        _('The system offers multiple color themes to personalize your experience. You can switch '
+        'between different themes to find one that suits your preference.')
     )
     
-    doc.add_paragraph('Available Themes:').bold = True
+    doc.add_paragraph(_('Available Themes:')).bold = True
     themes = [
-        '🌈 Bright Vibrant - Colorful and energetic',
-        '🌅 Bright Sunset - Warm and inviting',
-        '🌊 Medium Ocean - Cool blue tones',
-        '🌍 Medium Earth - Natural earth tones',
-        '🍃 Peaceful Sage - Calming green',
-        '💜 Peaceful Lavender - Soft purple',
-        '🌑 Dark Blue - Professional dark blue',
-        '🌃 Dark Midnight - Deep dark theme',
-        '🕳️ Dark Void - Maximum contrast black',
+        _('🌈 Bright Vibrant - Colorful and energetic'),
+        _('🌅 Bright Sunset - Warm and inviting'),
+        _('🌊 Medium Ocean - Cool blue tones'),
+        _('🌍 Medium Earth - Natural earth tones'),
+        _('🍃 Peaceful Sage - Calming green'),
+        _('💜 Peaceful Lavender - Soft purple'),
+        _('🌑 Dark Blue - Professional dark blue'),
+        _('🌃 Dark Midnight - Deep dark theme'),
+        _('🕳️ Dark Void - Maximum contrast black'),
     ]
-    for theme in themes:
-        doc.add_paragraph(theme, style='List Bullet')
+    doc.add_list(themes)
     
-    doc.add_paragraph('How to change theme:').bold = True
+    doc.add_paragraph(_('How to change theme:')).bold = True
     theme_steps = [
-        'Click the "🎨 Theme" button in the top action bar',
-        'A dropdown menu will appear showing all available themes',
-        'Click on any theme to apply it immediately',
-        'The entire website will update with the new color scheme',
-        'Your selection is saved and will persist across sessions',
+        _('Click the "🎨 Theme" button in the top action bar'),
+        _('A dropdown menu will appear showing all available themes'),
+        _('Click on any theme to apply it immediately'),
+        _('The entire website will update with the new color scheme'),
+        _('Your selection is saved and will persist across sessions'),
     ]
-    for step in theme_steps:
-        doc.add_paragraph(step, style='List Number')
+    doc.add_list(theme_steps, style='List Number')
     
     # Add screenshots
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/04_theme_menu_open.png', 'Theme Menu Dropdown')
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/05_theme_changed_ocean.png', 'Medium Ocean Theme Applied')
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/04_theme_menu_open.png', _('Theme Menu Dropdown'))
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/05_theme_changed_ocean.png', _('Medium Ocean Theme Applied'))
     
     # 2.5 Calendar Feature
-    doc.add_heading('2.5 Calendar Feature', 2)
+    doc.add_heading(_('2.5 Calendar Feature'), 2)
     doc.add_paragraph(
-        'The calendar allows you to view your shift schedule for any date. When you select a date, '
-        'the system displays your assigned shift for that day.'
+        _('The calendar allows you to view your shift schedule for any date. When you select a date, '
+        'the system displays your assigned shift for that day.')
     )
     
-    doc.add_paragraph('How to use the calendar:').bold = True
+    doc.add_paragraph(_('How to use the calendar:')).bold = True
     calendar_steps = [
-        'Click the "📅 Show Calendar" button',
-        'The calendar will expand, showing the current month',
-        'Use the arrow buttons (← →) to navigate between months',
-        'Click on any date to view your shift for that day',
-        'The selected date and shift will appear above the calendar',
-        'Click "📅 Hide Calendar" to collapse the calendar',
+        _('Click the "📅 Show Calendar" button'),
+        _('The calendar will expand, showing the current month'),
+        _('Use the arrow buttons (← →) to navigate between months'),
+        _('Click on any date to view your shift for that day'),
+        _('The selected date and shift will appear above the calendar'),
+        _('Click "📅 Hide Calendar" to collapse the calendar'),
     ]
-    for step in calendar_steps:
-        doc.add_paragraph(step, style='List Number')
+    doc.add_list(calendar_steps, style='List Number')
     
     # Add screenshots
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/06_calendar_opened.png', 'Calendar Expanded (September)')
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/07_calendar_october.png', 'Calendar Showing October')
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/08_date_selected_oct20.png', 'Date Selected (October 20)')
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/06_calendar_opened.png', _('Calendar Expanded (September)'))
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/07_calendar_october.png', _('Calendar Showing October'))
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/08_date_selected_oct20.png', _('Date Selected (October 20)'))
     
     # Continue with other client sections...
     add_shift_change_section(doc)
@@ -348,184 +320,187 @@ def add_client_panel_sections(doc):
 
 def add_shift_change_section(doc):
     """Add shift change request documentation"""
-    doc.add_heading('2.6 Requesting Shift Changes', 2)
+    doc.add_heading(_('2.6 Requesting Shift Changes'), 2)
     doc.add_paragraph(
-        'If you need to change your assigned shift for a specific date, you can submit a shift '
+        _('If you need to change your assigned shift for a specific date, you can submit a shift '
         'change request through the system. An administrator will review and approve or reject '
-        'your request.'
+        'your request.')
     )
     
-    doc.add_paragraph('Step-by-step process:').bold = True
+    doc.add_paragraph(_('Step-by-step process:')).bold = True
     steps = [
-        'Click the "✏️ Request Shift Change" button on the dashboard',
-        'The Shift Change Request modal will open',
-        'You will see your employee information and current team displayed',
-        'Select the date for which you want to change your shift using the mini calendar',
-        'Use the arrow buttons to navigate to the correct month if needed',
-        'Click on the desired date',
-        'Your current shift for that date will be displayed',
-        'Select your requested shift from the dropdown menu (M2, M3, M4, D1, D2, DO, SL, CL, EL, HL)',
-        'Enter a reason for your request in the text area',
-        'Click "Submit Request" to send your request to administrators',
-        'Click "Cancel" if you want to close the modal without submitting',
+        _('Click the "✏️ Request Shift Change" button on the dashboard'),
+        _('The Shift Change Request modal will open'),
+        _('You will see your employee information and current team displayed'),
+        _('Select the date for which you want to change your shift using the mini calendar'),
+        _('Use the arrow buttons to navigate to the correct month if needed'),
+        _('Click on the desired date'),
+        _('Your current shift for that date will be displayed'),
+        _('Select your requested shift from the dropdown menu (M2, M3, M4, D1, D2, DO, SL, CL, EL, HL)'),
+        _('Enter a reason for your request in the text area'),
+        _('Click "Submit Request" to send your request to administrators'),
+        _('Click "Cancel" if you want to close the modal without submitting'),
     ]
     for i, step in enumerate(steps, 1):
         doc.add_paragraph(f'{i}. {step}')
     
     # Add screenshot
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/09_shift_change_modal_opened.png', 'Shift Change Request Modal')
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/09_shift_change_modal_opened.png', _('Shift Change Request Modal'))
     
     doc.add_paragraph()
     p = doc.add_paragraph()
-    p.add_run('Important: ').bold = True
-    p.add_run('All shift change requests require administrator approval. You will be notified once '
-              'your request is processed.')
+    p.add_run(_('Important: ')).bold = True
+    p.add_run(_('All shift change requests require administrator approval. You will be notified once '
+              'your request is processed.'))
 
 def add_swap_request_section(doc):
     """Add swap request documentation"""
-    doc.add_heading('2.7 Requesting Shift Swaps', 2)
+    doc.add_heading(_('2.7 Requesting Shift Swaps'), 2)
     doc.add_paragraph(
-        'A shift swap allows you to exchange shifts with another team member. Both the requester '
-        'and the target employee must be on the same team for a swap to be processed.'
+        _('A shift swap allows you to exchange shifts with another team member. Both the requester '
+        'and the target employee must be on the same team for a swap to be processed.')
     )
     
-    doc.add_paragraph('How to request a swap:').bold = True
+    doc.add_paragraph(_('How to request a swap:')).bold = True
     steps = [
-        'Click the "🔁 Request Swap" button on the dashboard',
-        'The Swap Request modal will open',
-        'Select the date for the swap using the calendar',
-        'Your current shift for that date will be displayed',
-        'In the "Swap With" field, start typing an employee name or ID',
-        'A list of team members will appear as you type',
-        'Select the employee you want to swap with',
-        'Enter a reason for the swap request',
-        'Click "Submit Swap Request"',
-        'The request will be sent to administrators for approval',
+        _('Click the "🔁 Request Swap" button on the dashboard'),
+        _('The Swap Request modal will open'),
+        _('Select the date for the swap using the calendar'),
+        _('Your current shift for that date will be displayed'),
+        _('In the "Swap With" field, start typing an employee name or ID'),
+        _('A list of team members will appear as you type'),
+        _('Select the employee you want to swap with'),
+        _('Enter a reason for the swap request'),
+        _('Click "Submit Swap Request"'),
+        _('The request will be sent to administrators for approval'),
     ]
     for i, step in enumerate(steps, 1):
         doc.add_paragraph(f'{i}. {step}')
     
     doc.add_paragraph()
     p = doc.add_paragraph()
-    p.add_run('Note: ').bold = True
-    p.add_run('The system will only show employees from your team in the search suggestions. '
-              'Cross-team swaps are not currently supported.')
+    p.add_run(_('Note: ')).bold = True
+    p.add_run(_('The system will only show employees from your team in the search suggestions. '
+              'Cross-team swaps are not currently supported.'))
 
 def add_shift_view_section(doc):
     """Add shift view documentation"""
-    doc.add_heading('2.8 Shift View', 2)
+    doc.add_heading(_('2.8 Shift View'), 2)
     doc.add_paragraph(
-        'The Shift View feature provides a comprehensive calendar-style view of team schedules, '
-        'allowing you to see who is working on specific dates.'
+        _('The Shift View feature provides a comprehensive calendar-style view of team schedules, '
+        'allowing you to see who is working on specific dates.')
     )
     
-    doc.add_paragraph('Using Shift View:').bold = True
+    doc.add_paragraph(_('Using Shift View:')).bold = True
     steps = [
-        'Click the "👁️ Shift View" button',
-        'The Shift View modal will open showing a calendar',
-        'Select a date from the calendar to view all shifts for that day',
-        'You can filter by team using the team dropdown',
-        'The view shows all employees and their assigned shifts',
-        'Use the arrow buttons to navigate between months',
-        'Click outside the modal or the close button to exit',
+        _('Click the "👁️ Shift View" button'),
+        _('The Shift View modal will open showing a calendar'),
+        _('Select a date from the calendar to view all shifts for that day'),
+        _('You can filter by team using the team dropdown'),
+        _('The view shows all employees and their assigned shifts'),
+        _('Use the arrow buttons to navigate between months'),
+        _('Click outside the modal or the close button to exit'),
     ]
     for i, step in enumerate(steps, 1):
         doc.add_paragraph(f'{i}. {step}')
     
     doc.add_paragraph()
     p = doc.add_paragraph()
-    p.add_run('Tip: ').bold = True
-    p.add_run('Use this feature to coordinate with team members and plan coverage.')
+    p.add_run(_('Tip: ')).bold = True
+    p.add_run(_('Use this feature to coordinate with team members and plan coverage.'))
 
 def add_employee_search_section(doc):
     """Add employee search documentation"""
-    doc.add_heading('2.9 Employee Search', 2)
+    doc.add_heading(_('2.9 Employee Search'), 2)
     doc.add_paragraph(
-        'The employee search feature allows you to look up any employee in the system and view '
-        'their schedule.'
+        _('The employee search feature allows you to look up any employee in the system and view '
+        'their schedule.')
     )
     
-    doc.add_paragraph('How to search for employees:').bold = True
+    doc.add_paragraph(_('How to search for employees:')).bold = True
     steps = [
-        'Locate the "Search Other Employees" section on the dashboard',
-        'Click in the search box',
-        'Start typing an employee name, ID, or team name',
-        'A dropdown list of matching employees will appear',
-        'Click on an employee from the list',
-        'Their schedule will replace yours on the dashboard temporarily',
-        'You can select dates from the calendar to see their shifts',
-        'Click the "← Back to My Schedule" button to return to your own schedule',
+        _('Locate the "Search Other Employees" section on the dashboard'),
+        _('Click in the search box'),
+        _('Start typing an employee name, ID, or team name'),
+        _('A dropdown list of matching employees will appear'),
+        _('Click on an employee from the list'),
+        _('Their schedule will replace yours on the dashboard temporarily'),
+        _('You can select dates from the calendar to see their shifts'),
+        _('Click the "← Back to My Schedule" button to return to your own schedule'),
     ]
     for i, step in enumerate(steps, 1):
         doc.add_paragraph(f'{i}. {step}')
     
     doc.add_paragraph()
     p = doc.add_paragraph()
-    p.add_run('Use case: ').bold = True
-    p.add_run('This is useful for checking if a colleague is available on a specific day before '
-              'requesting a swap.')
+    p.add_run(_('Use case: ')).bold = True
+    p.add_run(_('This is useful for checking if a colleague is available on a specific day before '
+              'requesting a swap.'))
 
 def add_stat_cards_section(doc):
     """Add statistics cards documentation"""
-    doc.add_heading('2.10 Statistics Cards', 2)
+    doc.add_heading(_('2.10 Statistics Cards'), 2)
     doc.add_paragraph(
-        'The bottom of your dashboard displays three statistics cards that provide quick insights '
-        'into your schedule:'
+        _('The bottom of your dashboard displays three statistics cards that provide quick insights '
+        'into your schedule:')
     )
     
     cards = [
-        ('📅 Upcoming Days', 
-         'Shows the number of working days in the next 7 days. Click to expand and see the list '
-         'of dates you are scheduled to work.'),
-        ('🏖️ Planned Time Off', 
-         'Displays your time off days (DO, SL, CL, EL, HL) within the next 30 days. Click to '
-         'expand and see all your scheduled off days with their types.'),
-        ('🔄 Shift Changes', 
-         'Shows the number of shifts that have been modified from the original Google Sheets roster. '
-         'Click to expand and see details of what changed and when.'),
+        (_('📅 Upcoming Days'), 
+         _('Shows the number of working days in the next 7 days. Click to expand and see the list '
+         'of dates you are scheduled to work.')),
+        (_('🏖️ Planned Time Off'), 
+         _('Displays your time off days (DO, SL, CL, EL, HL) within the next 30 days. Click to '
+         'expand and see all your scheduled off days with their types.')),
+        (_('🔄 Shift Changes'), 
+         _('Shows the number of shifts that have been modified from the original Google Sheets roster. '
+         'Click to expand and see details of what changed and when.')),
     ]
     
-    for title, description in cards:
-        p = doc.add_paragraph(style='List Bullet')
-        p.add_run(f'{title}: ').bold = True
-        p.add_run(description)
+    doc.add_list(cards)
     
-    doc.add_paragraph('How to use:').bold = True
-    doc.add_paragraph('1. Click on any card to expand it')
-    doc.add_paragraph('2. The card will show detailed information')
-    doc.add_paragraph('3. Click the "▲" arrow or anywhere outside to collapse')
+    doc.add_paragraph(_('How to use:')).bold = True
+    doc.add_paragraph(_('1. Click on any card to expand it'))
+    doc.add_paragraph(_('2. The card will show detailed information'))
+    doc.add_paragraph(_('3. Click the "▲" arrow or anywhere outside to collapse'))
     
     # Add screenshot
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/10_stat_card_upcoming_days_expanded.png', 'Upcoming Days Stat Card Expanded')
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/10_stat_card_upcoming_days_expanded.png', _('Upcoming Days Stat Card Expanded'))
     
     doc.add_paragraph()
     p = doc.add_paragraph()
-    p.add_run('Tip: ').bold = True
-    p.add_run('Check these cards regularly to stay aware of your upcoming schedule and any changes.')
+    p.add_run(_('Tip: ')).bold = True
+    p.add_run(_('Check these cards regularly to stay aware of your upcoming schedule and any changes.'))
 
-def add_admin_panel_sections(doc):
+def add_admin_panel_sections(doc, tenant=None):
     """Add detailed admin panel documentation"""
     
     # 3.1 Admin Login
-    doc.add_heading('3.1 Admin Login', 2)
+    doc.add_heading(_('3.1 Admin Login'), 2)
     doc.add_paragraph(
-        'Administrators access a separate panel with advanced features for managing the entire roster system.'
+        _('Administrators access a separate panel with advanced features for managing the entire roster system.')
     )
     
-    doc.add_paragraph('Default Admin Credentials:').bold = True
-    admin_creds = [
-        ('Super Admin', 'Username: developer', 'Password: devneversleeps'),
-        ('Admin', 'Username: istiaque', 'Password: cartup123'),
-        ('Admin', 'Username: admin', 'Password: password123'),
-    ]
+    if tenant:
+        # Never print a tenant's real passwords; list the accounts only
+        doc.add_paragraph(_('Admin Accounts:')).bold = True
+        admin_creds = admin_user_rows(tenant)
+        columns = (_('Role'), _('Username'), _('Full Name'))
+    else:
+        doc.add_paragraph(_('Default Admin Credentials:')).bold = True
+        admin_creds = [
+            (_('Super Admin'), _('Username: developer'), _('Password: devneversleeps')),
+            (_('Admin'), _('Username: istiaque'), _('Password: cartup123')),
+            (_('Admin'), _('Username: admin'), _('Password: password123')),
+        ]
+        columns = (_('Role'), _('Username'), _('Password'))
     
     table = doc.add_table(rows=len(admin_creds) + 1, cols=3)
     table.style = 'Light Grid Accent 1'
     
     hdr_cells = table.rows[0].cells
-    hdr_cells[0].text = 'Role'
-    hdr_cells[1].text = 'Username'
-    hdr_cells[2].text = 'Password'
+    for idx, column in enumerate(columns):
+        hdr_cells[idx].text = column
     
     for idx, (role, username, password) in enumerate(admin_creds, 1):
         row = table.rows[idx]
@@ -534,19 +509,19 @@ def add_admin_panel_sections(doc):
         row.cells[2].text = password
     
     doc.add_paragraph()
-    doc.add_paragraph('Steps to login:').bold = True
+    doc.add_paragraph(_('Steps to login:')).bold = True
     steps = [
-        'Navigate to http://localhost:3000/admin/login',
-        'Enter your admin username',
-        'Enter your password',
-        'Click "Login"',
-        'You will be redirected to the admin dashboard',
+        _('Navigate to http://localhost:3000/admin/login'),
+        _('Enter your admin username'),
+        _('Enter your password'),
+        _('Click "Login"'),
+        _('You will be redirected to the admin dashboard'),
     ]
     for i, step in enumerate(steps, 1):
         doc.add_paragraph(f'{i}. {step}')
     
     # Add screenshot
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/01_admin_login_page.png', 'Admin Login Page')
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/01_admin_login_page.png', _('Admin Login Page'))
     
     # Continue with other admin sections...
     add_admin_dashboard_section(doc)
@@ -561,845 +536,755 @@ def add_admin_panel_sections(doc):
 
 def add_admin_dashboard_section(doc):
     """Add admin dashboard documentation"""
-    doc.add_heading('3.2 Dashboard Tab', 2)
+    doc.add_heading(_('3.2 Dashboard Tab'), 2)
     doc.add_paragraph(
-        'The admin dashboard provides an overview of the entire roster system with key metrics '
-        'and recent activity.'
+        _('The admin dashboard provides an overview of the entire roster system with key metrics '
+        'and recent activity.')
     )
     
-    doc.add_paragraph('Dashboard Components:').bold = True
+    doc.add_paragraph(_('Dashboard Components:')).bold = True
     
     components = [
-        ('👥 Total Employees This Month', 
-         'Shows the total number of employees in the system.'),
-        ('👷 Employees Working Today', 
-         'Displays count of employees with shifts today. Click to see the full list with their shifts.'),
-        ('Shift Change / Swap Requests Overview', 
-         'Statistics card showing pending, approved, and rejected requests. Click to expand for details.'),
-        ('Team Health Overview', 
-         'Shows team distribution and metrics. Expand to see detailed team information.'),
-        ('Activity Log', 
-         'Recent actions including approved requests, rejected requests, and shift modifications. '
-         'Shows admin username who performed each action.'),
+        (_('👥 Total Employees This Month'), 
+         _('Shows the total number of employees in the system.')),
+        (_('👷 Employees Working Today'), 
+         _('Displays count of employees with shifts today. Click to see the full list with their shifts.')),
+        (_('Shift Change / Swap Requests Overview'), 
+         _('Statistics card showing pending, approved, and rejected requests. Click to expand for details.')),
+        (_('Team Health Overview'), 
+         _('Shows team distribution and metrics. Expand to see detailed team information.')),
+        (_('Activity Log'), 
+         _('Recent actions including approved requests, rejected requests, and shift modifications. '
+         'Shows admin username who performed each action.')),
     ]
     
-    for title, description in components:
-        p = doc.add_paragraph(style='List Bullet')
-        p.add_run(f'{title}: ').bold = True
-        p.add_run(description)
+    doc.add_list(components)
     
     # Add screenshots
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/02_admin_dashboard.png', 'Admin Dashboard Overview')
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/03_dashboard_overview.png', 'Dashboard with All Stat Cards')
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/04_employees_working_today_modal.png', 'Employees Working Today Modal')
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/05_team_health_expanded.png', 'Team Health Overview Expanded')
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/02_admin_dashboard.png', _('Admin Dashboard Overview'))
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/03_dashboard_overview.png', _('Dashboard with All Stat Cards'))
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/04_employees_working_today_modal.png', _('Employees Working Today Modal'))
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/05_team_health_expanded.png', _('Team Health Overview Expanded'))
     
     doc.add_paragraph()
     p = doc.add_paragraph()
-    p.add_run('How to use: ').bold = True
-    p.add_run('Click on any stat card to expand it and view detailed information. '
-              'The activity log updates automatically as changes are made.')
+    p.add_run(_('How to use: ')).bold = True
+    p.add_run(_('Click on any stat card to expand it and view detailed information. '
+              'The activity log updates automatically as changes are made.'))
 
 def add_schedule_requests_section(doc):
     """Add schedule requests documentation"""
-    doc.add_heading('3.3 Schedule Requests Tab', 2)
+    doc.add_heading(_('3.3 Schedule Requests Tab'), 2)
     doc.add_paragraph(
-        'This tab is where administrators review and process shift change and swap requests from employees.'
+        _('This tab is where administrators review and process shift change and swap requests from employees.')
     )
     
-    doc.add_paragraph('Request Management:').bold = True
+    doc.add_paragraph(_('Request Management:')).bold = True
     
     steps = [
-        'Click on the "Schedule Requests" tab in the sidebar',
-        'You will see a list of all requests',
-        'Use the filter buttons to view: All, Pending, Approved, Rejected',
-        'For each request, you can see:',
-        '  - Employee name and ID',
-        '  - Request type (Shift Change or Swap)',
-        '  - Requested date',
-        '  - Current shift and requested shift',
-        '  - Reason provided by employee',
-        '  - Request submission date',
-        'To approve a request: Click the "✅ Approve" button',
-        'To reject a request: Click the "❌ Reject" button',
-        'You will be asked to confirm your action',
-        'Once processed, the request status updates immediately',
-        'The employee\'s schedule is updated for approved requests',
+        _('Click on the "Schedule Requests" tab in the sidebar'),
+        _('You will see a list of all requests'),
+        _('Use the filter buttons to view: All, Pending, Approved, Rejected'),
+        _('For each request, you can see:'),
+        _('  - Employee name and ID'),
+        _('  - Request type (Shift Change or Swap)'),
+        _('  - Requested date'),
+        _('  - Current shift and requested shift'),
+        _('  - Reason provided by employee'),
+        _('  - Request submission date'),
+        _('To approve a request: Click the "✅ Approve" button'),
+        _('To reject a request: Click the "❌ Reject" button'),
+        _('You will be asked to confirm your action'),
+        _('Once processed, the request status updates immediately'),
+        _('The employee\'s schedule is updated for approved requests'),
     ]
-    for step in steps:
-        doc.add_paragraph(step, style='List Number')
+    doc.add_list(steps, style='List Number')
     
     # Add screenshots
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/06_schedule_requests_all.png', 'Schedule Requests - All View')
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/07_schedule_requests_pending.png', 'Schedule Requests - Pending Filter')
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/06_schedule_requests_all.png', _('Schedule Requests - All View'))
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/07_schedule_requests_pending.png', _('Schedule Requests - Pending Filter'))
     
     doc.add_paragraph()
     p = doc.add_paragraph()
-    p.add_run('Important: ').bold = True
-    p.add_run('All actions are logged and cannot be undone. Approved shift changes immediately '
-              'update the roster.')
+    p.add_run(_('Important: ')).bold = True
+    p.add_run(_('All actions are logged and cannot be undone. Approved shift changes immediately '
+              'update the roster.'))
 
 def add_data_sync_section(doc):
     """Add data sync documentation"""
-    doc.add_heading('3.4 Data Sync Tab', 2)
+    doc.add_heading(_('3.4 Data Sync Tab'), 2)
     doc.add_paragraph(
-        'The Data Sync tab allows you to synchronize roster data from Google Sheets and manage '
-        'automatic synchronization settings.'
+        _('The Data Sync tab allows you to synchronize roster data from Google Sheets and manage '
+        'automatic synchronization settings.')
     )
     
-    doc.add_paragraph('Features:').bold = True
+    doc.add_paragraph(_('Features:')).bold = True
     
     features = [
-        ('Manual Sync Button', 
-         'Click to immediately fetch and update data from all configured Google Sheets links.'),
-        ('Auto-Sync Toggle', 
-         'Enable or disable automatic synchronization that runs at regular intervals.'),
-        ('Last Sync Time', 
-         'Shows when the last successful sync occurred.'),
-        ('Sync Statistics', 
-         'Displays number of employees and sheets synced.'),
+        (_('Manual Sync Button'), 
+         _('Click to immediately fetch and update data from all configured Google Sheets links.')),
+        (_('Auto-Sync Toggle'), 
+         _('Enable or disable automatic synchronization that runs at regular intervals.')),
+        (_('Last Sync Time'), 
+         _('Shows when the last successful sync occurred.')),
+        (_('Sync Statistics'), 
+         _('Displays number of employees and sheets synced.')),
     ]
     
-    for title, description in features:
-        p = doc.add_paragraph(style='List Bullet')
-        p.add_run(f'{title}: ').bold = True
-        p.add_run(description)
+    doc.add_list(features)
     
-    doc.add_paragraph('How to perform a manual sync:').bold = True
+    doc.add_paragraph(_('How to perform a manual sync:')).bold = True
     steps = [
-        'Navigate to the Data Sync tab',
-        'Click the "Sync Now" button',
-        'Wait for the sync to complete',
-        'A success message will appear',
-        'Check the sync statistics to verify',
+        _('Navigate to the Data Sync tab'),
+        _('Click the "Sync Now" button'),
+        _('Wait for the sync to complete'),
+        _('A success message will appear'),
+        _('Check the sync statistics to verify'),
     ]
     for i, step in enumerate(steps, 1):
         doc.add_paragraph(f'{i}. {step}')
     
     # Add screenshot
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/08_data_sync_tab.png', 'Data Sync Tab')
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/08_data_sync_tab.png', _('Data Sync Tab'))
 
 def add_google_sheets_section(doc):
     """Add Google Sheets configuration documentation"""
-    doc.add_heading('3.5 Google Sheets Tab', 2)
+    doc.add_heading(_('3.5 Google Sheets Tab'), 2)
     doc.add_paragraph(
-        'Configure Google Sheets links for roster data import. The system supports multiple sheets '
-        'to aggregate data from different teams or sources.'
+        _('Configure Google Sheets links for roster data import. The system supports multiple sheets '
+        'to aggregate data from different teams or sources.')
     )
     
-    doc.add_paragraph('Managing Google Sheets Links:').bold = True
+    doc.add_paragraph(_('Managing Google Sheets Links:')).bold = True
     
-    doc.add_paragraph('To add a new link:').bold = True
+    doc.add_paragraph(_('To add a new link:')).bold = True
     steps = [
-        'Click on the "Google Sheets" tab',
-        'Enter a descriptive name for the sheet (e.g., "Voice Team Roster")',
-        'Paste the published CSV link from your Google Sheet',
-        'Click "Add Link"',
-        'The link will be saved and used for future syncs',
+        _('Click on the "Google Sheets" tab'),
+        _('Enter a descriptive name for the sheet (e.g., "Voice Team Roster")'),
+        _('Paste the published CSV link from your Google Sheet'),
+        _('Click "Add Link"'),
+        _('The link will be saved and used for future syncs'),
     ]
     for i, step in enumerate(steps, 1):
         doc.add_paragraph(f'{i}. {step}')
     
-    doc.add_paragraph('To delete a link:').bold = True
-    doc.add_paragraph('1. Find the link in the list')
-    doc.add_paragraph('2. Click the "Delete" button next to it')
-    doc.add_paragraph('3. Confirm the deletion')
+    doc.add_paragraph(_('To delete a link:')).bold = True
+    doc.add_paragraph(_('1. Find the link in the list'))
+    doc.add_paragraph(_('2. Click the "Delete" button next to it'))
+    doc.add_paragraph(_('3. Confirm the deletion'))
     
     doc.add_paragraph()
     p = doc.add_paragraph()
-    p.add_run('How to get a Google Sheets CSV link:').bold = True
-    doc.add_paragraph('1. Open your Google Sheet')
-    doc.add_paragraph('2. Go to File → Share → Publish to web')
-    doc.add_paragraph('3. Select "Comma-separated values (.csv)"')
-    doc.add_paragraph('4. Click "Publish"')
-    doc.add_paragraph('5. Copy the generated URL')
+    p.add_run(_('How to get a Google Sheets CSV link:')).bold = True
+    doc.add_paragraph(_('1. Open your Google Sheet'))
+    doc.add_paragraph(_('2. Go to File → Share → Publish to web'))
+    doc.add_paragraph(_('3. Select "Comma-separated values (.csv)"'))
+    doc.add_paragraph(_('4. Click "Publish"'))
+    doc.add_paragraph(_('5. Copy the generated URL'))
     
     # Add screenshot
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/09_google_sheets_tab.png', 'Google Sheets Configuration Tab')
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/09_google_sheets_tab.png', _('Google Sheets Configuration Tab'))
 
 def add_roster_data_section(doc):
     """Add roster data management documentation"""
-    doc.add_heading('3.6 Roster Data Tab', 2)
+    doc.add_heading(_('3.6 Roster Data Tab'), 2)
     doc.add_paragraph(
-        'The Roster Data tab provides an interactive interface to view and edit employee shifts directly.'
+        _('The Roster Data tab provides an interactive interface to view and edit employee shifts directly.')
     )
     
-    doc.add_paragraph('Features:').bold = True
+    doc.add_paragraph(_('Features:')).bold = True
     
     features = [
-        ('Data Source Toggle', 
-         'Switch between viewing Google Sheets roster (original) and Admin modified roster.'),
-        ('Shift View Button', 
-         'Open a calendar-based view of the entire roster.'),
-        ('Reset to Google Button', 
-         'Reset all admin modifications and revert to the original Google Sheets data.'),
-        ('Date Selection', 
-         'Select any date to view and modify shifts for that day.'),
-        ('Employee List', 
-         'View all employees with their shifts for the selected date.'),
-        ('Shift Editing', 
-         'Click on any employee shift cell to change it.'),
+        (_('Data Source Toggle'), 
+         _('Switch between viewing Google Sheets roster (original) and Admin modified roster.')),
+        (_('Shift View Button'), 
+         _('Open a calendar-based view of the entire roster.')),
+        (_('Reset to Google Button'), 
+         _('Reset all admin modifications and revert to the original Google Sheets data.')),
+        (_('Date Selection'), 
+         _('Select any date to view and modify shifts for that day.')),
+        (_('Employee List'), 
+         _('View all employees with their shifts for the selected date.')),
+        (_('Shift Editing'), 
+         _('Click on any employee shift cell to change it.')),
     ]
     
-    for title, description in features:
-        p = doc.add_paragraph(style='List Bullet')
-        p.add_run(f'{title}: ').bold = True
-        p.add_run(description)
+    doc.add_list(features)
     
-    doc.add_paragraph('How to modify a shift:').bold = True
+    doc.add_paragraph(_('How to modify a shift:')).bold = True
     steps = [
-        'Go to the Roster Data tab',
-        'Select "Admin Data" to edit the modifiable roster',
-        'Click "Select Date to Modify Shifts"',
-        'Choose a date from the calendar',
-        'Find the employee whose shift you want to change',
-        'Click on their current shift code',
-        'A dropdown will appear with all available shift codes',
-        'Select the new shift',
-        'The change is saved automatically',
-        'The modification is tracked and logged',
+        _('Go to the Roster Data tab'),
+        _('Select "Admin Data" to edit the modifiable roster'),
+        _('Click "Select Date to Modify Shifts"'),
+        _('Choose a date from the calendar'),
+        _('Find the employee whose shift you want to change'),
+        _('Click on their current shift code'),
+        _('A dropdown will appear with all available shift codes'),
+        _('Select the new shift'),
+        _('The change is saved automatically'),
+        _('The modification is tracked and logged'),
     ]
     for i, step in enumerate(steps, 1):
         doc.add_paragraph(f'{i}. {step}')
     
     # Add screenshots
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/10_roster_data_tab.png', 'Roster Data Tab with Calendar')
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/11_roster_date_selected_oct15.png', 'Roster for October 15 with All Employees')
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/12_roster_shift_edit_modal.png', 'Shift Edit Modal with Options')
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/10_roster_data_tab.png', _('Roster Data Tab with Calendar'))
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/11_roster_date_selected_oct15.png', _('Roster for October 15 with All Employees'))
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/12_roster_shift_edit_modal.png', _('Shift Edit Modal with Options'))
 
 def add_csv_section(doc):
     """Add CSV import/export documentation"""
-    doc.add_heading('3.7 CSV Import/Export Tab', 2)
+    doc.add_heading(_('3.7 CSV Import/Export Tab'), 2)
     doc.add_paragraph(
-        'Import and export roster data in CSV format for backup, bulk editing, or integration '
-        'with external systems.'
+        _('Import and export roster data in CSV format for backup, bulk editing, or integration '
+        'with external systems.')
     )
     
-    doc.add_paragraph('CSV Import:').bold = True
+    doc.add_paragraph(_('CSV Import:')).bold = True
     steps = [
-        'Click on "CSV Import" tab',
-        'Click "Choose File" or drag and drop a CSV file',
-        'The file should follow the template format',
-        'Select the month this data is for',
-        'Click "Upload CSV"',
-        'The system will process and import the data',
-        'A success message confirms the import',
+        _('Click on "CSV Import" tab'),
+        _('Click "Choose File" or drag and drop a CSV file'),
+        _('The file should follow the template format'),
+        _('Select the month this data is for'),
+        _('Click "Upload CSV"'),
+        _('The system will process and import the data'),
+        _('A success message confirms the import'),
     ]
     for i, step in enumerate(steps, 1):
         doc.add_paragraph(f'{i}. {step}')
     
-    doc.add_paragraph('CSV Export:').bold = True
+    doc.add_paragraph(_('CSV Export:')).bold = True
     steps = [
-        'Go to the CSV Import tab',
-        'Select specific months to export or choose "Export All"',
-        'Click "📥 Export CSV"',
-        'The file will be generated and downloaded',
-        'Open the file in Excel or any spreadsheet application',
+        _('Go to the CSV Import tab'),
+        _('Select specific months to export or choose "Export All"'),
+        _('Click "📥 Export CSV"'),
+        _('The file will be generated and downloaded'),
+        _('Open the file in Excel or any spreadsheet application'),
     ]
     for i, step in enumerate(steps, 1):
         doc.add_paragraph(f'{i}. {step}')
     
     # Add screenshot
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/13_csv_import_tab.png', 'CSV Import/Export Tab')
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/13_csv_import_tab.png', _('CSV Import/Export Tab'))
     
     doc.add_paragraph()
     p = doc.add_paragraph()
-    p.add_run('CSV Format: ').bold = True
-    p.add_run('The CSV must have columns for Employee Name, Employee ID, Team, and date columns '
-              'with shift codes.')
+    p.add_run(_('CSV Format: ')).bold = True
+    p.add_run(_('The CSV must have columns for Employee Name, Employee ID, Team, and date columns '
+              'with shift codes.'))
 
 def add_profile_section(doc):
     """Add profile management documentation"""
-    doc.add_heading('3.8 My Profile Tab', 2)
+    doc.add_heading(_('3.8 My Profile Tab'), 2)
     doc.add_paragraph(
-        'Manage your admin account information and change your password.'
+        _('Manage your admin account information and change your password.')
     )
     
-    doc.add_paragraph('Profile Information:').bold = True
+    doc.add_paragraph(_('Profile Information:')).bold = True
     info_items = [
-        'Username (read-only)',
-        'Role (read-only)',
-        'Change password functionality',
+        _('Username (read-only)'),
+        _('Role (read-only)'),
+        _('Change password functionality'),
     ]
-    for item in info_items:
-        doc.add_paragraph(item, style='List Bullet')
+    doc.add_list(info_items)
     
-    doc.add_paragraph('How to change your password:').bold = True
+    doc.add_paragraph(_('How to change your password:')).bold = True
     steps = [
-        'Go to the "My Profile" tab',
-        'Enter your current password',
-        'Enter your new password',
-        'Re-enter the new password to confirm',
-        'Click "Change Password"',
-        'You will receive a confirmation message',
-        'Use your new password for future logins',
+        _('Go to the "My Profile" tab'),
+        _('Enter your current password'),
+        _('Enter your new password'),
+        _('Re-enter the new password to confirm'),
+        _('Click "Change Password"'),
+        _('You will receive a confirmation message'),
+        _('Use your new password for future logins'),
     ]
     for i, step in enumerate(steps, 1):
         doc.add_paragraph(f'{i}. {step}')
     
     # Add screenshot
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/14_my_profile_tab.png', 'My Profile Tab')
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/14_my_profile_tab.png', _('My Profile Tab'))
 
 def add_team_mgmt_section(doc):
     """Add team management documentation"""
-    doc.add_heading('3.9 Team Management Tab', 2)
+    doc.add_heading(_('3.9 Team Management Tab'), 2)
     doc.add_paragraph(
-        'Manage teams and employees, including adding new employees, modifying information, and '
-        'organizing team structures.'
+        _('Manage teams and employees, including adding new employees, modifying information, and '
+        'organizing team structures.')
     )
     
-    doc.add_paragraph('Team Management Features:').bold = True
+    doc.add_paragraph(_('Team Management Features:')).bold = True
     
-    doc.add_paragraph('Adding a new team:').bold = True
+    doc.add_paragraph(_('Adding a new team:')).bold = True
     steps = [
-        'Click on "Team Management" tab',
-        'Click "Add New Team" button',
-        'Enter the team name',
-        'Optionally add a description',
-        'Click "Save"',
-        'The team will appear in the list',
+        _('Click on "Team Management" tab'),
+        _('Click "Add New Team" button'),
+        _('Enter the team name'),
+        _('Optionally add a description'),
+        _('Click "Save"'),
+        _('The team will appear in the list'),
     ]
     for i, step in enumerate(steps, 1):
         doc.add_paragraph(f'{i}. {step}')
     
-    doc.add_paragraph('Adding a new employee:').bold = True
+    doc.add_paragraph(_('Adding a new employee:')).bold = True
     steps = [
-        'Select the team from the dropdown',
-        'Click "Add Employee"',
-        'Fill in employee details:',
-        '  - Full Name',
-        '  - Employee ID (format: SLL-XXXXX)',
-        '  - Team assignment',
-        'Click "Save Employee"',
-        'The employee will be added to the roster',
+        _('Select the team from the dropdown'),
+        _('Click "Add Employee"'),
+        _('Fill in employee details:'),
+        _('  - Full Name'),
+        _('  - Employee ID (format: SLL-XXXXX)'),
+        _('  - Team assignment'),
+        _('Click "Save Employee"'),
+        _('The employee will be added to the roster'),
     ]
     for i, step in enumerate(steps, 1):
         doc.add_paragraph(f'{i}. {step}')
     
-    doc.add_paragraph('Modifying employee information:').bold = True
-    doc.add_paragraph('1. Find the employee in the list')
-    doc.add_paragraph('2. Click "Edit" next to their name')
-    doc.add_paragraph('3. Update the information')
-    doc.add_paragraph('4. Click "Save Changes"')
+    doc.add_paragraph(_('Modifying employee information:')).bold = True
+    doc.add_paragraph(_('1. Find the employee in the list'))
+    doc.add_paragraph(_('2. Click "Edit" next to their name'))
+    doc.add_paragraph(_('3. Update the information'))
+    doc.add_paragraph(_('4. Click "Save Changes"'))
     
     # Add screenshot
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/15_team_management_tab.png', 'Team Management Tab')
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/15_team_management_tab.png', _('Team Management Tab'))
 
 def add_user_mgmt_section(doc):
     """Add user management documentation"""
-    doc.add_heading('3.10 User Management Tab', 2)
+    doc.add_heading(_('3.10 User Management Tab'), 2)
     doc.add_paragraph(
-        'Manage administrator accounts, including creating new users, updating roles, and deleting accounts. '
-        'Note: This tab is only visible to Super Admins and Admins.'
+        _('Manage administrator accounts, including creating new users, updating roles, and deleting accounts. '
+        'Note: This tab is only visible to Super Admins and Admins.')
     )
     
-    doc.add_paragraph('User Roles:').bold = True
+    doc.add_paragraph(_('User Roles:')).bold = True
     roles = [
-        ('super_admin', 'Full system access including user management'),
-        ('admin', 'Can manage rosters and requests, view user management'),
-        ('team_leader', 'Limited access to team-specific functions'),
+        ('super_admin', _('Full system access including user management')),
+        ('admin', _('Can manage rosters and requests, view user management')),
+        ('team_leader', _('Limited access to team-specific functions')),
     ]
     
-    for role, description in roles:
-        p = doc.add_paragraph(style='List Bullet')
-        p.add_run(f'{role}: ').bold = True
-        p.add_run(description)
+    doc.add_list(roles)
     
-    doc.add_paragraph('Adding a new admin user:').bold = True
+    doc.add_paragraph(_('Adding a new admin user:')).bold = True
     steps = [
-        'Go to the "User Management" tab',
-        'Click "Add New User"',
-        'Fill in the form:',
-        '  - Username (unique)',
-        '  - Password',
-        '  - Confirm Password',
-        '  - Select Role',
-        'Click "Create User"',
-        'The user can now log in with these credentials',
+        _('Go to the "User Management" tab'),
+        _('Click "Add New User"'),
+        _('Fill in the form:'),
+        _('  - Username (unique)'),
+        _('  - Password'),
+        _('  - Confirm Password'),
+        _('  - Select Role'),
+        _('Click "Create User"'),
+        _('The user can now log in with these credentials'),
     ]
     for i, step in enumerate(steps, 1):
         doc.add_paragraph(f'{i}. {step}')
     
-    doc.add_paragraph('Deleting a user:').bold = True
-    doc.add_paragraph('1. Find the user in the list')
-    doc.add_paragraph('2. Click the "Delete" button')
-    doc.add_paragraph('3. Confirm the deletion')
-    doc.add_paragraph('4. The user account will be permanently removed')
+    doc.add_paragraph(_('Deleting a user:')).bold = True
+    doc.add_paragraph(_('1. Find the user in the list'))
+    doc.add_paragraph(_('2. Click the "Delete" button'))
+    doc.add_paragraph(_('3. Confirm the deletion'))
+    doc.add_paragraph(_('4. The user account will be permanently removed'))
     
     # Add screenshot
-    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/16_user_management_tab.png', 'User Management Tab')
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/admin/16_user_management_tab.png', _('User Management Tab'))
 
-def add_api_documentation(doc):
+def add_api_documentation(doc, tenant=None):
     """Add comprehensive API documentation"""
     
     doc.add_paragraph(
-        'This section documents all API endpoints available in the Cartup CxP Roster Management System. '
-        'All APIs use JSON for request and response bodies.'
+        _('This section documents all API endpoints available in the Cartup CxP Roster Management System. '
+        'All APIs use JSON for request and response bodies.')
     )
     
-    # Authentication APIs
-    doc.add_heading('4.1 Authentication APIs', 2)
-    
-    apis = [
-        {
-            'endpoint': 'POST /api/admin/login',
-            'description': 'Admin login endpoint',
-            'request': '{"username": "string", "password": "string"}',
-            'response': '{"success": true, "user": {"username": "string", "role": "string"}}',
-            'auth': 'None required',
-        },
-        {
-            'endpoint': 'POST /api/admin/logout',
-            'description': 'Admin logout endpoint',
-            'request': 'None',
-            'response': '{"success": true}',
-            'auth': 'Admin cookie required',
-        },
-    ]
-    
-    for api in apis:
-        doc.add_paragraph(api['endpoint']).bold = True
-        doc.add_paragraph(f"Description: {api['description']}")
-        doc.add_paragraph(f"Authentication: {api['auth']}")
-        doc.add_paragraph(f"Request Body: {api['request']}")
-        doc.add_paragraph(f"Response: {api['response']}")
-        doc.add_paragraph()
-    
-    # Schedule APIs
-    doc.add_heading('4.2 Schedule APIs', 2)
-    
-    schedule_apis = [
-        {
-            'endpoint': 'GET /api/my-schedule/[employeeId]',
-            'description': 'Get employee schedule',
-            'params': 'employeeId - Employee ID (e.g., SLL-88717)',
-            'response': '{"employee": {...}, "headers": [...], "schedule": [...]}',
-        },
-        {
-            'endpoint': 'GET /api/admin/get-display-data',
-            'description': 'Get merged display roster data',
-            'response': '{"teams": {...}, "headers": [...], "allEmployees": [...]}',
-        },
-        {
-            'endpoint': 'GET /api/admin/get-admin-data',
-            'description': 'Get admin-modified roster data',
-            'response': '{"teams": {...}, "headers": [...], "allEmployees": [...]}',
-        },
-        {
-            'endpoint': 'GET /api/admin/get-google-data',
-            'description': 'Get original Google Sheets roster data',
-            'response': '{"teams": {...}, "headers": [...], "allEmployees": [...]}',
-        },
-    ]
-    
-    for api in schedule_apis:
-        doc.add_paragraph(api['endpoint']).bold = True
-        doc.add_paragraph(f"Description: {api['description']}")
-        if 'params' in api:
-            doc.add_paragraph(f"Parameters: {api['params']}")
-        doc.add_paragraph(f"Response: {api['response']}")
-        doc.add_paragraph()
-    
-    # Request APIs
-    doc.add_heading('4.3 Request APIs', 2)
-    
-    request_apis = [
-        {
-            'endpoint': 'POST /api/schedule-requests/submit-shift-change',
-            'description': 'Submit a shift change request',
-            'request': '''{
-  "employee_id": "string",
-  "employee_name": "string",
-  "team": "string",
-  "date": "string",
-  "current_shift": "string",
-  "requested_shift": "string",
-  "reason": "string"
-}''',
-            'response': '{"success": true, "message": "Request submitted"}',
-        },
-        {
-            'endpoint': 'POST /api/schedule-requests/submit-swap-request',
-            'description': 'Submit a shift swap request',
-            'request': '''{
-  "requester_id": "string",
-  "requester_name": "string",
-  "swap_with_id": "string",
-  "swap_with_name": "string",
-  "team": "string",
-  "date": "string",
-  "reason": "string"
-}''',
-            'response': '{"success": true, "message": "Swap request submitted"}',
-        },
-        {
-            'endpoint': 'GET /api/schedule-requests/get-all',
-            'description': 'Get all schedule requests',
-            'response': '[{"id": "string", "type": "string", "status": "string", ...}]',
-        },
-        {
-            'endpoint': 'POST /api/schedule-requests/update-status',
-            'description': 'Approve or reject a request (admin only)',
-            'request': '{"id": "string", "status": "approved|rejected", "admin_username": "string"}',
-            'response': '{"success": true}',
-        },
-    ]
-    
-    for api in request_apis:
-        doc.add_paragraph(api['endpoint']).bold = True
-        doc.add_paragraph(f"Description: {api['description']}")
-        if 'request' in api:
-            doc.add_paragraph(f"Request Body:")
-            doc.add_paragraph(api['request'])
-        doc.add_paragraph(f"Response:")
-        doc.add_paragraph(api['response'])
-        doc.add_paragraph()
-    
-    # Admin APIs
-    doc.add_heading('4.4 Admin APIs', 2)
-    
-    admin_apis = [
-        {
-            'endpoint': 'POST /api/admin/update-shift',
-            'description': 'Update employee shift for a specific date',
-            'request': '''{
-  "employee_id": "string",
-  "date": "string",
-  "shift_code": "string",
-  "admin_username": "string"
-}''',
-            'response': '{"success": true}',
-        },
-        {
-            'endpoint': 'POST /api/admin/upload-csv',
-            'description': 'Upload roster CSV file',
-            'request': 'multipart/form-data with file and month',
-            'response': '{"success": true, "message": "CSV imported"}',
-        },
-        {
-            'endpoint': 'POST /api/admin/export-csv',
-            'description': 'Export roster data as CSV',
-            'request': '{"months": ["string"]}',
-            'response': 'CSV file download',
-        },
-        {
-            'endpoint': 'POST /api/admin/save-team',
-            'description': 'Create or update a team',
-            'request': '{"name": "string", "description": "string"}',
-            'response': '{"success": true}',
-        },
-        {
-            'endpoint': 'POST /api/admin/save-employee',
-            'description': 'Create or update an employee',
-            'request': '{"id": "string", "name": "string", "team": "string"}',
-            'response': '{"success": true}',
-        },
-    ]
-    
-    for api in admin_apis:
-        doc.add_paragraph(api['endpoint']).bold = True
-        doc.add_paragraph(f"Description: {api['description']}")
-        doc.add_paragraph(f"Request Body:")
-        doc.add_paragraph(api['request'])
-        doc.add_paragraph(f"Response:")
-        doc.add_paragraph(api['response'])
-        doc.add_paragraph()
-    
-    # Data Sync APIs
-    doc.add_heading('4.5 Data Sync APIs', 2)
-    
-    sync_apis = [
-        {
-            'endpoint': 'POST /api/admin/sync-google-sheets',
-            'description': 'Manually trigger Google Sheets sync',
-            'response': '{"success": true, "employees": number, "sheets": number}',
-        },
-        {
-            'endpoint': 'POST /api/admin/set-auto-sync',
-            'description': 'Enable or disable automatic sync',
-            'request': '{"enabled": boolean}',
-            'response': '{"success": true}',
-        },
-        {
-            'endpoint': 'POST /api/admin/reset-to-google',
-            'description': 'Reset admin data to Google Sheets data',
-            'response': '{"success": true, "message": "Data reset"}',
-        },
-        {
-            'endpoint': 'GET /api/admin/get-modified-shifts',
-            'description': 'Get list of all modified shifts',
-            'response': '[{"employee_id": "string", "date": "string", "old_shift": "string", "new_shift": "string", ...}]',
-        },
-    ]
-    
-    for api in sync_apis:
-        doc.add_paragraph(api['endpoint']).bold = True
-        doc.add_paragraph(f"Description: {api['description']}")
-        if 'request' in api:
-            doc.add_paragraph(f"Request Body:")
-            doc.add_paragraph(api['request'])
-        doc.add_paragraph(f"Response:")
-        doc.add_paragraph(api['response'])
-        doc.add_paragraph()
+    example_id = example_employee_id(tenant)
+    for section in load_content()['api']['sections']:
+        doc.add_heading(_(section['heading']), 2)
+        
+        for api in section['endpoints']:
+            doc.add_paragraph(api['endpoint']).bold = True
+            doc.add_paragraph(f"{_('Description:')} {_(api['description'])}")
+            if section['layout'] == 'inline':
+                if 'auth' in api:
+                    doc.add_paragraph(f"{_('Authentication:')} {_(api['auth'])}")
+                if 'params' in api:
+                    doc.add_paragraph(f"{_('Parameters:')} {_(api['params']).format(example_id=example_id)}")
+                if 'request' in api:
+                    doc.add_paragraph(f"{_('Request Body:')} {payload_text(api['request'])}")
+                doc.add_paragraph(f"{_('Response:')} {payload_text(api['response'])}")
+            else:
+                if 'request' in api:
+                    doc.add_paragraph(_('Request Body:'))
+                    doc.add_paragraph(payload_text(api['request']))
+                doc.add_paragraph(_('Response:'))
+                doc.add_paragraph(payload_text(api['response']))
+            doc.add_paragraph()
+
+def payload_text(payload):
+    """An API request/response as shown in the manual: JSON verbatim, prose translated"""
+    return payload if is_payload_literal(payload) else _(payload)
 
-def add_faq_section(doc):
+def add_faq_section(doc, tenant=None):
     """Add FAQ section"""
     
-    # General Questions
-    doc.add_heading('5.1 General Questions', 2)
-    
-    general_faqs = [
-        {
-            'q': 'What browsers are supported?',
-            'a': 'The system works best on modern browsers including Chrome, Firefox, Safari, and Edge. '
-                 'We recommend using the latest version of Chrome for the best experience.',
-        },
-        {
-            'q': 'Is the system mobile-friendly?',
-            'a': 'Yes! The system is fully responsive and works on mobile devices, tablets, and desktops. '
-                 'The interface adapts to your screen size.',
-        },
-        {
-            'q': 'How often is the data updated?',
-            'a': 'If auto-sync is enabled, data is synchronized from Google Sheets every hour. You can also '
-                 'manually refresh at any time using the Refresh button.',
-        },
-        {
-            'q': 'Can I access the system from home?',
-            'a': 'Yes, if your organization has made the system accessible externally. Contact your IT '
-                 'department for the correct URL and VPN requirements if needed.',
-        },
-    ]
-    
-    for faq in general_faqs:
-        p = doc.add_paragraph()
-        p.add_run(f"Q: {faq['q']}").bold = True
-        doc.add_paragraph(f"A: {faq['a']}")
-        doc.add_paragraph()
-    
-    # Client Panel Questions
-    doc.add_heading('5.2 Client Panel Questions', 2)
-    
-    client_faqs = [
-        {
-            'q': 'Why can\'t I log in?',
-            'a': 'Make sure you are entering your Employee ID correctly (format: SLL-XXXXX). The ID is '
-                 'case-sensitive. Also verify that the password is "cartup123". If issues persist, '
-                 'contact your administrator.',
-        },
-        {
-            'q': 'How do I know if my request was approved?',
-            'a': 'Check the "Shift Changes" stat card on your dashboard. Approved changes will be reflected '
-                 'there. You can also check your schedule - approved changes will show the new shift.',
-        },
-        {
-            'q': 'Can I cancel a request after submitting?',
-            'a': 'Currently, you cannot cancel a request yourself. Contact your administrator if you need '
-                 'to cancel a pending request.',
-        },
-        {
-            'q': 'Why can\'t I request a swap with someone?',
-            'a': 'You can only swap shifts with team members from your own team. The system will only show '
-                 'employees from your team in the swap request search.',
-        },
-        {
-            'q': 'What do the shift codes mean?',
-            'a': 'M2 (8 AM-5 PM), M3 (9 AM-6 PM), M4 (10 AM-7 PM), D1 (12 PM-9 PM), D2 (1 PM-10 PM), '
-                 'DO (Day Off), SL (Sick Leave), CL (Casual Leave), EL (Emergency Leave), HL (Holiday Leave).',
-        },
-    ]
-    
-    for faq in client_faqs:
-        p = doc.add_paragraph()
-        p.add_run(f"Q: {faq['q']}").bold = True
-        doc.add_paragraph(f"A: {faq['a']}")
-        doc.add_paragraph()
-    
-    # Admin Panel Questions
-    doc.add_heading('5.3 Admin Panel Questions', 2)
-    
-    admin_faqs = [
-        {
-            'q': 'How do I add a new employee to the system?',
-            'a': 'Go to Team Management tab, select the team, click "Add Employee", fill in the details '
-                 '(Name, ID, Team), and save. The employee will appear in the roster immediately.',
-        },
-        {
-            'q': 'What happens when I approve a shift change request?',
-            'a': 'The employee\'s shift is immediately updated in the admin roster. The change is logged '
-                 'in the modification history and appears in the activity feed.',
-        },
-        {
-            'q': 'Can I undo a shift modification?',
-            'a': 'Yes, you can manually change the shift back to the original value, or use the '
-                 '"Reset to Google" button to reset all modifications at once (warning: this resets ALL changes).',
-        },
-        {
-            'q': 'How do I bulk import employee schedules?',
-            'a': 'Use the CSV Import tab. Download the template, fill it with your data following the format, '
-                 'then upload it. Select the correct month before uploading.',
-        },
-        {
-            'q': 'What\'s the difference between Google Data and Admin Data?',
-            'a': 'Google Data is the original roster from Google Sheets (read-only). Admin Data includes '
-                 'all modifications made by administrators. The system displays a merge of both.',
-        },
-    ]
-    
-    for faq in admin_faqs:
-        p = doc.add_paragraph()
-        p.add_run(f"Q: {faq['q']}").bold = True
-        doc.add_paragraph(f"A: {faq['a']}")
-        doc.add_paragraph()
+    faq = load_content()['faq']
+    for section in faq['sections']:
+        doc.add_heading(_(section['heading']), 2)
+        
+        for entry in section['entries']:
+            p = doc.add_paragraph()
+            p.add_run(f"{_('Q:')} {_(entry['q'])}").bold = True
+            doc.add_paragraph(f"{_('A:')} {_(entry['a'])}")
+            doc.add_paragraph()
     
     # Troubleshooting
-    doc.add_heading('5.4 Troubleshooting', 2)
-    
-    troubleshooting = [
-        {
-            'issue': 'Page not loading or showing errors',
-            'solution': 'Try refreshing the page (F5). Clear your browser cache. Check your internet connection. '
-                       'If the issue persists, contact IT support.',
-        },
-        {
-            'issue': 'Data not updating after sync',
-            'solution': 'Click the manual refresh button. Check if the Google Sheets links are correctly configured. '
-                       'Verify that the Google Sheet is published correctly as CSV.',
-        },
-        {
-            'issue': 'Cannot upload CSV file',
-            'solution': 'Ensure the file is in CSV format (.csv extension). Check that the file follows the '
-                       'template format. File size should not exceed 5MB. Try a different browser.',
-        },
-        {
-            'issue': 'Theme not applying correctly',
-            'solution': 'Clear your browser cache. Try selecting the theme again. Check if JavaScript is enabled '
-                       'in your browser settings.',
-        },
-        {
-            'issue': 'Forgot admin password',
-            'solution': 'Contact a Super Admin to reset your password through the User Management tab. Super Admins '
-                       'can reset passwords for other users.',
-        },
-    ]
+    doc.add_heading(_('5.4 Troubleshooting'), 2)
     
-    for item in troubleshooting:
+    for item in faq['troubleshooting']:
         p = doc.add_paragraph()
-        p.add_run(f"Issue: {item['issue']}").bold = True
-        doc.add_paragraph(f"Solution: {item['solution']}")
+        p.add_run(f"{_('Issue:')} {_(item['issue'])}").bold = True
+        doc.add_paragraph(f"{_('Solution:')} {_(item['solution'])}")
         doc.add_paragraph()
 
-def add_appendices(doc):
+def add_appendices(doc, tenant=None):
     """Add appendices"""
     
     # Shift Codes Reference
-    doc.add_heading('6.1 Shift Codes Reference', 2)
-    
-    doc.add_paragraph('Complete list of all shift codes used in the system:')
-    
-    shift_codes = [
-        ('M2', '8 AM – 5 PM', 'Morning Shift 2'),
-        ('M3', '9 AM – 6 PM', 'Morning Shift 3'),
-        ('M4', '10 AM – 7 PM', 'Morning Shift 4'),
-        ('D1', '12 PM – 9 PM', 'Day Shift 1'),
-        ('D2', '1 PM – 10 PM', 'Day Shift 2'),
-        ('DO', 'Day Off', 'Scheduled day off'),
-        ('SL', 'Sick Leave', 'Medical leave'),
-        ('CL', 'Casual Leave', 'Personal leave'),
-        ('EL', 'Emergency Leave', 'Urgent/emergency leave'),
-        ('HL', 'Holiday Leave', 'Public holiday or scheduled holiday'),
-    ]
+    doc.add_heading(_('6.1 Shift Codes Reference'), 2)
+    
+    doc.add_paragraph(_('Complete list of all shift codes used in the system:'))
+    
+    content = load_content()['appendix']
+    descriptions = {item['code']: item['description'] for item in content['shift_codes']}
+    shift_codes = shift_code_rows(descriptions, tenant)
     
     table = doc.add_table(rows=len(shift_codes) + 1, cols=3)
     table.style = 'Light Grid Accent 1'
     
     hdr_cells = table.rows[0].cells
-    hdr_cells[0].text = 'Code'
-    hdr_cells[1].text = 'Time/Type'
-    hdr_cells[2].text = 'Description'
+    hdr_cells[0].text = _('Code')
+    hdr_cells[1].text = _('Time/Type')
+    hdr_cells[2].text = _('Description')
     
     for idx, (code, time, desc) in enumerate(shift_codes, 1):
         row = table.rows[idx]
         row.cells[0].text = code
-        row.cells[1].text = time
-        row.cells[2].text = desc
+        row.cells[1].text = _(time)
+        row.cells[2].text = _(desc)
     
     # Quick Reference Guide
-    doc.add_heading('6.2 Quick Reference Guide', 2)
-    
-    doc.add_paragraph('Client Panel Quick Actions:').bold = True
-    client_actions = [
-        ('View Schedule', 'Login → Dashboard shows today/tomorrow'),
-        ('Change Theme', 'Click Theme button → Select from dropdown'),
-        ('Request Shift Change', 'Click Request Shift Change → Select date → Choose shift → Submit'),
-        ('Request Swap', 'Click Request Swap → Select date → Choose employee → Submit'),
-        ('View Team Schedule', 'Click Shift View → Select date and team'),
-        ('Search Employee', 'Type in search box → Click employee'),
-    ]
+    doc.add_heading(_('6.2 Quick Reference Guide'), 2)
+    
+    doc.add_paragraph(_('Client Panel Quick Actions:')).bold = True
+    client_actions = content['client_actions']
     
     table = doc.add_table(rows=len(client_actions) + 1, cols=2)
     table.style = 'Light List Accent 1'
     
     hdr_cells = table.rows[0].cells
-    hdr_cells[0].text = 'Action'
-    hdr_cells[1].text = 'How To'
+    hdr_cells[0].text = _('Action')
+    hdr_cells[1].text = _('How To')
     
-    for idx, (action, howto) in enumerate(client_actions, 1):
+    for idx, item in enumerate(client_actions, 1):
         row = table.rows[idx]
-        row.cells[0].text = action
-        row.cells[1].text = howto
+        row.cells[0].text = _(item['action'])
+        row.cells[1].text = _(item['how_to'])
     
     doc.add_paragraph()
-    doc.add_paragraph('Admin Panel Quick Actions:').bold = True
-    admin_actions = [
-        ('Approve Request', 'Schedule Requests tab → Find request → Click Approve'),
-        ('Modify Shift', 'Roster Data tab → Select date → Click shift → Choose new shift'),
-        ('Sync Data', 'Data Sync tab → Click Sync Now'),
-        ('Add Employee', 'Team Management tab → Add Employee → Fill form → Save'),
-        ('Export CSV', 'CSV Import tab → Select months → Click Export'),
-        ('Add Admin User', 'User Management tab → Add New User → Fill details → Create'),
-    ]
+    doc.add_paragraph(_('Admin Panel Quick Actions:')).bold = True
+    admin_actions = content['admin_actions']
     
     table = doc.add_table(rows=len(admin_actions) + 1, cols=2)
     table.style = 'Light List Accent 1'
     
     hdr_cells = table.rows[0].cells
-    hdr_cells[0].text = 'Action'
-    hdr_cells[1].text = 'How To'
+    hdr_cells[0].text = _('Action')
+    hdr_cells[1].text = _('How To')
     
-    for idx, (action, howto) in enumerate(admin_actions, 1):
+    for idx, item in enumerate(admin_actions, 1):
         row = table.rows[idx]
-        row.cells[0].text = action
-        row.cells[1].text = howto
+        row.cells[0].text = _(item['action'])
+        row.cells[1].text = _(item['how_to'])
+    
+    if tenant:
+        add_tenant_sections(doc, tenant)
+        add_workload_section(doc, tenant)
     
     # Support Contact
     doc.add_page_break()
-    doc.add_heading('Support & Contact', 1)
+    doc.add_heading(_('Support & Contact'), 1)
     doc.add_paragraph(
-        'For technical support, questions, or issues with the Cartup CxP Roster Management System, '
-        'please contact:'
+        _('For technical support, questions, or issues with the Cartup CxP Roster Management System, '
+        'please contact:')
     )
     doc.add_paragraph()
-    doc.add_paragraph('IT Support Team')
-    doc.add_paragraph('Email: support@cartup.com')
-    doc.add_paragraph('Phone: +1-XXX-XXX-XXXX')
-    doc.add_paragraph('Hours: Monday - Friday, 9 AM - 5 PM')
+    doc.add_paragraph(_('IT Support Team'))
+    doc.add_paragraph(_('Email: support@cartup.com'))
+    doc.add_paragraph(_('Phone: +1-XXX-XXX-XXXX'))
+    doc.add_paragraph(_('Hours: Monday - Friday, 9 AM - 5 PM'))
     
     doc.add_paragraph()
-    doc.add_paragraph('System Administrator')
-    doc.add_paragraph('Email: admin@cartup.com')
+    doc.add_paragraph(_('System Administrator'))
+    doc.add_paragraph(_('Email: admin@cartup.com'))
     
     doc.add_paragraph()
-    doc.add_paragraph('---')
-    doc.add_paragraph('Document Version: 1.0')
-    doc.add_paragraph('Last Updated: October 2025')
-    doc.add_paragraph('© 2025 Cartup CxP. All rights reserved.')
+    doc.add_paragraph(_('---'))
+    doc.add_paragraph(_('Document Version: 1.0'))
+    doc.add_paragraph(_('Last Updated: October 2025'))
+    doc.add_paragraph(_('© 2025 Cartup CxP. All rights reserved.'))
+
+def add_tenant_sections(doc, tenant):
+    """Add team and roster sections built from a tenant's live data"""
+    
+    # Teams
+    doc.add_heading(_('6.3 Teams'), 2)
+    teams = team_rows(tenant)
+    doc.add_paragraph(_('{organization} currently has {count} team(s):').format(organization=tenant['name'], count=len(teams)))
+    
+    table = doc.add_table(rows=len(teams) + 1, cols=2)
+    table.style = 'Light Grid Accent 1'
+    
+    hdr_cells = table.rows[0].cells
+    hdr_cells[0].text = _('Team')
+    hdr_cells[1].text = _('Employees')
+    
+    for idx, (team_name, count) in enumerate(teams, 1):
+        row = table.rows[idx]
+        row.cells[0].text = team_name
+        row.cells[1].text = str(count)
+    
+    # Roster Overview
+    doc.add_heading(_('6.4 Roster Overview'), 2)
+    summary = roster_summary(tenant)
+    if not summary['dates']:
+        doc.add_paragraph(_('No roster data has been synced for this organization yet.'))
+        return
+    
+    doc.add_paragraph(
+        _('The current roster covers {employees} employees from {first} to {last} ({days} days).').format(
+            employees=summary['employees'], first=summary['dates'][0],
+            last=summary['dates'][-1], days=len(summary['dates']),
+        )
+    )
+    
+    definitions = tenant['shift_definitions']
+    codes = sorted(summary['code_counts'].items(), key=lambda item: -item[1])
+    
+    table = doc.add_table(rows=len(codes) + 1, cols=3)
+    table.style = 'Light Grid Accent 1'
+    
+    hdr_cells = table.rows[0].cells
+    hdr_cells[0].text = _('Code')
+    hdr_cells[1].text = _('Time/Type')
+    hdr_cells[2].text = _('Assigned Shifts')
+    
+    for idx, (code, count) in enumerate(codes, 1):
+        row = table.rows[idx]
+        row.cells[0].text = code
+        row.cells[1].text = _(definitions[code]) if code in definitions else _('Unknown code')
+        row.cells[2].text = str(count)
+
+def add_workload_section(doc, tenant):
+    """Add per-team workload and fairness figures from a tenant's roster"""
+    doc.add_heading(_('6.5 Workload and Fairness'), 2)
+    grid = roster_grid(tenant['roster'])
+    workload = employee_workload(grid, tenant['shift_definitions'])
+    teams = team_workload(grid, workload)
+    if not teams:
+        doc.add_paragraph(_('No roster data has been synced for this organization yet.'))
+        return
+    
+    doc.add_paragraph(
+        _('Hours come from the shift times in the Shift Codes Reference. Late shifts are shifts ending '
+        'after 8 PM; weekends are Friday and Saturday. The peak 7-day load is the most hours anyone in '
+        'the team was rostered in 7 consecutive days. Late shift spread is 0 when late shifts are shared '
+        'equally and approaches 1 when a few people carry them all.')
+    )
+    
+    table = doc.add_table(rows=len(teams) + 1, cols=7)
+    table.style = 'Light Grid Accent 1'
+    
+    hdr_cells = table.rows[0].cells
+    hdr_cells[0].text = _('Team')
+    hdr_cells[1].text = _('Avg. Hours')
+    hdr_cells[2].text = _('Late Shifts')
+    hdr_cells[3].text = _('Avg. Weekend Shifts')
+    hdr_cells[4].text = _('Avg. Leave Days')
+    hdr_cells[5].text = _('Peak 7-Day Hours')
+    hdr_cells[6].text = _('Late Shift Spread')
+    
+    for idx, team in enumerate(teams, 1):
+        row = table.rows[idx]
+        row.cells[0].text = team['team']
+        row.cells[1].text = f"{team['hours']:.1f}"
+        row.cells[2].text = f"{team['late_share']:.0%}"
+        row.cells[3].text = f"{team['weekend_shifts']:.1f}"
+        row.cells[4].text = f"{team['leave_days']:.1f}"
+        row.cells[5].text = f"{team['peak_7']:.1f}"
+        row.cells[6].text = f"{team['late_gini']:.2f}"
+
+# Chapters 2-6 do not depend on each other, so each can be built in its own worker process
+CHAPTERS = [
+    ('2. Client Panel User Guide', add_client_panel_sections),
+    ('3. Admin Panel User Guide', add_admin_panel_sections),
+    ('4. API Documentation', add_api_documentation),
+    ('5. Frequently Asked Questions (FAQ)', add_faq_section),
+    ('6. Appendices', add_appendices),
+]
+
+# Chapter builders that ignore the tenant, so one built copy serves every tenant
+SHARED_CHAPTER_BUILDERS = {add_client_panel_sections, add_faq_section}
+
+def build_chapter(index, tenant_id=None, data_dir=DATA_DIR, locale=DEFAULT_LOCALE):
+    """Build one chapter into its own document and return it as DOCX bytes"""
+    set_locale(locale)
+    tenant = load_tenant(tenant_id, data_dir) if tenant_id else None
+    heading, builder = CHAPTERS[index]
+    doc = DocCursor(Document())
+    doc.add_heading(_(heading), 1)
+    builder(doc, tenant)
+    stream = io.BytesIO()
+    # Only handed back to the parent process, so nothing is worth compressing
+    save_document(doc.document, stream, xml_level=0)
+    return stream.getvalue()
+
+def body_position(doc):
+    """Index in the document body where the next added block will land (before sectPr)"""
+    return len(doc.element.body) - 1
+
+def chapter_key(index, tenant=None, inputs=None):
+    """Key of a built chapter in a fragments cache: (index, locale, inputs[, tenant id,
+    tenant fingerprint]), the same for every tenant when the chapter's content does not
+    depend on tenant data. `inputs` is chapter_inputs() of the current locale."""
+    inputs = inputs or chapter_inputs(get_locale())
+    if CHAPTERS[index][1] in SHARED_CHAPTER_BUILDERS or tenant is None:
+        return (index, get_locale(), inputs)
+    return (index, get_locale(), inputs, tenant['id'], tenant['fingerprint'])
+
+def add_chapters(doc, tenant=None, tenant_id=None, data_dir=DATA_DIR, jobs=None, index=None, fragments=None):
+    """Add every chapter, building them in parallel worker processes unless jobs == 1.
+
+    With a `fragments` dict, chapters are built in this process as DOCX bytes, kept in
+    `fragments` and merged from there, so later builds reuse chapters that did not change.
+    """
+    if fragments is not None:
+        inputs = chapter_inputs(get_locale())
+        for idx in range(len(CHAPTERS)):
+            key = chapter_key(idx, tenant, inputs)
+            if key not in fragments:
+                fragments[key] = build_chapter(idx, tenant_id, data_dir, get_locale())
+            chapter = Document(io.BytesIO(fragments[key]))
+            merge_document(doc, chapter)
+            if index:
+                index.add_document(chapter)
+        return
+    
+    workers = min(jobs or os.cpu_count() or 1, len(CHAPTERS))
+    if workers <= 1:
+        for heading, builder in CHAPTERS:
+            start = body_position(doc)
+            doc.add_heading(_(heading), 1)
+            builder(doc, tenant)
+            if index:
+                index.add_document(doc, start)
+        return
+    
+    count = len(CHAPTERS)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        bodies = pool.map(build_chapter, range(count), [tenant_id] * count, [data_dir] * count, [get_locale()] * count)
+        # map() yields in submission order, so chapters are merged in order
+        for body in bodies:
+            chapter = Document(io.BytesIO(body))
+            merge_document(doc, chapter)
+            if index:
+                index.add_document(chapter)
+
+# Modules whose code shapes the DOCX; editing one of them changes every manual's fingerprint
+GENERATOR_MODULES = ['generate_manual.py', 'docx_merge.py', 'package_writer.py', 'tenant_data.py', 'i18n.py',
+                     'manual_content.py', 'roster.py', 'roster_analytics.py', 'screenshot_annotations.py',
+                     'doc_cursor.py']
+
+def chapter_inputs(locale=DEFAULT_LOCALE):
+    """Fingerprint of what every chapter is built from besides tenant data: the content
+    specs, the locale's catalog, the screenshots and the generator code"""
+    root = os.path.dirname(os.path.abspath(__file__))
+    screenshots = sorted(glob.glob(os.path.join('MANUAL_SCREENSHOTS', '**', '*.*'), recursive=True))
+    return fingerprint(
+        kind='manual-chapters',
+        locale=locale,
+        catalog=files_fingerprint([catalog_path(locale)]) if locale != DEFAULT_LOCALE else None,
+        content=spec_digest(),
+        screenshots=files_fingerprint(screenshots),
+        code=files_fingerprint([os.path.join(root, name) for name in GENERATOR_MODULES]),
+    )
+
+def manual_fingerprint(tenant_id=None, data_dir=DATA_DIR, locale=DEFAULT_LOCALE, xml_level=DEFAULT_XML_LEVEL):
+    """Fingerprint of everything a manual DOCX is built from, for the artifact store"""
+    return fingerprint(
+        kind='manual-docx',
+        tenant=tenant_id,
+        tenant_data=tenant_fingerprint(tenant_id, data_dir) if tenant_id else None,
+        inputs=chapter_inputs(locale),
+        xml_level=xml_level,
+    )
+
+def locale_output(path, locale):
+    """Per-locale variant of an output path: USER_MANUAL.docx -> USER_MANUAL.bn.docx"""
+    base, ext = os.path.splitext(path)
+    return f'{base}.{locale}{ext}'
+
+def build_locale(locale, tenant_id=None, data_dir=DATA_DIR, output='USER_MANUAL.docx', search_index=True,
+                 html_dir=None, xml_level=DEFAULT_XML_LEVEL):
+    """Build one locale's manual (and HTML help) in a worker process; returns the DOCX path"""
+    path = locale_output(output, locale)
+    create_manual(
+        tenant_id, data_dir, path, jobs=1, search_index=search_index,
+        html_dir=os.path.join(html_dir, locale) if html_dir else None,
+        locale=locale,
+        # Every locale shares one screenshot variant cache instead of re-encoding images
+        assets_dir=os.path.join(html_dir, 'assets') if html_dir else None,
+        xml_level=xml_level,
+    )
+    return path
+
+def build_locales(locales, tenant_id=None, data_dir=DATA_DIR, output='USER_MANUAL.docx', search_index=True,
+                  html_dir=None, jobs=None, xml_level=DEFAULT_XML_LEVEL):
+    """Build every locale in parallel worker processes, one locale per worker"""
+    workers = min(jobs or os.cpu_count() or 1, len(locales))
+    count = len(locales)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(
+            build_locale, locales, [tenant_id] * count, [data_dir] * count, [output] * count,
+            [search_index] * count, [html_dir] * count, [xml_level] * count,
+        ))
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate the Cartup CxP Roster Management System user manual')
+    parser.add_argument('--tenant', help='Build the manual from this tenant\'s live data (data/tenants/<id>)')
+    parser.add_argument('--data-dir', default=DATA_DIR, help='Application data directory (default: data)')
+    parser.add_argument('-o', '--output', default='USER_MANUAL.docx', help='Output DOCX path')
+    parser.add_argument('-j', '--jobs', type=int, help='Worker processes for chapter builds (default: all cores, 1 disables)')
+    parser.add_argument('--no-search-index', action='store_true', help='Do not write the <output>.search.json help index')
+    parser.add_argument('--html', metavar='DIR', help='Also render the manual as HTML help pages into DIR')
+    parser.add_argument('--locale', default=DEFAULT_LOCALE, help='Language of the manual (default: en)')
+    parser.add_argument('--locales', help='Comma-separated locales (or "all") to build in parallel, '
+                                          'written as <output>.<locale>.docx')
+    parser.add_argument('--xml-level', type=int, choices=range(10), default=DEFAULT_XML_LEVEL, metavar='0-9',
+                        help='Deflate level for XML parts; images are always stored uncompressed (default: 6)')
+    args = parser.parse_args()
+    
     try:
-        create_manual()
+        if args.locales:
+            locales = available_locales() if args.locales == 'all' else args.locales.split(',')
+            outputs = build_locales(locales, args.tenant, args.data_dir, args.output, not args.no_search_index,
+                                    args.html, args.jobs, args.xml_level)
+        else:
+            create_manual(args.tenant, args.data_dir, args.output, args.jobs, not args.no_search_index, args.html,
+                          args.locale, xml_level=args.xml_level)
+            outputs = [args.output]
         print("\n✅ SUCCESS: Complete user manual has been generated!")
-        print("📄 File location: USER_MANUAL.docx")
+        print(f"📄 File location: {', '.join(outputs)}")
         print("📸 Screenshots folder: MANUAL_SCREENSHOTS/")
         print("\nThe manual includes:")
         print("  ✓ Table of Contents")
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+HTML Help Renderer for the Cartup CxP Roster Management System manual.
+Renders the generated manual Document as lightweight HTML: one page per chapter with
+inlined critical CSS, and screenshots from MANUAL_SCREENSHOTS/ emitted as responsive,
+lazily loaded srcset variants in modern formats (AVIF/WebP) with a PNG/JPEG fallback.
+Section anchors match search_index.section_anchor, so a search hit "sec-2-6" lives on
+page "sec-2.html".
+"""
+
+import hashlib
+import html
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.ns import qn
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+from PIL import Image, features
+
+from i18n import _
+from search_index import section_anchor, style_names, paragraph_style
+
+VARIANT_WIDTHS = (480, 960, 1440)
+MODERN_FORMATS = [fmt for fmt in ('avif', 'webp') if features.check(fmt)]
+FORMAT_MIME = {'avif': 'image/avif', 'webp': 'image/webp', 'png': 'image/png', 'jpeg': 'image/jpeg'}
+FORMAT_QUALITY = {'avif': 55, 'webp': 78, 'jpeg': 82}
+
+# Content column is at most 800px wide, full width below that
+IMAGE_SIZES = '(max-width: 840px) 100vw, 800px'
+
+CRITICAL_CSS = """
+*{box-sizing:border-box}
+body{margin:0;font:16px/1.55 -apple-system,BlinkMacSystemFont,"Segoe UI",Roboto,"Noto Sans Bengali",sans-serif;color:#1f2933;background:#fff}
+header,main,footer{max-width:840px;margin:0 auto;padding:0 20px}
+header{padding-top:16px;font-size:14px}
+a{color:#1d4ed8}
+h1{font-size:1.75rem;line-height:1.25;margin:.8em 0 .4em}
+h2{font-size:1.35rem;margin:1.6em 0 .4em;border-bottom:1px solid #e4e7eb;padding-bottom:.2em}
+h3{font-size:1.1rem}
+p{margin:.45em 0}
+ul,ol{padding-left:1.4em}
+.center{text-align:center}
+.caption{color:#7b8794;font-size:.875rem;font-style:italic}
+figure{margin:1em 0;text-align:center}
+img{max-width:100%;height:auto;border:1px solid #e4e7eb;border-radius:4px}
+table{border-collapse:collapse;width:100%;margin:.8em 0;font-size:.925rem;display:block;overflow-x:auto}
+td,th{border:1px solid #cbd2d9;padding:6px 8px;text-align:left;vertical-align:top}
+tr:first-child td{background:#eef2ff;font-weight:600}
+nav.pager{display:flex;justify-content:space-between;margin:2em 0;font-size:14px}
+pre{white-space:pre-wrap;background:#f5f7fa;padding:8px;border-radius:4px;font-size:.85rem}
+""".strip()
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="{lang}">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width,initial-scale=1">
+<title>{title}</title>
+<style>{css}</style>
+</head>
+<body>
+<header><a href="index.html">{home}</a></header>
+<main>
+{body}
+</main>
+<footer>{pager}</footer>
+</body>
+</html>
+"""
+
+LIST_TAGS = {'List Bullet': 'ul', 'List Bullet 2': 'ul', 'List Number': 'ol'}
+
+def image_variants(blob, assets_dir, widths=VARIANT_WIDTHS, formats=None):
+    """Write resized variants of an image blob, reusing files already in `assets_dir`.
+
+    Returns (width, height, {format: [(file name, width), ...]}, fallback format).
+    """
+    formats = MODERN_FORMATS if formats is None else formats
+    digest = hashlib.sha1(blob).hexdigest()[:16]
+    with Image.open(io.BytesIO(blob)) as img:
+        img.load()
+        width, height = img.size
+        fallback = 'jpeg' if img.format == 'JPEG' else 'png'
+        targets = sorted({w for w in widths if w < width} | {min(width, max(widths))})
+        variants = {}
+        for fmt in formats + [fallback]:
+            for w in targets:
+                ext = 'jpg' if fmt == 'jpeg' else fmt
+                name = f'{digest}-{w}.{ext}'
+                path = os.path.join(assets_dir, name)
+                if not os.path.exists(path):
+                    resized = img if w == width else img.resize((w, round(height * w / width)), Image.LANCZOS)
+                    if fmt == 'jpeg' and resized.mode not in ('RGB', 'L'):
+                        resized = resized.convert('RGB')
+                    # Unique temp name: several renders (threads or locale workers) may share assets_dir
+                    tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+                    resized.save(tmp, format=fmt.upper(), quality=FORMAT_QUALITY.get(fmt, 80), optimize=True)
+                    os.replace(tmp, path)
+                variants.setdefault(fmt, []).append((name, w))
+    return width, height, variants, fallback
+
+def _srcset(entries, prefix):
+    """srcset attribute value for a list of (file name, width) variants"""
+    return ', '.join(f'{prefix}{name} {w}w' for name, w in entries)
+
+def picture_html(image, alt, prefix='assets/'):
+    """<picture> markup for an image processed by image_variants"""
+    width, height, variants, fallback = image
+    display_w = min(width, 800)
+    display_h = round(height * display_w / width)
+    sources = ''.join(
+        f'<source type="{FORMAT_MIME[fmt]}" srcset="{_srcset(variants[fmt], prefix)}" sizes="{IMAGE_SIZES}">'
+        for fmt in variants if fmt != fallback
+    )
+    fallback_entries = variants[fallback]
+    return (
+        f'<picture>{sources}<img src="{prefix}{fallback_entries[-1][0]}" '
+        f'srcset="{_srcset(fallback_entries, prefix)}" sizes="{IMAGE_SIZES}" '
+        f'width="{display_w}" height="{display_h}" alt="{html.escape(alt)}" '
+        f'loading="lazy" decoding="async"></picture>'
+    )
+
+def _runs_html(paragraph):
+    """Inline HTML for a paragraph's runs, keeping bold and italic"""
+    parts = []
+    for run in paragraph.runs:
+        text = html.escape(run.text)
+        if not text:
+            continue
+        if run.bold:
+            text = f'<strong>{text}</strong>'
+        if run.italic:
+            text = f'<em>{text}</em>'
+        parts.append(text)
+    if not parts and paragraph.text:
+        parts.append(html.escape(paragraph.text))
+    return ''.join(parts)
+
+def _table_html(table):
+    """HTML for a docx table"""
+    rows = []
+    for row in table.rows:
+        cells = ''.join(f'<td>{html.escape(cell.text)}</td>' for cell in row.cells)
+        rows.append(f'<tr>{cells}</tr>')
+    return '<table>' + ''.join(rows) + '</table>'
+
+def split_chapters(doc):
+    """Group body blocks by top-level heading: [(anchor, title, [(style, block), ...])]"""
+    names = style_names(doc)
+    chapters = []
+    for el in doc.element.body.iterchildren():
+        if el.tag == qn('w:p'):
+            block = Paragraph(el, doc._body)
+            style = paragraph_style(el, names)
+            if style == 'Heading 1' and block.text.strip():
+                title = block.text.strip()
+                chapters.append((section_anchor(title), title, []))
+                continue
+        elif el.tag == qn('w:tbl'):
+            block = Table(el, doc._body)
+            style = ''
+        else:
+            continue
+        if chapters:
+            chapters[-1][2].append((style, block))
+    # The title page and table of contents come before the first chapter and are replaced by index.html;
+    # the TOC heading is in the manual's language
+    return [chapter for chapter in chapters if chapter[0] != section_anchor(_('Table of Contents'))]
+
+def _chapter_body(doc, title, blocks, images, prefix):
+    """HTML for one chapter; `images` maps an image rId to its processed variants"""
+    out = [f'<h1>{html.escape(title)}</h1>']
+    open_list = None
+    last_was_image = False
+    for style, block in blocks:
+        if isinstance(block, Table):
+            if open_list:
+                out.append(f'</{open_list}>')
+                open_list = None
+            out.append(_table_html(block))
+            last_was_image = False
+            continue
+
+        paragraph = block
+        list_tag = LIST_TAGS.get(style)
+        if open_list and list_tag != open_list:
+            out.append(f'</{open_list}>')
+            open_list = None
+
+        blips = paragraph._p.xpath('.//a:blip/@r:embed')
+        if blips:
+            for r_id in blips:
+                if r_id in images:
+                    image, alt = images[r_id]
+                    out.append(f'<figure>{picture_html(image, alt, prefix)}</figure>')
+            last_was_image = True
+            continue
+
+        inner = _runs_html(paragraph)
+        if not inner.strip():
+            last_was_image = False
+            continue
+        if style.startswith('Heading'):
+            level = min(int(style.split()[-1]), 6) if style[-1].isdigit() else 2
+            text = paragraph.text.strip()
+            out.append(f'<h{level} id="{section_anchor(text)}">{html.escape(text)}</h{level}>')
+        elif list_tag:
+            if not open_list:
+                out.append(f'<{list_tag}>')
+                open_list = list_tag
+            out.append(f'<li>{inner.lstrip("• ")}</li>')
+        elif '\n' in paragraph.text:
+            out.append(f'<pre>{html.escape(paragraph.text)}</pre>')
+        elif last_was_image and paragraph.alignment == WD_ALIGN_PARAGRAPH.CENTER:
+            out.append(f'<p class="caption center">{inner}</p>')
+        else:
+            css = ' class="center"' if paragraph.alignment == WD_ALIGN_PARAGRAPH.CENTER else ''
+            out.append(f'<p{css}>{inner}</p>')
+        last_was_image = False
+    if open_list:
+        out.append(f'</{open_list}>')
+    return '\n'.join(out)
+
+def _collect_images(doc, assets_dir, jobs=None):
+    """Process every image in the document once, in parallel; returns {rId: (variants, alt)}"""
+    sources = {}
+    for doc_pr in doc.element.body.xpath('.//wp:docPr'):
+        inline = doc_pr.getparent()
+        for r_id in inline.xpath('.//a:blip/@r:embed'):
+            # add_screenshot records the MANUAL_SCREENSHOTS path in docPr/@name and the caption in
+            # @descr. The embedded part is what the DOCX shows: the source file itself, or its
+            # annotated rendering when the screenshot has annotations
+            blob = doc.part.rels[r_id].target_part.blob
+            sources[r_id] = (blob, doc_pr.get('descr') or os.path.basename(doc_pr.get('name', '')))
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {r_id: pool.submit(image_variants, blob, assets_dir) for r_id, (blob, _) in sources.items()}
+        return {r_id: (future.result(), sources[r_id][1]) for r_id, future in futures.items()}
+
+def render_html(doc, output_dir, lang='en', jobs=None, assets_dir=None):
+    """Write index.html plus one page per chapter to `output_dir`; returns the page paths.
+
+    Image variants go to `assets_dir` (default: <output_dir>/assets), which can be shared
+    between several renders.
+    """
+    assets_dir = assets_dir or os.path.join(output_dir, 'assets')
+    os.makedirs(assets_dir, exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
+    prefix = os.path.relpath(assets_dir, output_dir).replace(os.sep, '/') + '/'
+    images = _collect_images(doc, assets_dir, jobs)
+    chapters = split_chapters(doc)
+    title = doc.core_properties.title or 'User Manual'
+    home = html.escape(title)
+    pages = []
+
+    for idx, (anchor, chapter_title, blocks) in enumerate(chapters):
+        prev_link = f'<a href="{chapters[idx - 1][0]}.html">← {html.escape(chapters[idx - 1][1])}</a>' if idx else '<span></span>'
+        next_link = f'<a href="{chapters[idx + 1][0]}.html">{html.escape(chapters[idx + 1][1])} →</a>' if idx + 1 < len(chapters) else '<span></span>'
+        page = PAGE_TEMPLATE.format(
+            lang=lang,
+            title=html.escape(f'{chapter_title} – {title}'),
+            css=CRITICAL_CSS,
+            home=home,
+            body=_chapter_body(doc, chapter_title, blocks, images, prefix),
+            pager=f'<nav class="pager">{prev_link}{next_link}</nav>',
+        )
+        path = os.path.join(output_dir, f'{anchor}.html')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(page)
+        pages.append(path)
+
+    toc = ['<h1>' + home + '</h1>', '<ol>']
+    for anchor, chapter_title, blocks in chapters:
+        sections = [block.text.strip() for style, block in blocks if style == 'Heading 2' and block.text.strip()]
+        links = ''.join(
+            f'<li><a href="{anchor}.html#{section_anchor(s)}">{html.escape(s)}</a></li>' for s in sections
+        )
+        toc.append(f'<li><a href="{anchor}.html">{html.escape(chapter_title)}</a>' + (f'<ul>{links}</ul>' if links else '') + '</li>')
+    toc.append('</ol>')
+    index_path = os.path.join(output_dir, 'index.html')
+    with open(index_path, 'w', encoding='utf-8') as f:
+        f.write(PAGE_TEMPLATE.format(lang=lang, title=home, css=CRITICAL_CSS, home=home, body='\n'.join(toc), pager=''))
+    pages.insert(0, index_path)
+    return pages
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Message Catalogs for the Cartup CxP Roster Management System manual.
+Manual text is written in English and wrapped in _() (gettext style, the English text is
+the message id). Translations live in per-locale catalogs, locales/<locale>.json, which
+are compiled once into a marshal file under .cache/locales/ and reloaded from there
+until the catalog changes. Untranslated messages fall back to English.
+
+    python i18n.py extract bn   # add new manual strings to locales/bn.json
+    python i18n.py compile      # precompile every catalog
+"""
+
+import argparse
+import ast
+import json
+import marshal
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+LOCALES_DIR = os.path.join(ROOT_DIR, 'locales')
+CACHE_DIR = os.path.join(ROOT_DIR, '.cache', 'locales')
+DEFAULT_LOCALE = 'en'
+
+# Modules whose _() and N_() calls make up the manual's messages
+SOURCE_FILES = ['generate_manual.py', 'tenant_data.py']
+MARKERS = ('_', 'N_')
+
+_locale = DEFAULT_LOCALE
+_catalog = {}
+
+def catalog_path(locale):
+    """Source catalog of a locale"""
+    return os.path.join(LOCALES_DIR, f'{locale}.json')
+
+def available_locales():
+    """The default locale plus every locale with a catalog"""
+    locales = [DEFAULT_LOCALE]
+    if os.path.isdir(LOCALES_DIR):
+        for name in sorted(os.listdir(LOCALES_DIR)):
+            if name.endswith('.json') and name[:-5] != DEFAULT_LOCALE:
+                locales.append(name[:-5])
+    return locales
+
+def compile_catalog(locale):
+    """Compile locales/<locale>.json into the marshal cache and return the lookup table"""
+    source = catalog_path(locale)
+    st = os.stat(source)
+    with open(source, 'r', encoding='utf-8') as f:
+        messages = json.load(f)
+    catalog = {msgid: msgstr for msgid, msgstr in messages.items() if msgstr}
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    compiled = os.path.join(CACHE_DIR, f'{locale}.marshal')
+    tmp = f'{compiled}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        marshal.dump((st.st_mtime_ns, st.st_size, catalog), f)
+    os.replace(tmp, compiled)
+    return catalog
+
+def load_catalog(locale):
+    """Lookup table for a locale, from the compiled cache while the catalog is unchanged"""
+    if locale == DEFAULT_LOCALE:
+        return {}
+    source = catalog_path(locale)
+    if not os.path.exists(source):
+        raise ValueError(f'No message catalog for locale "{locale}" ({source})')
+    st = os.stat(source)
+    try:
+        with open(os.path.join(CACHE_DIR, f'{locale}.marshal'), 'rb') as f:
+            mtime_ns, size, catalog = marshal.load(f)
+        if mtime_ns == st.st_mtime_ns and size == st.st_size:
+            return catalog
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    return compile_catalog(locale)
+
+def set_locale(locale):
+    """Make `locale` the language _() translates into"""
+    global _locale, _catalog
+    _catalog = load_catalog(locale)
+    _locale = locale
+
+def get_locale():
+    """The active locale"""
+    return _locale
+
+def _(message):
+    """Translate a message into the active locale, falling back to the English text"""
+    return _catalog.get(message, message)
+
+def N_(message):
+    """Mark a message for extraction without translating it (it is translated where it is shown)"""
+    return message
+
+def extract_messages(paths=None):
+    """Message ids of every _('...') and N_('...') call in the manual sources and of the
+    manual content specs (manual_content/*.yaml), in source order"""
+    messages = []
+    seen = set()
+    for path in paths or [os.path.join(ROOT_DIR, name) for name in SOURCE_FILES]:
+        with open(path, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read(), path)
+        calls = [
+            node for node in ast.walk(tree)
+            if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in MARKERS
+            and node.args and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str)
+        ]
+        for node in sorted(calls, key=lambda n: (n.lineno, n.col_offset)):
+            if node.args[0].value not in seen:
+                seen.add(node.args[0].value)
+                messages.append(node.args[0].value)
+    if paths is None:
+        from manual_content import content_messages
+        for message in content_messages():
+            if message not in seen:
+                seen.add(message)
+                messages.append(message)
+    return messages
+
+def update_catalog(locale, messages):
+    """Write locales/<locale>.json with every message, keeping existing translations.
+
+    Returns (new messages, untranslated messages).
+    """
+    existing = {}
+    if os.path.exists(catalog_path(locale)):
+        with open(catalog_path(locale), 'r', encoding='utf-8') as f:
+            existing = json.load(f)
+    catalog = {msgid: existing.get(msgid, '') for msgid in messages}
+    os.makedirs(LOCALES_DIR, exist_ok=True)
+    with open(catalog_path(locale), 'w', encoding='utf-8') as f:
+        json.dump(catalog, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    new = sum(1 for msgid in messages if msgid not in existing)
+    untranslated = sum(1 for msgstr in catalog.values() if not msgstr)
+    return new, untranslated
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Manage the manual\'s message catalogs')
+    sub = parser.add_subparsers(dest='command', required=True)
+    extract = sub.add_parser('extract', help='Add new manual strings to a locale catalog')
+    extract.add_argument('locale')
+    sub.add_parser('compile', help='Compile every catalog into the lookup cache')
+    args = parser.parse_args()
+
+    if args.command == 'extract':
+        if args.locale == DEFAULT_LOCALE:
+            sys.exit(f'"{DEFAULT_LOCALE}" is the source language and has no catalog')
+        new, untranslated = update_catalog(args.locale, extract_messages())
+        print(f"✅ {catalog_path(args.locale)}: {new} new, {untranslated} untranslated")
+    else:
+        for locale in available_locales()[1:]:
+            print(f"✅ {locale}: {len(compile_catalog(locale))} translated messages")
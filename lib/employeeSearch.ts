@@ -0,0 +1,195 @@
+/**
+ * Employee search over the index written by employee_search.py
+ * (data/tenants/<id>/employee_index.json). IDs are matched by prefix with a binary
+ * search (employees are stored in ID order) and names by counting shared trigrams,
+ * so a keystroke costs microseconds instead of a scan of every employee. The index is
+ * cached until the file changes.
+ */
+
+import fs from 'fs';
+import { getTenantDataDir } from './constants';
+
+export interface EmployeeIndexFile {
+  v: number;
+  teams: string[];
+  employees: [string, string, number][]; // [id, name, team number], sorted by ID key
+  by_number: number[];                   // employee numbers sorted by ID number
+  trigrams: string[];                    // sorted
+  postings: number[][];                  // delta-encoded employee numbers, aligned with trigrams
+}
+
+export interface EmployeeSearchIndex {
+  file: EmployeeIndexFile;
+  keys: string[];
+  numbers: string[];
+  postings: Int32Array[];
+  lookup: Map<string, number>;
+  names: string[];
+  hits: Uint16Array;
+}
+
+export interface EmployeeMatch {
+  id: string;
+  name: string;
+  team: string;
+}
+
+// Must match MIN_SCORE and EXACT_TRIGRAMS in employee_search.py
+const MIN_SCORE = 0.5;
+const EXACT_TRIGRAMS = 3;
+
+const indexCache = new Map<string, { mtimeMs: number; index: EmployeeSearchIndex | null }>();
+
+// Must match normalize_name() in employee_search.py
+export function normalizeName(text: string): string[] {
+  const plain = (text || '').normalize('NFKD').toLowerCase().replace(/\p{M}/gu, '');
+  return plain.match(/[\p{L}\p{N}]+/gu) || [];
+}
+
+// Must match id_key() and id_number() in employee_search.py
+export function idKey(employeeId: string): string {
+  return (employeeId || '').toLowerCase().replace(/[^0-9a-z]/g, '');
+}
+
+function idNumber(key: string): string {
+  const match = key.match(/\d+$/);
+  return match ? match[0] : '';
+}
+
+// Must match trigrams() in employee_search.py
+export function trigrams(words: string[], prefix = false): string[] {
+  const grams = new Set<string>();
+  words.forEach((word, idx) => {
+    const padded = '  ' + word + (prefix && idx === words.length - 1 ? '' : ' ');
+    for (let pos = 0; pos + 3 <= padded.length; pos++) grams.add(padded.slice(pos, pos + 3));
+  });
+  return Array.from(grams);
+}
+
+export function prepareEmployeeIndex(file: EmployeeIndexFile): EmployeeSearchIndex {
+  const keys = file.employees.map(([id]) => idKey(id));
+  const postings = file.postings.map(deltas => {
+    const numbers = new Int32Array(deltas.length);
+    let number = 0;
+    deltas.forEach((delta, idx) => { number += delta; numbers[idx] = number; });
+    return numbers;
+  });
+  return {
+    file,
+    keys,
+    numbers: file.by_number.map(idx => idNumber(keys[idx])),
+    postings,
+    lookup: new Map(file.trigrams.map((gram, idx) => [gram, idx])),
+    names: file.employees.map(([, name]) => normalizeName(name).join(' ')),
+    hits: new Uint16Array(file.employees.length),
+  };
+}
+
+export function loadEmployeeIndex(tenantId: string): EmployeeSearchIndex | null {
+  const file = `${getTenantDataDir(tenantId)}/employee_index.json`;
+  let mtimeMs: number;
+  try {
+    // @ts-ignore - Dynamic file paths required for multi-tenant architecture
+    mtimeMs = fs.statSync(file).mtimeMs;
+  } catch {
+    return null;
+  }
+  const cached = indexCache.get(file);
+  if (cached && cached.mtimeMs === mtimeMs) return cached.index;
+
+  let index: EmployeeSearchIndex | null = null;
+  try {
+    // @ts-ignore - Dynamic file paths required for multi-tenant architecture
+    const parsed = JSON.parse(fs.readFileSync(file, 'utf-8'));
+    if (parsed && parsed.v === 1) index = prepareEmployeeIndex(parsed as EmployeeIndexFile);
+  } catch {
+    index = null;
+  }
+  indexCache.set(file, { mtimeMs, index });
+  return index;
+}
+
+function prefixRange(keys: string[], prefix: string): [number, number] {
+  const lowerBound = (value: string, lo: number) => {
+    let hi = keys.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (keys[mid] < value) lo = mid + 1;
+      else hi = mid;
+    }
+    return lo;
+  };
+  const start = lowerBound(prefix, 0);
+  return [start, lowerBound(prefix + '￿', start)];
+}
+
+/**
+ * Employee numbers whose ID starts with the query, or whose ID number does, in ID order
+ */
+export function searchIds(index: EmployeeSearchIndex, query: string, limit = 10): number[] {
+  const key = idKey(query);
+  if (!key) return [];
+  const [start, end] = prefixRange(index.keys, key);
+  const found: number[] = [];
+  for (let pos = start; pos < end && found.length < limit; pos++) found.push(pos);
+  if (found.length < limit && /^\d+$/.test(key)) {
+    const [first, last] = prefixRange(index.numbers, key);
+    for (let pos = first; pos < last && pos < first + limit; pos++) found.push(index.file.by_number[pos]);
+    return Array.from(new Set(found)).sort((a, b) => a - b).slice(0, limit);
+  }
+  return found;
+}
+
+/**
+ * Employee numbers of names sharing enough of the query's trigrams, best first: by
+ * trigrams shared, then names starting with the query, then ID
+ */
+export function searchNames(index: EmployeeSearchIndex, query: string, limit = 10): number[] {
+  const words = normalizeName(query);
+  const grams = trigrams(words, true);
+  const lists = grams.filter(gram => index.lookup.has(gram)).map(gram => index.postings[index.lookup.get(gram)!]);
+  const needed = grams.length <= EXACT_TRIGRAMS ? grams.length : Math.max(1, Math.ceil(grams.length * MIN_SCORE));
+  if (!grams.length || lists.length < needed) return [];
+
+  const { hits, names } = index;
+  const touched: number[] = [];
+  for (const numbers of lists) {
+    for (let idx = 0; idx < numbers.length; idx++) {
+      const number = numbers[idx];
+      if (hits[number]++ === 0) touched.push(number);
+    }
+  }
+  // Candidates grouped by trigrams shared; only the tiers used get sorted into ID order
+  const tiers: number[][] = Array.from({ length: lists.length + 1 }, () => []);
+  for (const number of touched) {
+    if (hits[number] >= needed) tiers[hits[number]].push(number);
+    hits[number] = 0;
+  }
+  const phrase = words.join(' ');
+  const results: number[] = [];
+  for (let count = lists.length; count >= needed && results.length < limit; count--) {
+    const leading: number[] = [];
+    const others: number[] = [];
+    for (const number of tiers[count].sort((a, b) => a - b)) {
+      if (names[number].startsWith(phrase)) {
+        leading.push(number);
+        if (results.length + leading.length >= limit) break;
+      } else if (results.length + others.length < limit) {
+        others.push(number);
+      }
+    }
+    results.push(...leading, ...others);
+  }
+  return results.slice(0, limit);
+}
+
+/**
+ * Best matches for what was typed in the employee search box
+ */
+export function searchEmployees(index: EmployeeSearchIndex, query: string, limit = 10): EmployeeMatch[] {
+  const numbers = /\d/.test(query) ? searchIds(index, query, limit) : searchNames(index, query, limit);
+  return numbers.map(number => {
+    const [id, name, team] = index.file.employees[number];
+    return { id, name, team: index.file.teams[team] };
+  });
+}
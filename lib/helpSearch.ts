@@ -0,0 +1,76 @@
+/**
+ * In-app help search over the index written next to the user manual
+ * (USER_MANUAL.search.json, built by search_index.py).
+ */
+
+export interface HelpSearchIndex {
+  v: number;
+  sections: [string, string][];        // [anchor, title]
+  docs: [number, 'h' | 'f' | 'p', string][]; // [section number, kind, snippet]
+  terms: string[];                     // sorted
+  postings: number[][];                // delta-encoded doc numbers, aligned with terms
+}
+
+export interface HelpSearchResult {
+  anchor: string;
+  section: string;
+  kind: 'h' | 'f' | 'p';
+  snippet: string;
+}
+
+const KIND_WEIGHTS: Record<string, number> = { h: 3, f: 2, p: 1 };
+
+// Must match STOPWORDS in search_index.py
+const STOPWORDS = new Set(
+  'a an and are as at be by can for from how i if in is it of on or the this to will with you your'.split(' ')
+);
+
+export function tokenize(text: string): string[] {
+  const tokens = text.toLowerCase().match(/[\p{L}\p{N}\p{M}_]+/gu) || [];
+  return tokens.filter(t => t.length > 1 && !STOPWORDS.has(t));
+}
+
+function lowerBound(terms: string[], prefix: string): number {
+  let lo = 0;
+  let hi = terms.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (terms[mid] < prefix) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+function prefixDocs(index: HelpSearchIndex, prefix: string): Set<number> {
+  const found = new Set<number>();
+  for (let pos = lowerBound(index.terms, prefix); pos < index.terms.length && index.terms[pos].startsWith(prefix); pos++) {
+    let docId = 0;
+    for (const delta of index.postings[pos]) {
+      docId += delta;
+      found.add(docId);
+    }
+  }
+  return found;
+}
+
+/**
+ * Entries matching every query word as a prefix, best first
+ */
+export function searchHelp(index: HelpSearchIndex, query: string, limit = 10): HelpSearchResult[] {
+  const words = tokenize(query);
+  if (!words.length) return [];
+  let matches: Set<number> | null = null;
+  for (const word of words) {
+    const docs = prefixDocs(index, word);
+    matches = matches === null ? docs : new Set(Array.from(matches).filter(d => docs.has(d)));
+    if (!matches.size) return [];
+  }
+  return Array.from(matches!)
+    .sort((a, b) => (KIND_WEIGHTS[index.docs[b][1]] - KIND_WEIGHTS[index.docs[a][1]]) || a - b)
+    .slice(0, limit)
+    .map(docId => {
+      const [sectionNo, kind, snippet] = index.docs[docId];
+      const [anchor, section] = index.sections[sectionNo];
+      return { anchor, section, kind, snippet };
+    });
+}
@@ -0,0 +1,84 @@
+/**
+ * Swap partner lookup over the per-date shards written by swap_index.py
+ * (data/tenants/<id>/swap_index/<date>.json). Only the shard of the requested
+ * date is read, and shards are cached until the file changes.
+ */
+
+import fs from 'fs';
+import { getTenantDataDir } from './constants';
+
+export interface SwapShard {
+  v: number;
+  date: string;                                   // sheet header, e.g. "1Oct"
+  codes: string[];                                // shift codes; bit i of a mask is codes[i]
+  teams: Record<string, Record<string, [string, number][]>>; // team -> shift -> [employee ID, mask]
+}
+
+export interface SwapCandidate {
+  employeeId: string;
+  team: string;
+  shift: string;      // the candidate's shift, which the requester would take
+  ownShift: string;   // the requester's shift, which the candidate would take
+}
+
+const shardCache = new Map<string, { mtimeMs: number; shard: SwapShard | null }>();
+
+// Must match shard_name() in swap_index.py
+export function shardFile(tenantId: string, date: string): string {
+  return `${getTenantDataDir(tenantId)}/swap_index/${date.replace(/[^A-Za-z0-9_-]/g, '_')}.json`;
+}
+
+export function loadSwapShard(tenantId: string, date: string): SwapShard | null {
+  const file = shardFile(tenantId, date);
+  let mtimeMs: number;
+  try {
+    // @ts-ignore - Dynamic file paths required for multi-tenant architecture
+    mtimeMs = fs.statSync(file).mtimeMs;
+  } catch {
+    return null;
+  }
+  const cached = shardCache.get(file);
+  if (cached && cached.mtimeMs === mtimeMs) return cached.shard;
+
+  let shard: SwapShard | null = null;
+  try {
+    // @ts-ignore - Dynamic file paths required for multi-tenant architecture
+    const parsed = JSON.parse(fs.readFileSync(file, 'utf-8'));
+    if (parsed && parsed.v === 1 && parsed.date === date) shard = parsed as SwapShard;
+  } catch {
+    shard = null;
+  }
+  shardCache.set(file, { mtimeMs, shard });
+  return shard;
+}
+
+/**
+ * Teammates the employee can swap with on the shard's date: they work a different
+ * shift, and both keep the minimum rest around the swapped shifts
+ */
+export function swapCandidates(shard: SwapShard, employeeId: string): SwapCandidate[] {
+  for (const [team, shifts] of Object.entries(shard.teams)) {
+    for (const [ownShift, entries] of Object.entries(shifts)) {
+      const own = entries.find(([id]) => id === employeeId);
+      if (!own) continue;
+      const ownBit = shard.codes.indexOf(ownShift);
+      const found: SwapCandidate[] = [];
+      shard.codes.forEach((shift, bit) => {
+        if (!((own[1] >> bit) & 1)) return;
+        for (const [id, mask] of shifts[shift] || []) {
+          if ((mask >> ownBit) & 1) found.push({ employeeId: id, team, shift, ownShift });
+        }
+      });
+      return found;
+    }
+  }
+  return [];
+}
+
+/**
+ * Swap candidates for an employee on a date, or null when no index has been built for it
+ */
+export function findSwapCandidates(tenantId: string, date: string, employeeId: string): SwapCandidate[] | null {
+  const shard = loadSwapShard(tenantId, date);
+  return shard ? swapCandidates(shard, employeeId) : null;
+}
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Manual Content Specs for the Cartup CxP Roster Management System manual.
+The manual's structured content (table of contents, feature lists, API endpoints, FAQ
+entries, shift code descriptions and quick actions) lives in YAML files under
+manual_content/ so it can be edited without touching generate_manual.py. The specs are
+validated against SCHEMA and compiled into a marshal file under .cache/manual_content/
+keyed by a hash of the spec files, so unchanged specs are neither parsed nor validated
+again.
+
+    python manual_content.py    # validate the specs and refresh the compiled cache
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+
+import yaml
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+CONTENT_DIR = os.path.join(ROOT_DIR, 'manual_content')
+CACHE_DIR = os.path.join(ROOT_DIR, '.cache', 'manual_content')
+
+# Bump when SCHEMA or the compiled layout changes so old caches are not reused
+SCHEMA_VERSION = 1
+
+# Value types: TEXT is prose shown to readers (translated with _()), STRING is shown
+# verbatim, PAYLOAD is an API request/response: verbatim when it is a JSON literal,
+# otherwise prose. A tuple is a choice of strings, [item] a non-empty list of item and a
+# dict an object whose keys are required unless they end in "?".
+TEXT = 'text'
+STRING = 'string'
+PAYLOAD = 'payload'
+
+TOC_ENTRY = {'number': STRING, 'title': TEXT, 'page': STRING}
+ACTION = {'action': TEXT, 'how_to': TEXT}
+
+SCHEMA = {
+    'toc': {
+        'items': [TOC_ENTRY],
+        'tenant_items': [TOC_ENTRY],
+    },
+    'features': {
+        'panels': [{'name': TEXT, 'description': TEXT}],
+        'client': [TEXT],
+        'admin': [TEXT],
+    },
+    'api': {
+        'sections': [{
+            'heading': TEXT,
+            'layout': ('inline', 'block'),
+            'endpoints': [{
+                'endpoint': STRING,
+                'description': TEXT,
+                'auth?': TEXT,
+                'params?': TEXT,
+                'request?': PAYLOAD,
+                'response': PAYLOAD,
+            }],
+        }],
+    },
+    'faq': {
+        'sections': [{'heading': TEXT, 'entries': [{'q': TEXT, 'a': TEXT}]}],
+        'troubleshooting': [{'issue': TEXT, 'solution': TEXT}],
+    },
+    'appendix': {
+        'shift_codes': [{'code': STRING, 'description': TEXT}],
+        'client_actions': [ACTION],
+        'admin_actions': [ACTION],
+    },
+}
+
+class ContentError(ValueError):
+    """A spec file does not match SCHEMA"""
+
+# Compiled content of this process keyed by spec digest
+_loaded = {}
+
+def spec_path(name, content_dir=CONTENT_DIR):
+    """Spec file of one SCHEMA entry"""
+    return os.path.join(content_dir, f'{name}.yaml')
+
+def is_payload_literal(value):
+    """True for PAYLOAD values that are JSON literals and are shown verbatim"""
+    return value.lstrip().startswith(('{', '['))
+
+def validate(value, schema, path):
+    """Raise ContentError if `value` does not match `schema`; `path` locates it in errors"""
+    if isinstance(schema, dict):
+        if not isinstance(value, dict):
+            raise ContentError(f'{path}: expected a mapping')
+        keys = {key.rstrip('?') for key in schema}
+        unknown = sorted(set(value) - keys)
+        if unknown:
+            raise ContentError(f'{path}: unknown key "{unknown[0]}"')
+        for key, item_schema in schema.items():
+            name = key.rstrip('?')
+            if name in value:
+                validate(value[name], item_schema, f'{path}.{name}')
+            elif not key.endswith('?'):
+                raise ContentError(f'{path}: missing key "{name}"')
+    elif isinstance(schema, list):
+        if not isinstance(value, list) or not value:
+            raise ContentError(f'{path}: expected a non-empty list')
+        for idx, item in enumerate(value):
+            validate(item, schema[0], f'{path}[{idx}]')
+    elif isinstance(schema, tuple):
+        if value not in schema:
+            raise ContentError(f'{path}: expected one of {", ".join(schema)}')
+    elif not isinstance(value, str) or (schema != STRING and not value.strip()):
+        raise ContentError(f'{path}: expected a non-empty string')
+
+def iter_messages(value, schema):
+    """Translatable strings of a validated spec, in file order"""
+    if isinstance(schema, dict):
+        for key, item_schema in schema.items():
+            if key.rstrip('?') in value:
+                yield from iter_messages(value[key.rstrip('?')], item_schema)
+    elif isinstance(schema, list):
+        for item in value:
+            yield from iter_messages(item, schema[0])
+    elif schema == TEXT or (schema == PAYLOAD and not is_payload_literal(value)):
+        yield value
+
+def spec_digest(content_dir=CONTENT_DIR):
+    """Hash of every spec file and the schema version"""
+    digest = hashlib.sha256(f'schema-{SCHEMA_VERSION}'.encode())
+    for name in SCHEMA:
+        with open(spec_path(name, content_dir), 'rb') as f:
+            data = f.read()
+        digest.update(f'{name}:{len(data)}:'.encode())
+        digest.update(data)
+    return digest.hexdigest()
+
+def compile_content(content_dir=CONTENT_DIR):
+    """Parse and validate every spec file: {name: content}"""
+    content = {}
+    for name, schema in SCHEMA.items():
+        path = spec_path(name, content_dir)
+        with open(path, 'r', encoding='utf-8') as f:
+            try:
+                data = yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise ContentError(f'{path}: {e}') from e
+        validate(data, schema, os.path.basename(path))
+        content[name] = data
+    return content
+
+def load_content(content_dir=CONTENT_DIR):
+    """Validated manual content, from the compiled cache while the spec files are unchanged.
+
+    The returned dict is shared between callers and must be treated as read-only.
+    """
+    digest = spec_digest(content_dir)
+    if digest in _loaded:
+        return _loaded[digest]
+
+    compiled = os.path.join(CACHE_DIR, f'{digest}.marshal')
+    try:
+        with open(compiled, 'rb') as f:
+            content = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        content = compile_content(content_dir)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f'{compiled}.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as f:
+            marshal.dump(content, f)
+        os.replace(tmp, compiled)
+        # Only the current specs' compilation is worth keeping
+        for name in os.listdir(CACHE_DIR):
+            if name.endswith('.marshal') and name != os.path.basename(compiled):
+                try:
+                    os.remove(os.path.join(CACHE_DIR, name))
+                except OSError:
+                    pass
+
+    _loaded[digest] = content
+    return content
+
+def content_messages(content_dir=CONTENT_DIR):
+    """Translatable strings of every spec file, for the message catalogs"""
+    content = load_content(content_dir)
+    messages = []
+    for name, schema in SCHEMA.items():
+        messages.extend(iter_messages(content[name], schema))
+    return messages
+
+if __name__ == '__main__':
+    try:
+        compile_content()
+    except (OSError, ContentError) as e:
+        sys.exit(f'❌ {e}')
+    load_content()
+    for name in SCHEMA:
+        print(f"✅ {os.path.relpath(spec_path(name), ROOT_DIR)}")
+    print(f"📦 Compiled into {os.path.relpath(CACHE_DIR, ROOT_DIR)}/{spec_digest()}.marshal")
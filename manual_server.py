@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Manual Build Server for the Cartup CxP Roster Management System.
+A long-lived local service that builds a tenant's manual on demand for the admin panel's
+"Download manual" button. python-docx, the content specs, the message catalogs and the
+screenshots stay loaded between requests, and built chapters are kept as fragments:
+chapters that do not depend on tenant data are built once per locale and version of
+the content, catalogs, screenshots and code, the others also once per version of the
+tenant's data. Manuals are built in memory; finished ones are kept
+in the artifact store (.cache/artifacts) under the fingerprint of their inputs, so
+repeat downloads are served without rebuilding.
+
+    python manual_server.py                        # http://127.0.0.1:8765
+    python manual_server.py --socket /tmp/manual.sock
+
+    GET /manual?tenant=<id>&locale=bn   -> DOCX
+    GET /health                         -> JSON status
+"""
+
+import argparse
+import io
+import json
+import os
+import re
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from artifact_store import ArtifactStore, STORE_DIR, DEFAULT_MAX_BYTES
+from generate_manual import build_manual, chapter_inputs, manual_fingerprint
+from i18n import available_locales, set_locale, DEFAULT_LOCALE
+from manual_content import load_content
+from package_writer import save_document, DEFAULT_XML_LEVEL
+from size_report import parse_size
+from tenant_data import DATA_DIR
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+DOCX_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+TENANT_ID_RE = re.compile(r'^[A-Za-z0-9_-]+$')
+
+class ManualBuilder:
+    """Builds manuals in memory, reusing chapter fragments between builds.
+
+    With an ArtifactStore, finished manuals are cached under the fingerprint of their
+    inputs and concurrent requests for the same manual share one build.
+    """
+
+    def __init__(self, data_dir=DATA_DIR, xml_level=DEFAULT_XML_LEVEL, store=None):
+        self.data_dir = data_dir
+        self.xml_level = xml_level
+        self.store = store
+        self.fragments = {}
+        self.builds = 0
+        # The active locale is process-wide, so builds run one at a time
+        self._lock = threading.Lock()
+
+    def warm(self):
+        """Load content and catalogs and build the shared chapters of every locale"""
+        load_content()
+        for locale in available_locales():
+            self._build(None, locale)
+
+    def build(self, tenant_id=None, locale=DEFAULT_LOCALE):
+        """The manual for a tenant (or the generic manual) as DOCX bytes"""
+        if self.store is None:
+            return self._build(tenant_id, locale)
+        key = manual_fingerprint(tenant_id, self.data_dir, locale, self.xml_level) + '.docx'
+        return self.store.get_or_build(key, lambda: self._build(tenant_id, locale))
+
+    def _build(self, tenant_id, locale):
+        """Build a manual, one build at a time"""
+        with self._lock:
+            set_locale(locale)
+            doc = build_manual(tenant_id, self.data_dir, jobs=1, fragments=self.fragments)
+            self._prune(tenant_id, locale)
+            stream = io.BytesIO()
+            save_document(doc, stream, self.xml_level)
+            self.builds += 1
+            return stream.getvalue()
+
+    def _prune(self, tenant_id, locale):
+        """Drop fragments of this locale built from older content, catalogs, screenshots or
+        code, and fragments built from older versions of this tenant's data"""
+        inputs = chapter_inputs(locale)
+        for key in [key for key in self.fragments if key[1] == locale and key[2] != inputs]:
+            del self.fragments[key]
+        keys = [key for key in self.fragments if len(key) == 5 and key[3] == tenant_id]
+        if not keys:
+            return
+        # Dicts keep insertion order, so the last key comes from the newest data
+        newest = keys[-1][4]
+        for key in keys:
+            if key[4] != newest:
+                del self.fragments[key]
+
+class ManualRequestHandler(BaseHTTPRequestHandler):
+    """GET /manual and GET /health"""
+
+    server_version = 'CartupManual/1.0'
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == '/health':
+            builder = self.server.builder
+            self._send_json(200, {
+                'ok': True,
+                'builds': builder.builds,
+                'fragments': len(builder.fragments),
+                'store': builder.store.stats() if builder.store else None,
+                'locales': available_locales(),
+            })
+        elif url.path == '/manual':
+            self._send_manual(parse_qs(url.query))
+        else:
+            self._send_json(404, {'error': 'Not found'})
+
+    def _send_manual(self, query):
+        tenant_id = query.get('tenant', [''])[0] or None
+        locale = query.get('locale', [DEFAULT_LOCALE])[0]
+        if tenant_id and not TENANT_ID_RE.match(tenant_id):
+            self._send_json(400, {'error': 'Invalid tenant id'})
+            return
+        if locale not in available_locales():
+            self._send_json(400, {'error': f'Unknown locale: {locale}'})
+            return
+
+        start = time.perf_counter()
+        try:
+            body = self.server.builder.build(tenant_id, locale)
+        except FileNotFoundError as e:
+            self._send_json(404, {'error': str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {'error': f'Manual build failed: {e}'})
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        filename = f"{tenant_id or 'cartup'}-user-manual.{locale}.docx"
+        self.send_response(200)
+        self.send_header('Content-Type', DOCX_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Content-Disposition', f'attachment; filename="{filename}"')
+        self.send_header('X-Build-Time-Ms', f'{elapsed_ms:.0f}')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status, data):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # Unix socket clients have no address
+        return self.client_address[0] if self.client_address else 'unix'
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP over a Unix domain socket"""
+    daemon_threads = True
+
+def make_server(builder, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None):
+    """HTTP server for `builder` on localhost or on a Unix socket"""
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = ThreadingUnixHTTPServer(socket_path, ManualRequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), ManualRequestHandler)
+    server.builder = builder
+    return server
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serve on-demand manual builds to the admin panel')
+    parser.add_argument('--host', default=DEFAULT_HOST, help='Address to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=int(os.environ.get('MANUAL_SERVER_PORT', DEFAULT_PORT)),
+                        help='Port to listen on (default: 8765 or $MANUAL_SERVER_PORT)')
+    parser.add_argument('--socket', default=os.environ.get('MANUAL_SERVER_SOCKET'),
+                        help='Listen on this Unix socket instead (default: $MANUAL_SERVER_SOCKET)')
+    parser.add_argument('--data-dir', default=DATA_DIR, help='Application data directory (default: data)')
+    parser.add_argument('--no-warm', action='store_true', help='Skip building the shared chapters at startup')
+    parser.add_argument('--store', default=STORE_DIR, help='Artifact store directory (default: .cache/artifacts)')
+    parser.add_argument('--store-size', type=parse_size, default=DEFAULT_MAX_BYTES,
+                        help='Artifact store size limit, e.g. 2GB (default: 512MB)')
+    parser.add_argument('--no-store', action='store_true', help='Build every request instead of caching manuals')
+    args = parser.parse_args()
+
+    # Screenshot paths in the manual are relative to the repository root
+    os.chdir(ROOT_DIR)
+    store = None if args.no_store else ArtifactStore(args.store, args.store_size)
+    builder = ManualBuilder(args.data_dir, store=store)
+    if not args.no_warm:
+        start = time.perf_counter()
+        builder.warm()
+        print(f"🔥 Warmed up {len(builder.fragments)} chapters in {time.perf_counter() - start:.1f}s")
+
+    server = make_server(builder, args.host, args.port, args.socket)
+    print(f"📘 Manual server listening on {args.socket or f'http://{args.host}:{args.port}'}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.remove(args.socket)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+DOCX Package Writer for the Cartup CxP manual generator.
+Saves a python-docx Document like Document.save(), but with a per-part compression
+policy: images that are already compressed (PNG, JPEG, ...) are stored as they are,
+XML parts are deflated at a configurable level, and parts are compressed in parallel
+threads (zlib releases the GIL while it compresses).
+"""
+
+import os
+import struct
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from docx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from docx.opc.pkgwriter import _ContentTypesItem
+
+DEFAULT_XML_LEVEL = 6
+
+# Formats whose data is already compressed; deflating them again costs time and saves nothing
+STORED_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.wdp', '.mp4', '.zip'})
+
+ZIP_STORED = 0
+ZIP_DEFLATED = 8
+ZIP_VERSION = 20
+ZIP_FLAG_UTF8 = 0x800
+ZIP_LIMIT = 0xFFFFFFFF
+
+def package_members(doc):
+    """(member name, bytes) of every item of the package, in the order Document.save writes them"""
+    package = doc.part.package
+    parts = list(package.parts)
+    for part in parts:
+        part.before_marshal()
+    members = [
+        (CONTENT_TYPES_URI.membername, _ContentTypesItem.from_parts(parts).blob),
+        (PACKAGE_URI.rels_uri.membername, package.rels.xml),
+    ]
+    for part in parts:
+        members.append((part.partname.membername, part.blob))
+        if len(part.rels):
+            members.append((part.partname.rels_uri.membername, part.rels.xml))
+    return members
+
+def compression_level(name, xml_level=DEFAULT_XML_LEVEL):
+    """Deflate level for a package member, or None to store it uncompressed"""
+    if os.path.splitext(name)[1].lower() in STORED_EXTENSIONS or xml_level == 0:
+        return None
+    return xml_level
+
+def compress_member(name, data, xml_level=DEFAULT_XML_LEVEL):
+    """(name, method, crc, raw size, stored bytes) for one member"""
+    crc = zlib.crc32(data)
+    level = compression_level(name, xml_level)
+    if level is not None:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        deflated = compressor.compress(data) + compressor.flush()
+        if len(deflated) < len(data):
+            return name, ZIP_DEFLATED, crc, len(data), deflated
+    return name, ZIP_STORED, crc, len(data), data
+
+def _dos_time(timestamp):
+    """(time, date) fields of a zip entry"""
+    t = time.localtime(timestamp)
+    return (
+        (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2),
+        ((max(t.tm_year, 1980) - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday,
+    )
+
+def write_zip(stream, entries, timestamp=None):
+    """Write already-compressed `entries` from compress_member() as a zip archive to `stream`"""
+    dos_time, dos_date = _dos_time(timestamp or time.time())
+    central = []
+    offset = 0
+    for name, method, crc, size, data in entries:
+        encoded = name.encode('utf-8')
+        if size > ZIP_LIMIT or offset > ZIP_LIMIT:
+            raise ValueError(f'{name}: package too large for a zip without ZIP64')
+        header = struct.pack(
+            '<4s5H3L2H', b'PK\x03\x04', ZIP_VERSION, ZIP_FLAG_UTF8, method, dos_time, dos_date,
+            crc, len(data), size, len(encoded), 0,
+        )
+        stream.write(header)
+        stream.write(encoded)
+        stream.write(data)
+        central.append(struct.pack(
+            '<4s6H3L5H2L', b'PK\x01\x02', ZIP_VERSION, ZIP_VERSION, ZIP_FLAG_UTF8, method, dos_time,
+            dos_date, crc, len(data), size, len(encoded), 0, 0, 0, 0, 0, offset,
+        ) + encoded)
+        offset += len(header) + len(encoded) + len(data)
+
+    directory = b''.join(central)
+    stream.write(directory)
+    stream.write(struct.pack(
+        '<4s4H2LH', b'PK\x05\x06', 0, 0, len(central), len(central), len(directory), offset, 0,
+    ))
+
+def save_document(doc, target, xml_level=DEFAULT_XML_LEVEL, jobs=None):
+    """Save `doc` to a path or binary stream using the per-part compression policy"""
+    members = package_members(doc)
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        entries = list(pool.map(lambda member: compress_member(*member, xml_level), members))
+
+    if hasattr(target, 'write'):
+        write_zip(target, entries)
+        return
+    tmp = f'{target}.{os.getpid()}.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            write_zip(f, entries)
+    except BaseException:
+        os.remove(tmp)
+        raise
+    os.replace(tmp, target)
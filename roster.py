@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Roster Sheets for the Cartup CxP Roster Management System.
+Reads and writes rosters in the layout of the published Google Sheets (see
+"Roster - Sheet2 (1).csv"): a row of day names, a header row (Employee ID, 1Oct, 2Oct,
+..., then per-employee summary count columns), one row per employee with the team name
+only on the first row of each team, and per-code daily count rows at the bottom.
+Parsing and merging mirror parseOne() and merge() in lib/googleSync.ts, so Python tools
+see the same RosterData as the app. roster_grid() turns a roster into a NumPy code
+matrix for the analysis tools.
+"""
+
+import codecs
+import csv
+import datetime
+import io
+import re
+
+import numpy as np
+
+from tenant_data import is_date_header
+
+# Per-employee count columns after the date columns, as in the published sheet
+# (M4 appears twice there)
+SUMMARY_CODES = ['HL', 'M3', 'M4', 'D2', 'M2', 'M4', 'D1', 'G', 'DO', 'SL', 'EL']
+
+# Daily count rows below the employees: (label, codes counted)
+FOOTER_ROWS = [
+    ('M2   (8 AM to 5PM)', ('M2',)),
+    ('G     (9 AM to 6PM)', ('G',)),
+    ('M3 ( 9 AM to 6PM)', ('M3',)),
+    ('M4   (10 AM to 7PM)', ('M4',)),
+    ('D1    (12 PM to 9PM)', ('D1',)),
+    ('D2    (1PM to 10 PM)', ('D2',)),
+    ('DO    (OFF)', ('DO',)),
+    ('SL    (Sick Leave)', ('SL',)),
+    ('Sum', ('M2', 'G', 'M3', 'M4', 'D1', 'D2', 'DO', 'SL')),
+    ('Lunch Count', ('M2', 'G', 'M3', 'M4', 'D1', 'D2')),
+    ('Snacks', ('D1', 'D2')),
+]
+
+# Shift definitions like "8 AM – 5 PM" or "9:30 AM - 6:30 PM"
+SHIFT_TIME_RE = re.compile(
+    r'(\d{1,2})(?::(\d{2}))?\s*(AM|PM)\s*[–—-]\s*(\d{1,2})(?::(\d{2}))?\s*(AM|PM)', re.I,
+)
+
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+def empty_roster():
+    """RosterData with no employees"""
+    return {'teams': {}, 'headers': [], 'allEmployees': []}
+
+def read_csv_rows(text):
+    """Rows of a CSV export with trimmed cells and blank lines skipped, like parseCsv()"""
+    if text.startswith('\ufeff'):
+        text = text[1:]
+    return [[cell.strip() for cell in row] for row in csv.reader(io.StringIO(text)) if row]
+
+class RosterParser:
+    """Builds the RosterData of one published sheet from CSV fed in pieces (e.g. as an HTTP
+    body arrives), mirroring parseOne()"""
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        self._pending = ''
+        self._rows = 0
+        self._team = ''
+        self.headers = []
+        self.teams = {}
+
+    def feed(self, data):
+        """Parse every complete record in `data` (bytes or str) and keep the rest for later"""
+        text = self._pending + (self._decoder.decode(data) if isinstance(data, bytes) else data)
+        end = text.rfind('\n')
+        # A quoted cell may span lines, so stop at the last line break outside quotes
+        while end >= 0 and text.count('"', 0, end) % 2:
+            end = text.rfind('\n', 0, end)
+        if end < 0:
+            self._pending = text
+            return self
+        self._pending = text[end + 1:]
+        self._parse(text[:end + 1])
+        return self
+
+    def _parse(self, text):
+        if self._rows == 0 and text.startswith('\ufeff'):
+            text = text[1:]
+        rows = self._rows
+        team = self._team
+        teams = self.teams
+        members = teams.get(team)
+        for row in csv.reader(io.StringIO(text)):
+            if not row:
+                continue
+            rows += 1
+            if rows > 2:
+                if len(row) < 4:
+                    continue
+                cols = [cell.strip() for cell in row]
+                # The team name is only filled in on the first row of each team
+                if cols[0] or members is None:
+                    team = cols[0] or team
+                    members = teams.setdefault(team, [])
+                if cols[1] and cols[2]:
+                    members.append({
+                        'name': cols[1],
+                        'id': cols[2],
+                        'team': team,
+                        'currentTeam': team,
+                        'schedule': cols[3:],
+                    })
+            elif rows == 2:
+                self.headers = [cell.strip() for cell in row[3:]]
+        self._rows = rows
+        self._team = team
+
+    def close(self):
+        """RosterData of everything fed"""
+        self._parse(self._pending + self._decoder.decode(b'', final=True))
+        self._pending = ''
+        if self._rows < 3:
+            return empty_roster()
+        return {
+            'teams': self.teams,
+            'headers': self.headers,
+            'allEmployees': [emp for members in self.teams.values() for emp in members],
+        }
+
+def parse_roster_csv(text):
+    """RosterData of one published sheet, mirroring parseOne()"""
+    return RosterParser().feed(text).close()
+
+def merge_rosters(base, incoming):
+    """Merge one sheet into an aggregated roster in place, mirroring merge()"""
+    positions = {header: idx for idx, header in enumerate(base['headers'])}
+    for header in incoming['headers']:
+        if header not in positions:
+            positions[header] = len(base['headers'])
+            base['headers'].append(header)
+    targets = [positions[header] for header in incoming['headers']]
+
+    for team_name, employees in incoming['teams'].items():
+        members = base['teams'].setdefault(team_name, [])
+        by_id = {emp['id']: emp for emp in members}
+        for emp in employees:
+            existing = by_id.get(emp['id'])
+            if existing is None:
+                existing = dict(emp, schedule=[''] * len(base['headers']))
+                members.append(existing)
+                by_id[emp['id']] = existing
+            schedule = existing['schedule']
+            if len(schedule) < len(base['headers']):
+                schedule.extend([''] * (len(base['headers']) - len(schedule)))
+            for src, dst in enumerate(targets):
+                schedule[dst] = emp['schedule'][src] if src < len(emp['schedule']) else ''
+
+    base['allEmployees'] = []
+    for team_name, members in base['teams'].items():
+        for emp in members:
+            emp['currentTeam'] = team_name
+            base['allEmployees'].append(emp)
+    return base
+
+def date_header(day):
+    """Sheet header of a date: 2025-10-01 -> "1Oct" """
+    return f'{day.day}{MONTHS[day.month - 1]}'
+
+def header_dates(headers, year=None, today=None):
+    """Dates of "1Oct"-style headers, moving to the next year when the month wraps around.
+
+    Sheet headers carry no year; without `year` the roster is taken to end no more than a
+    few months after `today`.
+    """
+    if year is None:
+        today = today or datetime.date.today()
+        dates = header_dates(headers, today.year)
+        if dates and dates[-1] > today + datetime.timedelta(days=120):
+            dates = header_dates(headers, today.year - 1)
+        return dates
+    dates = []
+    previous = None
+    for header in headers:
+        digits = ''.join(ch for ch in header.strip()[:2] if ch.isdigit())
+        month = MONTHS.index(header.strip()[len(digits):].strip('-. ')[:3].title()) + 1
+        if previous and month < previous.month:
+            year += 1
+        previous = datetime.date(year, month, int(digits))
+        dates.append(previous)
+    return dates
+
+def normalize_code(code):
+    """Shift code as the app compares it"""
+    return (code or '').strip().upper()
+
+def _minutes(hour, minute, meridiem):
+    """Minutes after midnight of a 12-hour clock time"""
+    return (int(hour) % 12 + (12 if meridiem.upper() == 'PM' else 0)) * 60 + int(minute or 0)
+
+def shift_times(definitions):
+    """{code: (start, end)} in minutes after midnight for shift definitions with times.
+
+    Shifts that end after midnight get an end past 1440. Codes without times (days off,
+    leave) are left out.
+    """
+    times = {}
+    for code, definition in definitions.items():
+        match = SHIFT_TIME_RE.search(definition or '')
+        if match:
+            start = _minutes(*match.group(1, 2, 3))
+            end = _minutes(*match.group(4, 5, 6))
+            times[normalize_code(code)] = (start, end if end > start else end + 1440)
+    return times
+
+def roster_grid(roster):
+    """Employees x dates matrix of shift code numbers for the date columns of a roster.
+
+    Returns a dict with 'dates' (headers), 'employees' ({id, name, team}), 'teams' (names),
+    'team_index' (team number per employee), 'codes' (code of each number, 0 is blank)
+    and 'matrix' (uint8, or uint16 if there are more than 255 distinct codes).
+    """
+    date_idx = [idx for idx, header in enumerate(roster['headers']) if is_date_header(header)]
+    employees = roster['allEmployees']
+    lookup = {'': 0}
+    codes = ['']
+    teams = {}
+    team_index = np.empty(len(employees), dtype=np.int32)
+    cells = []
+    for row, emp in enumerate(employees):
+        schedule = emp.get('schedule', [])
+        cells.append([schedule[idx] if idx < len(schedule) else '' for idx in date_idx])
+        team_index[row] = teams.setdefault(emp.get('currentTeam') or emp.get('team', ''), len(teams))
+
+    numbers = []
+    for row in cells:
+        for code in row:
+            number = lookup.get(code)
+            if number is None:
+                key = normalize_code(code)
+                if key not in lookup:
+                    lookup[key] = len(codes)
+                    codes.append(key)
+                number = lookup[code] = lookup[key]
+            numbers.append(number)
+
+    dtype = np.uint8 if len(codes) <= 256 else np.uint16
+    matrix = np.array(numbers, dtype=dtype).reshape(len(employees), len(date_idx))
+    return {
+        'dates': [roster['headers'][idx] for idx in date_idx],
+        'employees': [{'id': emp.get('id'), 'name': emp.get('name'), 'team': emp.get('currentTeam')} for emp in employees],
+        'teams': list(teams),
+        'team_index': team_index,
+        'codes': codes,
+        'matrix': matrix,
+    }
+
+def grid_days(grid, year=None):
+    """Ordinal day number of each grid column (see header_dates() for `year`)"""
+    if 'days' in grid:
+        return grid['days']
+    return np.array([day.toordinal() for day in header_dates(grid['dates'], year)], dtype=np.int64)
+
+def history_grid(rosters, year=None, today=None):
+    """One roster_grid() over consecutive sheets (e.g. one per month, oldest first).
+
+    Merging sheets would fold "1Oct" of different years into one column, so here each
+    sheet keeps its own columns (see combine_grids()).
+    """
+    return combine_grids([roster_grid(roster) for roster in rosters], year, today)
+
+def combine_grids(grids, year=None, today=None):
+    """One grid over the roster_grid()s of consecutive sheets, oldest first.
+
+    Columns are dated from each grid's 'days' when every grid has them, otherwise by
+    reading all the grids' headers in order. Employees are matched by ID and listed in
+    their latest team. Columns are ISO dates and the grid has a 'days' array of ordinal
+    day numbers; a day found in several sheets is taken from the last one.
+    """
+    if grids and all('days' in grid for grid in grids):
+        days = np.concatenate([grid['days'] for grid in grids]).astype(np.int64)
+    else:
+        dates = header_dates([header for grid in grids for header in grid['dates']], year, today)
+        days = np.array([day.toordinal() for day in dates], dtype=np.int64)
+    rows = {}
+    employees = []
+    codes = ['']
+    lookup = {'': 0}
+    for grid in grids:
+        for emp in grid['employees']:
+            if emp['id'] in rows:
+                employees[rows[emp['id']]] = emp
+            else:
+                rows[emp['id']] = len(employees)
+                employees.append(emp)
+        for code in grid['codes']:
+            if code not in lookup:
+                lookup[code] = len(codes)
+                codes.append(code)
+
+    unique_days, column = np.unique(days, return_inverse=True)
+    dtype = np.uint8 if len(codes) <= 256 else np.uint16
+    matrix = np.zeros((len(employees), len(unique_days)), dtype=dtype)
+    first = 0
+    for grid in grids:
+        count = len(grid['dates'])
+        remap = np.array([lookup[code] for code in grid['codes']], dtype=dtype)
+        targets = np.array([rows[emp['id']] for emp in grid['employees']], dtype=np.int64)
+        block = remap[grid['matrix']]
+        # Blank cells do not overwrite what an earlier sheet had for the day
+        cols = column[first:first + count]
+        existing = matrix[np.ix_(targets, cols)]
+        matrix[np.ix_(targets, cols)] = np.where(block != 0, block, existing)
+        first += count
+
+    teams = {}
+    team_index = np.array([teams.setdefault(emp['team'], len(teams)) for emp in employees], dtype=np.int32)
+    return {
+        'dates': [datetime.date.fromordinal(int(day)).isoformat() for day in unique_days],
+        'days': unique_days,
+        'employees': employees,
+        'teams': list(teams),
+        'team_index': team_index,
+        'codes': codes,
+        'matrix': matrix,
+    }
+
+def code_mask(grid, codes):
+    """Boolean matrix of the grid cells holding any of `codes`"""
+    numbers = [idx for idx, code in enumerate(grid['codes']) if code in codes]
+    return np.isin(grid['matrix'], numbers)
+
+def write_roster_csv(stream, teams, dates, summary=True, footer=True):
+    """Write a roster in the published sheet layout.
+
+    `teams` is a list of (team name, members) where each member is (name, id, codes) with
+    one code per date, or (name, id, codes, summary cells) to write the summary columns
+    as given. `dates` are the datetime.date of the date columns. `footer` may be a dict of
+    {code: daily counts} when the caller already has them.
+    """
+    writer = csv.writer(stream, lineterminator='\n')
+    tail = [''] * (len(SUMMARY_CODES) if summary else 0)
+    writer.writerow(['Team', 'Employee Name', ''] + [day.strftime('%a') for day in dates] + tail)
+    writer.writerow(['', '', 'Employee ID'] + [date_header(day) for day in dates] +
+                    (SUMMARY_CODES if summary else []))
+
+    daily = {} if footer is True else footer
+    for team_name, members in teams:
+        for position, member in enumerate(members):
+            name, emp_id, schedule = member[:3]
+            row = [team_name if position == 0 else '', name, emp_id]
+            row.extend(schedule)
+            if summary:
+                if len(member) > 3:
+                    row.extend(member[3])
+                else:
+                    row.extend(str(sum(1 for code in schedule if code == summary_code)) for summary_code in SUMMARY_CODES)
+            writer.writerow(row)
+            if footer is True:
+                for idx, code in enumerate(schedule):
+                    if code:
+                        counts = daily.setdefault(code, [0] * len(dates))
+                        counts[idx] += 1
+
+    if footer:
+        zeros = [0] * len(dates)
+        for label, codes in FOOTER_ROWS:
+            totals = [sum(day) for day in zip(*(daily.get(code, zeros) for code in codes))]
+            writer.writerow(['', label, ''] + [str(total) for total in totals] + tail)
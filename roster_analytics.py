@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Workload and Fairness Analytics for the Cartup CxP Roster Management System.
+Shows who carries the late shifts, weekends and holiday work. Shift codes are turned into
+hours with the time ranges of the Shift Codes Reference (the tenant's shift definitions),
+and per employee and per team we compute total hours, the share of late shifts, weekend
+and holiday shifts, leave taken (SL/CL/EL/HL) and the busiest rolling 7-day and 28-day
+loads. Rolling windows are cumulative sums over a day-by-day hours matrix, computed for
+blocks of employees at a time so multi-year histories fit in memory.
+
+    python roster_analytics.py roster_2024-*.csv roster_2025-*.csv
+    python roster_analytics.py --tenant <tenant-id> --weekend Fri Sat -o workload.csv
+"""
+
+import argparse
+import csv
+
+import numpy as np
+
+from roster import combine_grids, grid_days, roster_grid, shift_times
+from tenant_data import DATA_DIR, DEFAULT_SHIFT_DEFINITIONS, load_tenant
+
+LEAVE_CODES = ['SL', 'CL', 'EL', 'HL']
+WINDOWS = [7, 28]
+DAY_NAMES = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+# Friday and Saturday, the weekend in Bangladesh
+DEFAULT_WEEKEND = (4, 5)
+# Shifts ending after 8 PM (D1, D2) are late shifts
+DEFAULT_LATE_END = 20 * 60
+# Employees per block of the day-by-day hours matrix
+DEFAULT_CHUNK = 4096
+
+def gini(values):
+    """Gini coefficient of non-negative values: 0 when shared equally, near 1 when one person carries all"""
+    values = np.sort(np.asarray(values, dtype=np.float64))
+    if not len(values) or not values.sum():
+        return 0.0
+    ranks = np.arange(1, len(values) + 1)
+    return float((2 * ranks - len(values) - 1).dot(values) / (len(values) * values.sum()))
+
+def employee_workload(grid, definitions=DEFAULT_SHIFT_DEFINITIONS, year=None, weekend=DEFAULT_WEEKEND,
+                      late_end=DEFAULT_LATE_END, chunk=DEFAULT_CHUNK):
+    """Per-employee workload arrays (one value per grid row) for a roster_grid().
+
+    Keys: hours, shifts, late_shifts, late_share, weekend_shifts, holiday_shifts, leave
+    ({code: days}) and peak_7/peak_28 (most hours in any 7/28 consecutive days).
+    Holidays are the dates on which anyone has holiday leave (HL).
+    """
+    matrix = grid['matrix']
+    codes = grid['codes']
+    rows, columns = matrix.shape
+    times = shift_times(definitions)
+
+    # Per-code lookup tables, indexed by the matrix itself
+    minutes = np.array([times[code][1] - times[code][0] if code in times else 0 for code in codes], dtype=np.int32)
+    is_shift = np.array([code in times for code in codes])
+    is_late = np.array([code in times and times[code][1] > late_end for code in codes])
+
+    days = grid_days(grid, year)
+    on_weekend = np.isin((days - 1) % 7, weekend)
+    holiday_numbers = [idx for idx, code in enumerate(codes) if code == 'HL']
+    on_holiday = np.isin(matrix, holiday_numbers).any(axis=0) if rows else np.zeros(columns, dtype=bool)
+
+    shifts = is_shift[matrix]
+    result = {
+        'hours': minutes[matrix].sum(axis=1, dtype=np.int64) / 60,
+        'shifts': shifts.sum(axis=1),
+        'late_shifts': is_late[matrix].sum(axis=1),
+        'weekend_shifts': shifts[:, on_weekend].sum(axis=1),
+        'holiday_shifts': shifts[:, on_holiday].sum(axis=1),
+        'leave': {
+            code: np.isin(matrix, [idx for idx, name in enumerate(codes) if name == code]).sum(axis=1)
+            for code in LEAVE_CODES
+        },
+    }
+    result['late_share'] = np.divide(result['late_shifts'], result['shifts'],
+                                     out=np.zeros(rows), where=result['shifts'] > 0)
+
+    # Rolling windows run over calendar days, so columns go into a day-by-day matrix with
+    # zeros on days missing from the roster
+    span = int(days[-1] - days[0] + 1) if columns else 0
+    position = days - days[0] if columns else days
+    for window in WINDOWS:
+        result[f'peak_{window}'] = np.zeros(rows)
+    for first in range(0, rows, chunk):
+        block = minutes[matrix[first:first + chunk]]
+        daily = np.zeros((len(block), span + 1), dtype=np.int64)
+        daily[:, position + 1] = block
+        running = np.cumsum(daily, axis=1)
+        for window in WINDOWS:
+            width = min(window, span)
+            loads = running[:, width:] - running[:, :-width] if width else running
+            result[f'peak_{window}'][first:first + chunk] = loads.max(axis=1, initial=0) / 60
+    return result
+
+def team_workload(grid, workload):
+    """Per-team rows: averages per employee plus the late-shift and weekend Gini coefficients"""
+    rows = []
+    team_index = grid['team_index']
+    for number, team in enumerate(grid['teams']):
+        members = np.flatnonzero((team_index == number) & (workload['shifts'] > 0))
+        if not len(members):
+            continue
+        late = workload['late_shifts'][members]
+        shifts = workload['shifts'][members]
+        rows.append({
+            'team': team,
+            'employees': len(members),
+            'hours': float(workload['hours'][members].mean()),
+            'late_share': float(late.sum() / shifts.sum()),
+            'weekend_shifts': float(workload['weekend_shifts'][members].mean()),
+            'holiday_shifts': float(workload['holiday_shifts'][members].mean()),
+            'leave_days': float(sum(workload['leave'][code][members] for code in LEAVE_CODES).mean()),
+            'peak_7': float(workload['peak_7'][members].max()),
+            'peak_28': float(workload['peak_28'][members].max()),
+            'late_gini': gini(late),
+            'weekend_gini': gini(workload['weekend_shifts'][members]),
+        })
+    return rows
+
+def employee_rows(grid, workload):
+    """Per-employee rows for CSV export"""
+    rows = []
+    for row, emp in enumerate(grid['employees']):
+        item = {
+            'team': emp['team'], 'id': emp['id'], 'name': emp['name'],
+            'hours': round(float(workload['hours'][row]), 2),
+            'shifts': int(workload['shifts'][row]),
+            'late_shifts': int(workload['late_shifts'][row]),
+            'late_share': round(float(workload['late_share'][row]), 3),
+            'weekend_shifts': int(workload['weekend_shifts'][row]),
+            'holiday_shifts': int(workload['holiday_shifts'][row]),
+        }
+        item.update({code: int(workload['leave'][code][row]) for code in LEAVE_CODES})
+        item.update({f'peak_{window}': round(float(workload[f'peak_{window}'][row]), 2) for window in WINDOWS})
+        rows.append(item)
+    return rows
+
+def print_report(grid, workload, teams, limit=10):
+    """Print the per-team table and the employees with the largest late-shift share"""
+    print(f"{'Team':<20} {'People':>6} {'Hours':>7} {'Late':>6} {'Weekend':>8} {'Holiday':>8} "
+          f"{'Leave':>6} {'Peak 7d':>8} {'Peak 28d':>9} {'Late Gini':>10}")
+    for row in teams:
+        print(f"{row['team'][:20]:<20} {row['employees']:>6} {row['hours']:>7.1f} {row['late_share']:>6.0%} "
+              f"{row['weekend_shifts']:>8.1f} {row['holiday_shifts']:>8.1f} {row['leave_days']:>6.1f} "
+              f"{row['peak_7']:>8.1f} {row['peak_28']:>9.1f} {row['late_gini']:>10.2f}")
+
+    print(f"\n🌙 Largest late-shift share")
+    for row in np.argsort(-workload['late_share'], kind='stable')[:limit]:
+        emp = grid['employees'][row]
+        print(f"  {emp['id']} {emp['name']} ({emp['team']}): {workload['late_share'][row]:.0%} of "
+              f"{workload['shifts'][row]} shifts, {workload['weekend_shifts'][row]} on weekends")
+
+def parse_weekday(value):
+    """"Fri" -> 4"""
+    try:
+        return DAY_NAMES.index(value[:3].title())
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'unknown weekday "{value}"')
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Workload and fairness analytics for a roster')
+    parser.add_argument('csv', nargs='*', help='Roster sheet exports, oldest first (e.g. one per month)')
+    parser.add_argument('--tenant', help="Analyze a tenant's current roster instead")
+    parser.add_argument('--data-dir', default=DATA_DIR, help='Application data directory (default: data)')
+    parser.add_argument('--weekend', type=parse_weekday, nargs='+', default=list(DEFAULT_WEEKEND),
+                        help='Weekend days (default: Fri Sat)')
+    parser.add_argument('--late-after', type=int, default=DEFAULT_LATE_END // 60,
+                        help='Shifts ending after this hour are late shifts (default: 20)')
+    parser.add_argument('--year', type=int, help='Year of the first date column (default: the roster ends at most a few months from now)')
+    parser.add_argument('--limit', type=int, default=10, help='Employees to list (default: 10)')
+    parser.add_argument('--output', '-o', help='Write per-employee figures to this CSV file')
+    args = parser.parse_args()
+
+    if not args.csv and not args.tenant:
+        parser.error('give roster CSV files or --tenant')
+    if args.tenant:
+        tenant = load_tenant(args.tenant, args.data_dir)
+        grid, definitions = roster_grid(tenant['roster']), tenant['shift_definitions']
+    else:
+        # Months parsed by an earlier run come from the ingest cache, which this only adds to
+        from roster_ingest import load_months, parse_source
+        grids = load_months([parse_source(path) for path in args.csv])
+        grid, definitions = combine_grids(grids, args.year), DEFAULT_SHIFT_DEFINITIONS
+    workload = employee_workload(grid, definitions, args.year, args.weekend, args.late_after * 60)
+    print_report(grid, workload, team_workload(grid, workload), args.limit)
+    if args.output:
+        rows = employee_rows(grid, workload)
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]) if rows else ['team', 'id', 'name'])
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"\n📄 Per-employee figures written to {args.output}")
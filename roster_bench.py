@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Roster Pipeline Benchmark for the Cartup CxP Roster Management System.
+Runs the roster pipeline (sheet parsing and merging, the code matrix, rule validation,
+workload analytics, roster statistics and the manual's roster report sections) on seeded synthetic rosters from
+roster_synth.py at several sizes, and reports each stage's time, throughput and peak
+memory. Stages are timed in one pass and measured with tracemalloc in a second, so the
+memory tracing does not slow down the timings.
+
+    python roster_bench.py                          # 1k, 10k and 100k employees
+    python roster_bench.py --sizes 5000 --months 3 --json bench.json
+"""
+
+import argparse
+import calendar
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from docx import Document
+
+from roster import empty_roster, merge_rosters, parse_roster_csv, roster_grid
+from roster_analytics import employee_workload, team_workload
+from roster_rules import validate_grid
+from roster_synth import generate_months, TEAM_PROFILES
+from tenant_data import DEFAULT_SHIFT_DEFINITIONS, roster_summary
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+def stage_parse(state):
+    """Parse every month's sheet and merge them like the app's sync does"""
+    roster = empty_roster()
+    for _, text in state['months']:
+        merge_rosters(roster, parse_roster_csv(text))
+    state['roster'] = roster
+    state['tenant'] = {
+        'name': 'Benchmark',
+        'roster': roster,
+        'teams': roster['teams'],
+        'shift_definitions': DEFAULT_SHIFT_DEFINITIONS,
+    }
+
+def stage_grid(state):
+    """Code matrix of the merged roster"""
+    state['grid'] = roster_grid(state['roster'])
+
+def stage_validate(state):
+    """Scheduling rule checks on the code matrix"""
+    state['violations'] = validate_grid(state['grid'], year=state['year'])
+
+def stage_analytics(state):
+    """Workload and fairness figures per employee and team"""
+    workload = employee_workload(state['grid'], year=state['year'])
+    state['workload'] = team_workload(state['grid'], workload)
+
+def stage_summary(state):
+    """Per-code shift counts shown in the manual"""
+    state['summary'] = roster_summary(state['tenant'])
+
+def stage_report(state):
+    """The manual's team and roster overview sections"""
+    from generate_manual import add_tenant_sections
+    doc = Document()
+    add_tenant_sections(doc, state['tenant'])
+
+# (name, function) in pipeline order; each function reads and extends the shared state
+STAGES = [
+    ('parse', stage_parse),
+    ('grid', stage_grid),
+    ('validate', stage_validate),
+    ('analytics', stage_analytics),
+    ('summary', stage_summary),
+    ('report', stage_report),
+]
+
+def synthesize(employees, teams, months, seed):
+    """Initial state: the generated sheets"""
+    months = generate_months(employees, teams, months, seed=seed)
+    return {'months': months, 'year': months[0][0].year}
+
+def run_stages(state, stages, measure_memory=False):
+    """{stage: seconds} or, with measure_memory, {stage: peak bytes}"""
+    results = {}
+    for name, function in stages:
+        gc.collect()
+        if measure_memory:
+            tracemalloc.start()
+            function(state)
+            results[name] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        else:
+            start = time.perf_counter()
+            function(state)
+            results[name] = time.perf_counter() - start
+    return results
+
+def benchmark(employees, teams=len(TEAM_PROFILES), months=1, seed=0, stages=STAGES, measure_memory=True):
+    """Rows of {stage, seconds, employees_per_s, cells_per_s, peak_bytes} for one roster size"""
+    start = time.perf_counter()
+    state = synthesize(employees, teams, months, seed)
+    synth_seconds = time.perf_counter() - start
+    # Employee-days: one cell per employee and calendar day
+    cells = employees * sum(calendar.monthrange(first.year, first.month)[1] for first, _ in state['months'])
+
+    seconds = run_stages(state, stages)
+    peaks = {}
+    if measure_memory:
+        peaks = run_stages({'months': state['months'], 'year': state['year']}, stages, measure_memory=True)
+
+    rows = [{'stage': 'synth', 'seconds': synth_seconds, 'peak_bytes': None}]
+    rows += [{'stage': name, 'seconds': seconds[name], 'peak_bytes': peaks.get(name)} for name, _ in stages]
+    for row in rows:
+        row['employees'] = employees
+        row['employees_per_s'] = employees / row['seconds'] if row['seconds'] else float('inf')
+        row['cells_per_s'] = cells / row['seconds'] if row['seconds'] else float('inf')
+    return rows
+
+def print_rows(rows):
+    """Print benchmark rows as a table"""
+    print(f"{'employees':>10}  {'stage':<10} {'seconds':>9} {'employees/s':>13} {'cells/s':>13} {'peak MB':>9}")
+    for row in rows:
+        peak = f"{row['peak_bytes'] / 1024 ** 2:9.1f}" if row['peak_bytes'] is not None else f"{'-':>9}"
+        print(f"{row['employees']:>10}  {row['stage']:<10} {row['seconds']:9.3f} "
+              f"{row['employees_per_s']:13,.0f} {row['cells_per_s']:13,.0f} {peak}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the roster pipeline on synthetic rosters')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Employee counts to benchmark (default: 1000 10000 100000)')
+    parser.add_argument('--teams', type=int, default=len(TEAM_PROFILES), help='Number of teams (default: 6)')
+    parser.add_argument('--months', type=int, default=1, help='Months of roster per run (default: 1)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument('--stages', nargs='+', choices=[name for name, _ in STAGES],
+                        help='Only run these stages (and the ones before them)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc pass')
+    parser.add_argument('--json', help='Also write the results to this JSON file')
+    args = parser.parse_args()
+
+    stages = STAGES
+    if args.stages:
+        last = max(idx for idx, (name, _) in enumerate(STAGES) if name in args.stages)
+        stages = STAGES[:last + 1]
+
+    results = []
+    for size in args.sizes:
+        print(f"⏱️  {size:,} employees, {args.teams} teams, {args.months} month(s)...", file=sys.stderr)
+        rows = benchmark(size, args.teams, args.months, args.seed, stages, not args.no_memory)
+        results.extend(rows)
+    print_rows(results)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"📄 Results written to {args.json}")
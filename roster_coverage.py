@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Intraday Coverage for the Cartup CxP Roster Management System.
+Daily counts hide gaps inside the day: a team can have six people on shift and still
+nobody after 6 PM. This turns the roster into per-team, per-day headcount curves in
+15-minute (or hourly) slots from the shift times of the Shift Codes Reference, and
+reports every stretch of a day where a team is below its target.
+
+Every shift adds +1 at its start slot and -1 at its end slot of a difference array over
+the whole period (late shifts simply run into the next day); one bincount over all
+employees at once and a cumulative sum give every curve, so a year of 15-minute curves for
+thousands of employees takes a fraction of a second. A slot counts someone only if their
+shift covers all of it.
+
+Targets are time windows with a minimum headcount, for one team or '*' for every team;
+a window may wrap past midnight:
+
+    python roster_coverage.py --tenant <tenant-id> --target '*=09:00-18:00:2' --target VOICE=08:00-22:00:3
+    python roster_coverage.py roster.csv --targets targets.json --slot 60 -o gaps.csv
+
+where targets.json is {"VOICE": [["08:00", "22:00", 3]], "*": [["09:00", "18:00", 2]]}.
+"""
+
+import argparse
+import csv
+import datetime
+import json
+import re
+import time
+
+import numpy as np
+
+from roster import combine_grids, grid_days, roster_grid, shift_times
+from tenant_data import DATA_DIR, DEFAULT_SHIFT_DEFINITIONS, load_tenant
+
+DEFAULT_SLOT = 15
+ALL_TEAMS = '*'
+WINDOW_RE = re.compile(r'^(\d{1,2}):(\d{2})-(\d{1,2}):(\d{2})$')
+
+def coverage_curves(grid, definitions=DEFAULT_SHIFT_DEFINITIONS, slot=DEFAULT_SLOT, year=None):
+    """Headcount curves: {'teams', 'days' (ordinals), 'slot' (minutes), 'counts'} with counts a
+    (teams, days, slots per day) int32 array of people on shift during each slot"""
+    if 1440 % slot:
+        raise ValueError(f'slot must divide a day into whole slots, got {slot} minutes')
+    per_day = 1440 // slot
+    matrix = grid['matrix']
+    times = shift_times(definitions)
+    teams = len(grid['teams'])
+    days = np.asarray(grid_days(grid, year), dtype=np.int64)
+    if not matrix.size or not days.size:
+        return {'teams': grid['teams'], 'days': days, 'slot': slot,
+                'counts': np.zeros((teams, len(days), per_day), dtype=np.int32)}
+
+    # First and one-past-last slot each code covers entirely, from midnight of its day
+    starts = np.zeros(len(grid['codes']), dtype=np.int64)
+    ends = np.zeros(len(grid['codes']), dtype=np.int64)
+    for number, code in enumerate(grid['codes']):
+        if code in times:
+            start, end = times[code]
+            starts[number], ends[number] = -(-start // slot), end // slot
+    working = ends > starts
+
+    # Timeline from the first day to the day after the last, so late shifts have room to end
+    first = int(days.min())
+    length = (int(days.max()) - first + 2) * per_day
+    rows, columns = np.nonzero(working[matrix])
+    numbers = matrix[rows, columns]
+    base = grid['team_index'][rows].astype(np.int64) * length + (days[columns] - first) * per_day
+    diff = np.bincount(base + starts[numbers], minlength=teams * length + 1) \
+        - np.bincount(base + ends[numbers], minlength=teams * length + 1)
+    curves = np.cumsum(diff[:teams * length].reshape(teams, length), axis=1, dtype=np.int32)
+    day_rows = curves.reshape(teams, length // per_day, per_day)
+    return {'teams': grid['teams'], 'days': days, 'slot': slot, 'counts': day_rows[:, days - first]}
+
+def parse_window(value):
+    """'08:00-22:00' -> (480, 1320) minutes; the end wraps past midnight when before the start"""
+    match = WINDOW_RE.match(value.strip())
+    if not match:
+        raise ValueError(f'expected HH:MM-HH:MM, got "{value}"')
+    start_h, start_m, end_h, end_m = (int(part) for part in match.groups())
+    start, end = start_h * 60 + start_m, end_h * 60 + end_m
+    if start > 1440 or end > 1440:
+        raise ValueError(f'time of day out of range in "{value}"')
+    return start, end if end > start else end + 1440
+
+def target_curves(teams, targets, slot=DEFAULT_SLOT):
+    """(teams, slots per day) minimum headcounts from {team or '*': [(window, minimum)]}.
+
+    Windows are 'HH:MM-HH:MM' strings or (start, end) minutes; overlapping windows take the
+    highest minimum and a window past midnight carries on at the start of the day.
+    """
+    per_day = 1440 // slot
+    result = np.zeros((len(teams), per_day), dtype=np.int32)
+    for idx, team in enumerate(teams):
+        for window, minimum in targets.get(ALL_TEAMS, []) + targets.get(team, []):
+            start, end = parse_window(window) if isinstance(window, str) else window
+            covered = np.arange(start // slot, -(-end // slot)) % per_day
+            result[idx, covered] = np.maximum(result[idx, covered], minimum)
+    return result
+
+def coverage_gaps(curves, targets, rostered=None):
+    """Stretches of a day where a team is below its target, as dicts with team, date (ordinal),
+    start and end (minutes), fewest (people on shift at the worst point) and target.
+
+    `rostered` is an optional (teams, days) boolean array; days that are False (nothing
+    rostered for the team) are skipped.
+    """
+    counts, slot = curves['counts'], curves['slot']
+    wanted = target_curves(curves['teams'], targets, slot)
+    short = counts < wanted[:, None, :]
+    if rostered is not None:
+        short &= rostered[:, :, None]
+    # Runs of short slots within each team-day
+    padded = np.zeros(short.shape[:2] + (short.shape[2] + 2,), dtype=np.int8)
+    padded[:, :, 1:-1] = short
+    edges = np.diff(padded, axis=2)
+    team_idx, day_idx, starts = np.nonzero(edges == 1)
+    ends = np.nonzero(edges == -1)[2]
+    gaps = []
+    for team, day, start, end in zip(team_idx.tolist(), day_idx.tolist(), starts.tolist(), ends.tolist()):
+        gaps.append({
+            'team': curves['teams'][team],
+            'date': int(curves['days'][day]),
+            'start': start * slot,
+            'end': end * slot,
+            'fewest': int(counts[team, day, start:end].min()),
+            'target': int(wanted[team, start:end].max()),
+        })
+    return gaps
+
+def team_rostered(grid):
+    """(teams, days) booleans: does the team have anything rostered that day?"""
+    rostered = np.zeros((len(grid['teams']), grid['matrix'].shape[1]), dtype=bool)
+    rows, columns = np.nonzero(grid['matrix'])
+    rostered[grid['team_index'][rows], columns] = True
+    return rostered
+
+def clock(minutes):
+    """480 -> '08:00'"""
+    return f'{minutes // 60:02d}:{minutes % 60:02d}'
+
+def gap_rows(gaps):
+    """Gaps as report rows with readable dates and times"""
+    return [{
+        'team': gap['team'],
+        'date': datetime.date.fromordinal(gap['date']).isoformat(),
+        'from': clock(gap['start']),
+        'to': clock(gap['end']),
+        'fewest': gap['fewest'],
+        'target': gap['target'],
+    } for gap in gaps]
+
+def print_report(curves, gaps, limit=10):
+    """Print the number of gaps per team and the `limit` longest ones"""
+    counts = curves['counts']
+    print(f"🕒 {len(curves['teams'])} teams x {len(curves['days'])} days in {curves['slot']}-minute slots")
+    if not gaps:
+        print("✅ Every team meets its targets")
+        return
+    print(f"⚠️  {len(gaps)} under-covered stretches")
+    per_team = {}
+    for gap in gaps:
+        per_team.setdefault(gap['team'], []).append(gap)
+    for team, team_gaps in per_team.items():
+        hours = sum(gap['end'] - gap['start'] for gap in team_gaps) / 60
+        peak = int(counts[curves['teams'].index(team)].max())
+        print(f"\n{team}: {len(team_gaps)} stretches, {hours:g}h short (busiest slot: {peak} on shift)")
+        for row in gap_rows(sorted(team_gaps, key=lambda gap: gap['start'] - gap['end'])[:limit]):
+            print(f"  {row['date']}  {row['from']}-{row['to']}  {row['fewest']} on shift (min {row['target']})")
+
+def parse_target(value):
+    """'TEAM=HH:MM-HH:MM:N' command line value -> (team, window, N)"""
+    team, _, rest = value.rpartition('=')
+    window, _, minimum = rest.rpartition(':')
+    try:
+        parse_window(window)
+        return team, window, int(minimum)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'expected TEAM=HH:MM-HH:MM:N, got "{value}"')
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Intraday coverage curves and gaps below target')
+    parser.add_argument('csv', nargs='*', help='Roster sheet exports, oldest first (e.g. one per month)')
+    parser.add_argument('--tenant', help="Check a tenant's current roster instead")
+    parser.add_argument('--data-dir', default=DATA_DIR, help='Application data directory (default: data)')
+    parser.add_argument('--targets', help="JSON file of {team or '*': [[from, to, minimum], ...]}")
+    parser.add_argument('--target', type=parse_target, action='append', default=[], metavar='TEAM=HH:MM-HH:MM:N',
+                        help="Minimum headcount in a window for one team, or '*' for all (repeatable)")
+    parser.add_argument('--slot', type=int, default=DEFAULT_SLOT, help='Slot length in minutes (default: 15)')
+    parser.add_argument('--year', type=int, help='Year of the first date column (default: the roster ends at most a few months from now)')
+    parser.add_argument('--limit', type=int, default=10, help='Gaps to list per team (default: 10)')
+    parser.add_argument('--output', '-o', help='Write every gap to this CSV file')
+    args = parser.parse_args()
+
+    if not args.csv and not args.tenant:
+        parser.error('give roster CSV files or --tenant')
+    targets = {}
+    if args.targets:
+        with open(args.targets, 'r', encoding='utf-8') as f:
+            targets = {team: [(f'{start}-{end}', minimum) for start, end, minimum in windows]
+                       for team, windows in json.load(f).items()}
+    for team, window, minimum in args.target:
+        targets.setdefault(team, []).append((window, minimum))
+
+    if args.tenant:
+        tenant = load_tenant(args.tenant, args.data_dir)
+        grid, definitions = roster_grid(tenant['roster']), tenant['shift_definitions']
+    else:
+        # Months parsed by an earlier run come from the ingest cache, which this only adds to
+        from roster_ingest import load_months, parse_source
+        grid = combine_grids(load_months([parse_source(path) for path in args.csv]), args.year)
+        definitions = DEFAULT_SHIFT_DEFINITIONS
+
+    started = time.perf_counter()
+    curves = coverage_curves(grid, definitions, args.slot, args.year)
+    gaps = coverage_gaps(curves, targets, team_rostered(grid))
+    elapsed = time.perf_counter() - started
+    print_report(curves, gaps, args.limit)
+    print(f"\n⏱️  Curves and gaps computed in {elapsed * 1000:.0f} ms")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=['team', 'date', 'from', 'to', 'fewest', 'target'])
+            writer.writeheader()
+            writer.writerows(gap_rows(gaps))
+        print(f"📄 Gaps written to {args.output}")
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Incremental Roster Ingestion for the Cartup CxP Roster Management System.
+Rosters arrive as one Google Sheet export per month (one link per month in
+google_links.json), and only the current month usually changes. Each monthly export is
+fingerprinted by its content; the parsed month (its roster_grid() with real dates) and
+its additive per-employee figures are kept in a persistent cache under that
+fingerprint. An ingest re-parses only new or changed months, and the running totals
+over all history are updated by taking out the old figures of a changed month and
+adding its new ones.
+
+    python roster_ingest.py roster_2025-*.csv                  # file names carry the month
+    python roster_ingest.py 2025-10=october.csv 2025-11=november.csv
+    python roster_ingest.py --clear
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+
+import numpy as np
+
+from roster import header_dates, parse_roster_csv, roster_grid
+from roster_analytics import DEFAULT_LATE_END, DEFAULT_WEEKEND, LEAVE_CODES, employee_workload
+from tenant_data import DEFAULT_SHIFT_DEFINITIONS
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(ROOT_DIR, '.cache', 'roster_months')
+CACHE_VERSION = 1
+STATE_FILE = 'state.json'
+MONTH_RE = re.compile(r'(\d{4})-(\d{2})')
+
+# Per-employee figures that add up across months
+STAT_FIELDS = ['minutes', 'shifts', 'late_shifts', 'weekend_shifts', 'holiday_shifts'] + LEAVE_CODES
+
+def month_label(path):
+    """"roster_2025-10.csv" -> "2025-10", or None when the name has no month"""
+    found = MONTH_RE.search(os.path.basename(path))
+    return f'{found.group(1)}-{found.group(2)}' if found else None
+
+def parse_source(value):
+    """"2025-10=file.csv" or "roster_2025-10.csv" command line value -> (month, path)"""
+    label, sep, path = value.partition('=')
+    if sep and MONTH_RE.fullmatch(label):
+        return label, path
+    return month_label(value) or value, value
+
+def content_digest(path):
+    """SHA-256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def month_grid(text, label=None):
+    """roster_grid() of one monthly export, with 'days' when `label` names its month"""
+    grid = roster_grid(parse_roster_csv(text))
+    if label and MONTH_RE.fullmatch(label) and grid['dates']:
+        year, month = map(int, label.split('-'))
+        # A sheet may start a few days before its month (e.g. "29Sep" in October's export)
+        first_month = header_dates(grid['dates'][:1], year)[0].month
+        start_year = year - 1 if first_month > month else year
+        grid['days'] = np.array([day.toordinal() for day in header_dates(grid['dates'], start_year)], dtype=np.int64)
+    return grid
+
+def month_stats(grid, definitions=DEFAULT_SHIFT_DEFINITIONS, weekend=DEFAULT_WEEKEND, late_end=DEFAULT_LATE_END):
+    """{field: int64 array per grid row} of STAT_FIELDS for one month"""
+    workload = employee_workload(grid, definitions, None, weekend, late_end)
+    stats = {'minutes': np.rint(workload['hours'] * 60).astype(np.int64)}
+    for field in STAT_FIELDS[1:5]:
+        stats[field] = workload[field].astype(np.int64)
+    for code in LEAVE_CODES:
+        stats[code] = workload['leave'][code].astype(np.int64)
+    return stats
+
+class MonthCache:
+    """Parsed months and their figures on disk, keyed by content and settings"""
+
+    def __init__(self, root=CACHE_DIR):
+        self.root = root
+        os.makedirs(os.path.join(root, 'months'), exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.root, 'months', f'{key}.npz')
+
+    def load(self, key):
+        """(grid, stats) stored under `key`, or None"""
+        try:
+            with np.load(self._path(key), allow_pickle=False) as data:
+                meta = json.loads(str(data['meta']))
+                grid = dict(meta, team_index=data['team_index'], matrix=data['matrix'])
+                if 'days' in data.files:
+                    grid['days'] = data['days']
+                stats = {field: data[f'stat_{field}'] for field in STAT_FIELDS}
+        except (OSError, KeyError, ValueError):
+            return None
+        return grid, stats
+
+    def save(self, key, grid, stats):
+        """Store a month atomically"""
+        meta = {name: grid[name] for name in ('dates', 'employees', 'teams', 'codes')}
+        arrays = {'meta': np.array(json.dumps(meta, ensure_ascii=False)),
+                  'team_index': grid['team_index'], 'matrix': grid['matrix']}
+        if 'days' in grid:
+            arrays['days'] = grid['days']
+        arrays.update({f'stat_{field}': stats[field] for field in STAT_FIELDS})
+        path = self._path(key)
+        tmp = f'{path}.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, path)
+
+    def read_state(self):
+        """Sources and running totals of the last ingest"""
+        try:
+            with open(os.path.join(self.root, STATE_FILE), 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('v') == CACHE_VERSION:
+                return state
+        except (OSError, ValueError):
+            pass
+        return {'v': CACHE_VERSION, 'settings': None, 'months': {}, 'totals': {}}
+
+    def write_state(self, state):
+        path = os.path.join(self.root, STATE_FILE)
+        tmp = f'{path}.{os.getpid()}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp, path)
+
+    def prune(self, keep):
+        """Remove stored months whose keys are not in `keep`"""
+        removed = 0
+        for name in os.listdir(os.path.join(self.root, 'months')):
+            if name.split('.')[0] not in keep:
+                os.remove(os.path.join(self.root, 'months', name))
+                removed += 1
+        return removed
+
+def apply_stats(totals, grid, stats, sign):
+    """Add (sign 1) or take out (sign -1) a month's figures from {id: {field: value}} totals"""
+    columns = {field: stats[field].tolist() for field in STAT_FIELDS}
+    for row, emp in enumerate(grid['employees']):
+        entry = totals.setdefault(emp['id'], dict(dict.fromkeys(STAT_FIELDS, 0), months=0))
+        for field in STAT_FIELDS:
+            entry[field] += sign * columns[field][row]
+        entry['months'] += sign
+        if entry['months'] <= 0:
+            del totals[emp['id']]
+
+def settings_key(definitions=DEFAULT_SHIFT_DEFINITIONS, weekend=DEFAULT_WEEKEND, late_end=DEFAULT_LATE_END):
+    """Short hash of the settings a month's figures depend on"""
+    settings = {'definitions': definitions, 'weekend': list(weekend), 'late_end': late_end}
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:16]
+
+def source_id(label, path):
+    """Key of a source in the ingest state: the same month may come from several files
+    (e.g. one export per tenant), so the path is part of it"""
+    return f'{label}|{os.path.abspath(path)}'
+
+def _month_entry(label, path, known, settings):
+    """State entry of a source, hashing its content only when its size or mtime changed"""
+    st = os.stat(path)
+    if known and (known['mtime_ns'], known['size']) == (st.st_mtime_ns, st.st_size):
+        digest = known['digest']
+    else:
+        digest = content_digest(path)
+    key = hashlib.sha256(f'{CACHE_VERSION}:{settings}:{label}:{digest}'.encode()).hexdigest()[:24]
+    return {'path': os.path.abspath(path), 'mtime_ns': st.st_mtime_ns, 'size': st.st_size,
+            'digest': digest, 'key': key}
+
+def _load_month(cache, key, label, path, definitions, weekend, late_end):
+    """(grid, stats) of a month from the cache, parsing and storing it on a miss: (stored, parsed)"""
+    stored = cache.load(key)
+    if stored is not None:
+        return stored, False
+    with open(path, 'r', encoding='utf-8') as f:
+        grid = month_grid(f.read(), label)
+    stored = grid, month_stats(grid, definitions, weekend, late_end)
+    cache.save(key, *stored)
+    return stored, True
+
+def load_months(sources, definitions=DEFAULT_SHIFT_DEFINITIONS, cache=None, weekend=DEFAULT_WEEKEND,
+                late_end=DEFAULT_LATE_END):
+    """Grids of `sources` ([(month, path)], oldest first) through the month cache, for tools
+    that only read rosters: misses are parsed and stored, but the running totals and the
+    cached history that ingest() maintains are left alone"""
+    cache = cache or MonthCache()
+    state = cache.read_state()
+    settings = settings_key(definitions, weekend, late_end)
+    grids = []
+    for label, path in sources:
+        entry = _month_entry(label, path, state['months'].get(source_id(label, path)), settings)
+        (grid, _), _ = _load_month(cache, entry['key'], label, path, definitions, weekend, late_end)
+        grids.append(grid)
+    return grids
+
+def ingest(sources, definitions=DEFAULT_SHIFT_DEFINITIONS, cache=None, weekend=DEFAULT_WEEKEND,
+           late_end=DEFAULT_LATE_END):
+    """Bring the cache up to date with `sources` ([(month, path)], oldest first).
+
+    Returns a dict with 'grids' (one per source, in order), 'totals' ({id: STAT_FIELDS
+    and months} over all sources) and 'parsed', 'reused' and 'removed' month counts.
+    Only roster_ingest.py should call this: it replaces the cached history with `sources`;
+    other tools read months with load_months().
+    """
+    cache = cache or MonthCache()
+    state = cache.read_state()
+    settings = settings_key(definitions, weekend, late_end)
+    if state['settings'] != settings:
+        state = {'v': CACHE_VERSION, 'settings': settings, 'months': {}, 'totals': {}}
+
+    ids = [source_id(label, path) for label, path in sources]
+    duplicates = sorted({source for source in ids if ids.count(source) > 1})
+    if duplicates:
+        raise ValueError(f"{duplicates[0].split('|', 1)[1]} is given more than once")
+
+    previous = state['months']
+    # Old figures of changed and dropped months, taken out of the running totals
+    outdated = []
+    months = {}
+    loaded = []
+    added = []
+    parsed = 0
+    for source, (label, path) in zip(ids, sources):
+        known = previous.get(source)
+        months[source] = entry = _month_entry(label, path, known, settings)
+        stored, fresh = _load_month(cache, entry['key'], label, path, definitions, weekend, late_end)
+        parsed += fresh
+        loaded.append(stored)
+        if not known or known['key'] != entry['key']:
+            outdated.append(known and known['key'])
+            added.append(stored)
+    dropped = [source for source in previous if source not in months]
+    outdated += [previous[source]['key'] for source in dropped]
+
+    totals = state['totals']
+    for key in outdated:
+        if key is None:
+            continue
+        old = cache.load(key)
+        if old is None:
+            # The old figures are gone, so start over from every month
+            totals, added = {}, loaded
+            break
+        apply_stats(totals, *old, -1)
+    for stored in added:
+        apply_stats(totals, *stored, 1)
+
+    cache.write_state({'v': CACHE_VERSION, 'settings': settings, 'months': months, 'totals': totals})
+    cache.prune({month['key'] for month in months.values()})
+    return {
+        'grids': [grid for grid, _ in loaded],
+        'totals': totals,
+        'parsed': parsed,
+        'reused': len(loaded) - parsed,
+        'removed': len(dropped),
+    }
+
+def team_totals(grids, totals):
+    """Per-team sums of the running totals, with employees in their latest team"""
+    latest = {}
+    for grid in grids:
+        latest.update((emp['id'], emp['team']) for emp in grid['employees'])
+    teams = {}
+    for emp_id, entry in totals.items():
+        team = teams.setdefault(latest.get(emp_id, ''), dict(dict.fromkeys(STAT_FIELDS, 0), employees=0))
+        team['employees'] += 1
+        for field in STAT_FIELDS:
+            team[field] += entry[field]
+    return teams
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Ingest monthly roster exports, re-parsing only changed months')
+    parser.add_argument('csv', nargs='*', type=parse_source,
+                        help='Monthly sheet exports, oldest first: roster_YYYY-MM.csv or YYYY-MM=file.csv')
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help='Cache directory (default: .cache/roster_months)')
+    parser.add_argument('--clear', action='store_true', help='Remove the cache first')
+    args = parser.parse_args()
+
+    if args.clear:
+        shutil.rmtree(args.cache_dir, ignore_errors=True)
+        print(f"🗑️  Cleared {args.cache_dir}")
+        if not args.csv:
+            raise SystemExit(0)
+    if not args.csv:
+        parser.error('give monthly roster CSV files')
+
+    try:
+        result = ingest(args.csv, cache=MonthCache(args.cache_dir))
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"📥 {len(args.csv)} months: {result['parsed']} parsed, {result['reused']} from cache, "
+          f"{result['removed']} dropped")
+    print(f"\n{'Team':<20} {'People':>6} {'Hours':>9} {'Shifts':>7} {'Late':>6} {'Weekend':>8} {'Leave':>6}")
+    for team, row in sorted(team_totals(result['grids'], result['totals']).items()):
+        leave = sum(row[code] for code in LEAVE_CODES)
+        late = row['late_shifts'] / row['shifts'] if row['shifts'] else 0
+        print(f"{team[:20]:<20} {row['employees']:>6} {row['minutes'] / 60:>9.0f} {row['shifts']:>7} "
+              f"{late:>6.0%} {row['weekend_shifts']:>8} {leave:>6}")
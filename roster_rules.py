@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Roster Rule Validation for the Cartup CxP Roster Management System.
+Checks a roster against scheduling rules before it goes live: every code must be one of
+the shift codes listed in the manual's Shift Codes Reference (the tenant's shift
+definitions), nobody works more than a set number of days in a row, there is a minimum
+rest between the end of one shift and the start of the next (a D2 late shift followed by
+an M2 early shift leaves 10 hours), and every team has a minimum number of people on
+shift each day. Each rule is one vectorized NumPy pass over the roster's code matrix, so
+a year of data for thousands of employees is checked in well under a second.
+
+    python roster_rules.py roster.csv [more.csv ...]
+    python roster_rules.py --tenant <tenant-id> --min-rest 12 --team-coverage VOICE=3
+"""
+
+import argparse
+import csv
+import json
+import sys
+
+import numpy as np
+
+from roster import empty_roster, grid_days, merge_rosters, parse_roster_csv, roster_grid, shift_times
+from tenant_data import DATA_DIR, DEFAULT_SHIFT_DEFINITIONS, load_tenant
+
+DEFAULT_RULES = {
+    'max_consecutive_days': 6,
+    'min_rest_hours': 11,
+    # People on shift per team per day, with per-team overrides
+    'min_coverage': 1,
+    'team_coverage': {},
+}
+
+# Rule names in report order
+RULES = ['unknown_code', 'consecutive_days', 'min_rest', 'coverage']
+
+RULE_TITLES = {
+    'unknown_code': 'Unknown shift codes',
+    'consecutive_days': 'Too many working days in a row',
+    'min_rest': 'Too little rest between shifts',
+    'coverage': 'Teams below minimum coverage',
+}
+
+def load_rosters(paths):
+    """Roster merged from several sheet exports, in order"""
+    roster = empty_roster()
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            merge_rosters(roster, parse_roster_csv(f.read()))
+    return roster
+
+def validate_grid(grid, definitions=DEFAULT_SHIFT_DEFINITIONS, rules=None, year=None):
+    """Violations of `rules` in a roster_grid(), as dicts with rule, team, id, name, date and detail.
+
+    Codes with start and end times in `definitions` are shifts; only shifts count as
+    working days, for rest periods and for coverage.
+    """
+    rules = dict(DEFAULT_RULES, **(rules or {}))
+    matrix = grid['matrix']
+    codes = grid['codes']
+    dates = grid['dates']
+    employees = grid['employees']
+    times = shift_times(definitions)
+    known = {code.strip().upper() for code in definitions}
+
+    # Per-code lookup tables, indexed by the matrix itself
+    valid = np.array([code == '' or code in known for code in codes])
+    working_code = np.array([code in times for code in codes])
+    starts = np.array([times.get(code, (0, 0))[0] for code in codes], dtype=np.int64)
+    ends = np.array([times.get(code, (0, 0))[1] for code in codes], dtype=np.int64)
+
+    days = grid_days(grid, year)
+    gaps = np.diff(days)
+    working = working_code[matrix]
+    violations = []
+
+    def employee_violation(rule, row, col, detail):
+        emp = employees[row]
+        violations.append({
+            'rule': rule, 'team': emp['team'], 'id': emp['id'], 'name': emp['name'],
+            'date': dates[col], 'detail': detail,
+        })
+
+    # Codes outside the shift definitions
+    for row, col in zip(*np.nonzero(~valid[matrix])):
+        employee_violation('unknown_code', row, col, f'"{codes[matrix[row, col]]}" is not a defined shift code')
+
+    # Runs of working days: a run starts on a working day that does not directly follow another
+    if matrix.shape[1]:
+        follows = np.zeros_like(working)
+        follows[:, 1:] = working[:, :-1] & working[:, 1:] & (gaps == 1)
+        columns = np.arange(matrix.shape[1])
+        run_start = np.maximum.accumulate(np.where(working & ~follows, columns, 0), axis=1)
+        run_length = columns - run_start + 1
+        run_end = working.copy()
+        run_end[:, :-1] &= ~follows[:, 1:]
+        limit = rules['max_consecutive_days']
+        for row, col in zip(*np.nonzero(run_end & (run_length > limit))):
+            first = run_start[row, col]
+            employee_violation('consecutive_days', row, first,
+                               f'{run_length[row, col]} working days from {dates[first]} to {dates[col]} (max {limit})')
+
+    # Rest between the end of a shift and the start of the next day's shift
+    if matrix.shape[1] > 1:
+        rest = starts[matrix[:, 1:]] + gaps * 1440 - ends[matrix[:, :-1]]
+        short = working[:, :-1] & working[:, 1:] & (rest < rules['min_rest_hours'] * 60)
+        for row, col in zip(*np.nonzero(short)):
+            employee_violation(
+                'min_rest', row, col + 1,
+                f'{codes[matrix[row, col]]} on {dates[col]} then {codes[matrix[row, col + 1]]} on {dates[col + 1]}: '
+                f'{rest[row, col] / 60:g}h rest (min {rules["min_rest_hours"]:g}h)',
+            )
+
+    # People on shift per team and day; days with nothing rostered for the team are skipped
+    if matrix.size:
+        order = np.argsort(grid['team_index'], kind='stable')
+        team_of_row = grid['team_index'][order]
+        bounds = np.flatnonzero(np.r_[True, team_of_row[1:] != team_of_row[:-1]])
+        on_shift = np.add.reduceat(working[order], bounds, axis=0)
+        rostered = np.add.reduceat(matrix[order] != 0, bounds, axis=0)
+        for bound, shifts, filled in zip(bounds, on_shift, rostered):
+            team = grid['teams'][team_of_row[bound]]
+            minimum = rules['team_coverage'].get(team, rules['min_coverage'])
+            for col in np.flatnonzero((shifts < minimum) & (filled > 0)):
+                violations.append({
+                    'rule': 'coverage', 'team': team, 'id': '', 'name': '', 'date': dates[col],
+                    'detail': f'{shifts[col]} on shift (min {minimum})',
+                })
+
+    return violations
+
+def violation_counts(violations):
+    """{rule: number of violations} for every rule"""
+    counts = dict.fromkeys(RULES, 0)
+    for violation in violations:
+        counts[violation['rule']] += 1
+    return counts
+
+def print_report(violations, limit=10):
+    """Print violation counts and the first `limit` violations of each rule"""
+    counts = violation_counts(violations)
+    if not violations:
+        print("✅ No rule violations")
+        return
+    print(f"⚠️  {len(violations)} rule violations")
+    for rule in RULES:
+        if not counts[rule]:
+            continue
+        print(f"\n{RULE_TITLES[rule]} ({counts[rule]})")
+        shown = [violation for violation in violations if violation['rule'] == rule][:limit]
+        for violation in shown:
+            who = f"{violation['id']} {violation['name']}".strip() or violation['team']
+            print(f"  {violation['date']:>6}  {who}: {violation['detail']}")
+        if counts[rule] > len(shown):
+            print(f"  ... and {counts[rule] - len(shown)} more")
+
+def write_violations_csv(path, violations):
+    """Write every violation to a CSV file"""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['rule', 'team', 'id', 'name', 'date', 'detail'])
+        writer.writeheader()
+        writer.writerows(violations)
+
+def parse_team_coverage(value):
+    """"TEAM=N" command line value -> (team, N)"""
+    team, _, minimum = value.rpartition('=')
+    if not team:
+        raise argparse.ArgumentTypeError(f'expected TEAM=N, got "{value}"')
+    return team, int(minimum)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Check a roster against scheduling rules')
+    parser.add_argument('csv', nargs='*', help='Roster sheet exports (merged in order)')
+    parser.add_argument('--tenant', help="Check a tenant's current roster instead")
+    parser.add_argument('--data-dir', default=DATA_DIR, help='Application data directory (default: data)')
+    parser.add_argument('--rules', help='JSON file of rule settings (see DEFAULT_RULES)')
+    parser.add_argument('--max-consecutive', type=int, help='Most working days in a row (default: 6)')
+    parser.add_argument('--min-rest', type=float, help='Fewest hours between shifts (default: 11)')
+    parser.add_argument('--min-coverage', type=int, help='Fewest people on shift per team per day (default: 1)')
+    parser.add_argument('--team-coverage', type=parse_team_coverage, action='append', default=[],
+                        metavar='TEAM=N', help='Coverage minimum for one team (repeatable)')
+    parser.add_argument('--year', type=int, help='Year of the first date column (default: the roster ends at most a few months from now)')
+    parser.add_argument('--limit', type=int, default=10, help='Violations to list per rule (default: 10)')
+    parser.add_argument('--output', '-o', help='Write every violation to this CSV file')
+    args = parser.parse_args()
+
+    if not args.csv and not args.tenant:
+        parser.error('give roster CSV files or --tenant')
+
+    rules = dict(DEFAULT_RULES)
+    if args.rules:
+        with open(args.rules, 'r', encoding='utf-8') as f:
+            rules.update(json.load(f))
+    for key, value in (('max_consecutive_days', args.max_consecutive), ('min_rest_hours', args.min_rest),
+                       ('min_coverage', args.min_coverage)):
+        if value is not None:
+            rules[key] = value
+    rules['team_coverage'] = dict(rules['team_coverage'], **dict(args.team_coverage))
+
+    if args.tenant:
+        tenant = load_tenant(args.tenant, args.data_dir)
+        roster, definitions = tenant['roster'], tenant['shift_definitions']
+    else:
+        roster, definitions = load_rosters(args.csv), DEFAULT_SHIFT_DEFINITIONS
+
+    grid = roster_grid(roster)
+    violations = validate_grid(grid, definitions, rules, args.year)
+    print_report(violations, args.limit)
+    if args.output:
+        write_violations_csv(args.output, violations)
+        print(f"\n📄 Violations written to {args.output}")
+    sys.exit(1 if violations else 0)
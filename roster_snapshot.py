@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Roster Snapshots for the Cartup CxP Roster Management System.
+Every published roster version is archived for audits. Keeping those as CSV means
+re-parsing years of sheets for every report, so a version is stored as one compact binary
+snapshot instead, which is opened with mmap and read lazily: a report that needs one
+team-month of a multi-year snapshot touches only those bytes.
+
+Layout (little-endian, every section aligned to 8 bytes):
+
+    header     magic "CXPSNAP\\0", version, flags, rows, columns, teams, codes
+    sections   (offset, length) of each section below, in SECTIONS order
+    meta       JSON: when and from which sources the snapshot was written
+    codes, teams, dates, ids, names
+               string tables: count, count + 1 offsets, UTF-8 bytes
+    days       int64 ordinal day of each column
+    team_rows  uint32 first row of each team, then the row count (rows are grouped by team)
+    team_index uint32 team of each row
+    matrix     rows x columns codes, row-major (uint8, or uint16 with FLAG_WIDE)
+    runs       with FLAG_RLE instead of the matrix: uint64 first run of each row
+               (rows + 1), then run values and uint16 run lengths
+
+Run-length encoding suits archives where joiners and leavers leave long blank stretches.
+
+    python roster_snapshot.py roster_2024-*.csv roster_2025-*.csv -o roster.snap --rle
+    python roster_snapshot.py --open roster.snap --team VOICE --month 2025-10
+"""
+
+import argparse
+import datetime
+import json
+import mmap
+import os
+import struct
+import time
+
+import numpy as np
+
+from roster import grid_days
+
+MAGIC = b'CXPSNAP\x00'
+SNAPSHOT_VERSION = 1
+FLAG_RLE = 1
+FLAG_WIDE = 2
+HEADER = struct.Struct('<8sHHIIII')
+SECTIONS = ['meta', 'codes', 'teams', 'dates', 'ids', 'names', 'days', 'team_rows', 'team_index',
+            'matrix', 'run_offsets', 'run_values', 'run_lengths']
+SECTION_TABLE = struct.Struct('<' + 'QQ' * len(SECTIONS))
+# Longest run stored in one run; longer ones are split
+MAX_RUN = 0xFFFF
+
+def _pad(length):
+    return -length % 8
+
+def string_table(values):
+    """Bytes of a string table"""
+    encoded = [(value or '').encode('utf-8') for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype='<u4')
+    np.cumsum([len(data) for data in encoded], out=offsets[1:])
+    return struct.pack('<I', len(encoded)) + offsets.tobytes() + b''.join(encoded)
+
+def encode_runs(matrix):
+    """(run offsets per row, run values, run lengths) of a row-major matrix"""
+    rows, columns = matrix.shape
+    if not matrix.size:
+        return np.zeros(rows + 1, dtype='<u8'), matrix.ravel(), np.zeros(0, dtype='<u2')
+    flat = matrix.ravel()
+    # A run starts at every row start, every change of code and, in rows longer than
+    # MAX_RUN, every MAX_RUN columns
+    starts = np.zeros(flat.size, dtype=bool)
+    starts[::columns] = True
+    starts[1:] |= flat[1:] != flat[:-1]
+    if columns > MAX_RUN:
+        starts |= np.arange(flat.size) % columns % MAX_RUN == 0
+    first = np.flatnonzero(starts)
+    lengths = np.diff(np.append(first, flat.size)).astype('<u2')
+    offsets = np.searchsorted(first, np.arange(rows + 1) * columns).astype('<u8')
+    return offsets, flat[first], lengths
+
+def write_snapshot(grid, path, rle=False, meta=None):
+    """Write a roster_grid() as a snapshot, atomically, with columns dated by grid_days().
+    Rows are stored grouped by team, in their order within each team."""
+    matrix = grid['matrix']
+    order = np.argsort(grid['team_index'], kind='stable')
+    team_index = grid['team_index'][order].astype('<u4')
+    counts = np.bincount(team_index, minlength=len(grid['teams']))
+    team_rows = np.concatenate([np.cumsum(counts) - counts, counts]).astype('<u4')
+    employees = [grid['employees'][row] for row in order.tolist()]
+    wide = matrix.dtype.itemsize == 2
+    dtype = '<u2' if wide else 'u1'
+    matrix = np.ascontiguousarray(matrix[order], dtype=dtype)
+    flags = (FLAG_RLE if rle else 0) | (FLAG_WIDE if wide else 0)
+
+    sections = {
+        'meta': json.dumps(dict(meta or {}, created=time.time()), ensure_ascii=False).encode('utf-8'),
+        'codes': string_table(grid['codes']),
+        'teams': string_table(grid['teams']),
+        'dates': string_table(grid['dates']),
+        'ids': string_table([emp.get('id') for emp in employees]),
+        'names': string_table([emp.get('name') for emp in employees]),
+        'days': np.asarray(grid_days(grid), dtype='<i8'),
+        'team_rows': team_rows,
+        'team_index': team_index,
+    }
+    if rle:
+        sections['run_offsets'], sections['run_values'], sections['run_lengths'] = encode_runs(matrix)
+    else:
+        sections['matrix'] = matrix
+
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        offset = HEADER.size + SECTION_TABLE.size
+        f.write(b'\0' * offset)
+        table = []
+        for name in SECTIONS:
+            data = sections.get(name)
+            if data is None:
+                table += [0, 0]
+                continue
+            length = data.nbytes if isinstance(data, np.ndarray) else len(data)
+            f.write(data)
+            f.write(b'\0' * _pad(length))
+            table += [offset, length]
+            offset += length + _pad(length)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, SNAPSHOT_VERSION, flags, matrix.shape[0], matrix.shape[1],
+                            len(grid['teams']), len(grid['codes'])))
+        f.write(SECTION_TABLE.pack(*table))
+    os.replace(tmp, path)
+
+class StringTable:
+    """Lazily decoded strings of a string table section"""
+
+    def __init__(self, buffer, offset):
+        self._buffer = buffer
+        count, = struct.unpack_from('<I', buffer, offset)
+        # A copy, so the table holds no view that would keep the map from closing
+        self._offsets = np.frombuffer(buffer, dtype='<u4', count=count + 1, offset=offset + 4).copy()
+        self._start = offset + 4 + self._offsets.nbytes
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        start, end = int(self._offsets[index]), int(self._offsets[index + 1])
+        return bytes(self._buffer[self._start + start:self._start + end]).decode('utf-8')
+
+    def __iter__(self):
+        return (self[idx] for idx in range(len(self)))
+
+class RosterSnapshot:
+    """Memory-mapped snapshot; arrays are views of the file and nothing is decoded until used"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.version, self.flags, self.rows, self.columns, team_count, code_count = \
+            HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f'{path} is not a roster snapshot')
+        if self.version != SNAPSHOT_VERSION:
+            raise ValueError(f'{path} is snapshot version {self.version}, this reader knows {SNAPSHOT_VERSION}')
+        table = SECTION_TABLE.unpack_from(self._map, HEADER.size)
+        self._sections = {name: (table[2 * idx], table[2 * idx + 1]) for idx, name in enumerate(SECTIONS)}
+        self.dtype = np.dtype('<u2' if self.flags & FLAG_WIDE else 'u1')
+        self.codes = list(StringTable(self._map, self._sections['codes'][0]))
+        self.teams = list(StringTable(self._map, self._sections['teams'][0]))
+        self.dates = StringTable(self._map, self._sections['dates'][0])
+        self.ids = StringTable(self._map, self._sections['ids'][0])
+        self.names = StringTable(self._map, self._sections['names'][0])
+        # Small per-column and per-row arrays are copied; only block() hands out views of the map
+        self.days = self._array('days', '<i8').copy()
+        team_rows = self._array('team_rows', '<u4').copy()
+        self._team_start, self._team_count = team_rows[:team_count], team_rows[team_count:]
+        self.team_index = self._array('team_index', '<u4').copy()
+
+    def _array(self, name, dtype):
+        offset, length = self._sections[name]
+        return np.frombuffer(self._map, dtype=dtype, count=length // np.dtype(dtype).itemsize, offset=offset)
+
+    @property
+    def meta(self):
+        offset, length = self._sections['meta']
+        return json.loads(bytes(self._map[offset:offset + length]).decode('utf-8'))
+
+    def team_rows(self, team):
+        """Row range of a team (name or number)"""
+        number = self.teams.index(team) if isinstance(team, str) else team
+        start = int(self._team_start[number])
+        return range(start, start + int(self._team_count[number]))
+
+    def day_columns(self, first, last):
+        """Column range of the days from `first` to `last` (dates or ordinals), inclusive"""
+        first = first.toordinal() if isinstance(first, datetime.date) else first
+        last = last.toordinal() if isinstance(last, datetime.date) else last
+        return range(int(np.searchsorted(self.days, first)), int(np.searchsorted(self.days, last, side='right')))
+
+    def month_columns(self, year, month):
+        """Column range of a calendar month"""
+        first = datetime.date(year, month, 1)
+        last = datetime.date(year + month // 12, month % 12 + 1, 1) - datetime.timedelta(days=1)
+        return self.day_columns(first, last)
+
+    def block(self, rows=None, columns=None):
+        """Codes of a row range and column range: a view of the file, or decoded from the
+        runs of just those rows"""
+        rows = rows if rows is not None else range(self.rows)
+        columns = columns if columns is not None else range(self.columns)
+        if not self.flags & FLAG_RLE:
+            matrix = self._array('matrix', self.dtype).reshape(self.rows, self.columns)
+            return matrix[rows.start:rows.stop, columns.start:columns.stop]
+        offsets = self._array('run_offsets', '<u8')
+        first, last = int(offsets[rows.start]), int(offsets[rows.stop])
+        values = self._array('run_values', self.dtype)[first:last]
+        lengths = self._array('run_lengths', '<u2')[first:last]
+        decoded = np.repeat(values, lengths).reshape(len(rows), self.columns)
+        return decoded[:, columns.start:columns.stop]
+
+    def grid(self, team=None, columns=None):
+        """roster_grid()-style dict of the snapshot, one team and/or a column range of it"""
+        rows = self.team_rows(team) if team is not None else range(self.rows)
+        columns = columns if columns is not None else range(self.columns)
+        team_index = np.array(self.team_index[rows.start:rows.stop], dtype=np.int32)
+        teams = self.teams
+        if team is not None:
+            teams = [self.teams[team_index[0]]] if len(rows) else [team]
+            team_index = np.zeros(len(rows), dtype=np.int32)
+        return {
+            'dates': self.dates[columns.start:columns.stop],
+            'days': np.array(self.days[columns.start:columns.stop]),
+            'employees': [{'id': self.ids[row], 'name': self.names[row], 'team': teams[team_index[idx]]}
+                          for idx, row in enumerate(rows)],
+            'teams': list(teams),
+            'team_index': team_index,
+            'codes': list(self.codes),
+            'matrix': np.array(self.block(rows, columns)),
+        }
+
+    def close(self):
+        """Unmap the file; raises BufferError while arrays returned by block() are still
+        referenced"""
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+if __name__ == '__main__':
+    from roster import combine_grids
+    from size_report import format_size
+
+    parser = argparse.ArgumentParser(description='Write or read binary roster snapshots')
+    parser.add_argument('csv', nargs='*', help='Roster sheet exports to snapshot, oldest first')
+    parser.add_argument('--output', '-o', help='Snapshot file to write')
+    parser.add_argument('--rle', action='store_true', help='Run-length encode the code matrix')
+    parser.add_argument('--year', type=int, help='Year of the first date column (default: the roster ends at most a few months from now)')
+    parser.add_argument('--open', metavar='SNAPSHOT', help='Describe a snapshot instead')
+    parser.add_argument('--team', help='With --open, show this team')
+    parser.add_argument('--month', help='With --open, show this month (YYYY-MM)')
+    args = parser.parse_args()
+
+    if args.open:
+        started = time.perf_counter()
+        with RosterSnapshot(args.open) as snapshot:
+            first, last = (datetime.date.fromordinal(int(snapshot.days[idx])) for idx in (0, -1)) \
+                if snapshot.columns else ('-', '-')
+            print(f"🗄️  {args.open}: {snapshot.rows} employees, {len(snapshot.teams)} teams, "
+                  f"{snapshot.columns} days ({first} to {last}){', run-length encoded' if snapshot.flags & FLAG_RLE else ''}")
+            if args.team or args.month:
+                columns = None
+                if args.month:
+                    year, month = (int(part) for part in args.month.split('-'))
+                    columns = snapshot.month_columns(year, month)
+                grid = snapshot.grid(args.team, columns)
+                elapsed = time.perf_counter() - started
+                print(f"{args.team or 'All teams'} {args.month or ''}: {len(grid['employees'])} employees x "
+                      f"{len(grid['dates'])} days, read in {elapsed * 1000:.1f} ms")
+                for emp, row in list(zip(grid['employees'], grid['matrix']))[:10]:
+                    codes = ' '.join(f'{grid["codes"][code]:<2}' for code in row[:14].tolist())
+                    print(f"  {emp['id']:<12} {codes}")
+    elif args.csv and args.output:
+        # Months parsed by an earlier run come from the ingest cache, which this only adds to
+        from roster_ingest import load_months, parse_source
+        grid = combine_grids(load_months([parse_source(path) for path in args.csv]), args.year)
+        started = time.perf_counter()
+        write_snapshot(grid, args.output, args.rle, {'sources': [os.path.basename(path) for path in args.csv]})
+        print(f"🗄️  {args.output}: {len(grid['employees'])} employees x {len(grid['dates'])} days, "
+              f"{format_size(os.path.getsize(args.output))} in {time.perf_counter() - started:.2f}s")
+    else:
+        parser.error('give roster CSV files and --output, or --open a snapshot')
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Roster Auto-Fill for the Cartup CxP Roster Management System.
+Builds next month's roster from teams, employees, per-team daily coverage targets per
+shift code, rest rules and pre-approved leave, and writes it as a sheet in the published
+layout, ready to paste into the roster Google Sheet that sync-google-sheets reads.
+
+Each team is solved on its own. Everyone gets two consecutive days off a week, spread so
+each day keeps enough people; a local search then moves days off within the week to
+cover days short because of leave without breaking the consecutive-days limit. Shifts are
+then filled day by day, late shifts going to whoever has had the fewest, and swaps
+between team members repair any shift that starts too soon after the previous one ends.
+
+The previous month is the warm start: day-off patterns carry on, rest and consecutive
+days are checked across the month boundary, and late-shift counts carry over for
+fairness. Given an existing plan for the month, team-days that are still valid are kept
+and only the ones affected by changes (new leave, changed targets, joiners and leavers)
+are solved again.
+
+    python roster_solver.py --month 2025-11 --previous roster_2025-10.csv -o roster_2025-11.csv
+    python roster_solver.py --month 2025-11 --previous roster_2025-10.csv --plan roster_2025-11.csv \\
+        --leave leave.csv --targets targets.json -o roster_2025-11.csv
+"""
+
+import argparse
+import calendar
+import csv
+import datetime
+import io
+import json
+import sys
+import time
+
+import numpy as np
+
+from roster import date_header, history_grid, parse_roster_csv, shift_times, write_roster_csv
+from roster_analytics import DEFAULT_LATE_END
+from roster_rules import DEFAULT_RULES, validate_grid, violation_counts
+from tenant_data import DEFAULT_SHIFT_DEFINITIONS
+
+DAYS_OFF = 2
+# How far (in days) a day off may move to cover a short day
+OFF_DAY_REACH = 3
+
+def month_dates(month):
+    """Dates of a "YYYY-MM" month"""
+    year, number = (int(part) for part in month.split('-'))
+    return [datetime.date(year, number, day) for day in range(1, calendar.monthrange(year, number)[1] + 1)]
+
+def daily_target(value, day):
+    """Target of one day from a number or a list of 7 (Monday first)"""
+    return value[day.weekday()] if isinstance(value, (list, tuple)) else value
+
+def targets_from_grid(grid, definitions=DEFAULT_SHIFT_DEFINITIONS):
+    """{team: {code: [7 weekday targets]}}: the fewest people each team had on each shift per weekday"""
+    times = shift_times(definitions)
+    days = grid['days'] if 'days' in grid else None
+    weekdays = (days - 1) % 7 if days is not None else np.arange(grid['matrix'].shape[1]) % 7
+    targets = {}
+    for number, team in enumerate(grid['teams']):
+        rows = grid['matrix'][grid['team_index'] == number]
+        team_targets = {}
+        for code_number, code in enumerate(grid['codes']):
+            if code not in times:
+                continue
+            counts = (rows == code_number).sum(axis=0)
+            per_weekday = [int(counts[weekdays == weekday].min()) if (weekdays == weekday).any() else 0
+                           for weekday in range(7)]
+            if any(per_weekday):
+                team_targets[code] = per_weekday
+        targets[team] = team_targets
+    return targets
+
+def history_state(grid, definitions=DEFAULT_SHIFT_DEFINITIONS, weeks=4, late_end=DEFAULT_LATE_END):
+    """Per-employee warm start from the previous period's grid: {id: {...}}.
+
+    Each entry has the last day's shift end (minutes, None if not working), the trailing
+    run of working days, the weekday the usual days off start on, the usual shift and the
+    number of late shifts worked.
+    """
+    times = shift_times(definitions)
+    matrix = grid['matrix']
+    codes = grid['codes']
+    days = grid['days']
+    recent = days >= days[-1] - weeks * 7 + 1
+    state = {}
+    for row, emp in enumerate(grid['employees']):
+        cells = [codes[number] for number in matrix[row]]
+        if not any(cells[-7:]):
+            continue  # gone by the end of the period
+        off_days = np.zeros(7, dtype=np.int64)
+        shift_counts = {}
+        for column in np.flatnonzero(recent):
+            code = cells[column]
+            if code == 'DO':
+                off_days[(days[column] - 1) % 7] += 1
+            elif code in times:
+                shift_counts[code] = shift_counts.get(code, 0) + 1
+        run = 0
+        for code in reversed(cells):
+            if code not in times:
+                break
+            run += 1
+        last = cells[-1]
+        state[emp['id']] = {
+            'end': times[last][1] - 1440 if last in times else None,
+            'run': run,
+            'off_start': int(np.argmax(off_days + np.roll(off_days, -1))) if off_days.any() else None,
+            'usual': max(shift_counts, key=shift_counts.get) if shift_counts else None,
+            'late': sum(1 for code in cells if code in times and times[code][1] > late_end),
+        }
+    return state
+
+class TeamSolver:
+    """Fills one team's month"""
+
+    def __init__(self, members, dates, targets, times, rules, leave, history, plan, late_end=DEFAULT_LATE_END):
+        self.members = members
+        self.dates = dates
+        self.targets = targets
+        self.times = times
+        self.rules = rules
+        self.min_rest = rules['min_rest_hours'] * 60
+        self.max_run = rules['max_consecutive_days']
+        self.history = history
+        self.plan = plan
+        self.late_end = late_end
+        # grid[m][d]: code; None until filled. Leave is fixed.
+        self.grid = [[leave.get((emp_id, day)) for day in dates] for _, emp_id in members]
+        self.fixed = [[code is not None for code in row] for row in self.grid]
+        self.late = [history.get(emp_id, {}).get('late', 0) for _, emp_id in members]
+        self.kept_days = 0
+        self.short_slots = 0
+
+    def slots(self, day):
+        """Shift codes needed on a day, latest start first"""
+        needed = []
+        for code, value in self.targets.items():
+            if code in self.times:
+                needed += [code] * daily_target(value, day)
+        return sorted(needed, key=lambda code: -self.times[code][0])
+
+    def off_pattern(self):
+        """Weekday each member's days off start on: carried over, else where they are least missed"""
+        spare = []
+        for day in self.dates[:7]:
+            spare.append(len(self.members) - len(self.slots(day)))
+        load = [0] * 7
+        pattern = []
+        for _, emp_id in self.members:
+            start = self.history.get(emp_id, {}).get('off_start')
+            if start is None:
+                # The pair of weekdays with the most spare people left
+                start = max(range(7), key=lambda weekday: (
+                    min(spare[(weekday - self.dates[0].weekday()) % 7] - load[weekday],
+                        spare[(weekday + 1 - self.dates[0].weekday()) % 7] - load[(weekday + 1) % 7]),
+                    -weekday,
+                ))
+            load[start] += 1
+            load[(start + 1) % 7] += 1
+            pattern.append(start)
+        return pattern
+
+    def working(self, member):
+        """Working-day flags of a member (unfilled days count as working)"""
+        return [code is None or code in self.times for code in self.grid[member]]
+
+    def longest_run(self, member):
+        """Longest run of working days, counting the run carried over from last month"""
+        run = self.history.get(self.members[member][1], {}).get('run', 0)
+        longest = run
+        for works in self.working(member):
+            run = run + 1 if works else 0
+            longest = max(longest, run)
+        return longest
+
+    def place_days_off(self):
+        """Days off from the plan or the weekly pattern, then local search to cover short days"""
+        pattern = self.off_pattern()
+        for member, (_, emp_id) in enumerate(self.members):
+            planned = self.plan.get(emp_id)
+            for column, day in enumerate(self.dates):
+                if self.fixed[member][column]:
+                    continue
+                if planned is not None and planned[column] is not None:
+                    if planned[column] == 'DO':
+                        self.grid[member][column] = 'DO'
+                elif (day.weekday() - pattern[member]) % 7 < DAYS_OFF:
+                    self.grid[member][column] = 'DO'
+
+        available = [sum(1 for row in self.grid if row[column] is None) for column in range(len(self.dates))]
+        needed = [len(self.slots(day)) for day in self.dates]
+        for column in range(len(self.dates)):
+            for member in range(len(self.members)):
+                if available[column] >= needed[column]:
+                    break
+                if self.grid[member][column] != 'DO' or self.fixed[member][column]:
+                    continue
+                # Move this day off to a nearby day with people to spare
+                for other in sorted(range(max(0, column - OFF_DAY_REACH), min(len(self.dates), column + OFF_DAY_REACH + 1)),
+                                    key=lambda other: abs(other - column)):
+                    if (other == column or self.grid[member][other] is not None
+                            or available[other] - 1 < needed[other]):
+                        continue
+                    self.grid[member][column], self.grid[member][other] = None, 'DO'
+                    if self.longest_run(member) <= self.max_run:
+                        available[column] += 1
+                        available[other] -= 1
+                        break
+                    self.grid[member][column], self.grid[member][other] = 'DO', None
+
+    def previous_end(self, member, column):
+        """End of the member's shift the day before, in minutes from this day's midnight (-inf if off)"""
+        if column:
+            previous = self.grid[member][column - 1]
+            end = self.times[previous][1] - 1440 if previous in self.times else None
+        else:
+            end = self.history.get(self.members[member][1], {}).get('end')
+        return float('-inf') if end is None else end
+
+    def rest_ok(self, member, column, code):
+        """True if `code` on `column` leaves enough rest after the member's previous day"""
+        return self.times[code][0] - self.previous_end(member, column) >= self.min_rest
+
+    def keep_planned(self, column, open_members):
+        """Use the plan's shifts for a day if they still meet the targets and rest rules"""
+        codes = []
+        for member in open_members:
+            planned = self.plan.get(self.members[member][1])
+            code = planned[column] if planned is not None else None
+            if code not in self.times or not self.rest_ok(member, column, code):
+                return False
+            codes.append(code)
+        needed = self.slots(self.dates[column])
+        if any(codes.count(code) < needed.count(code) for code in set(needed)):
+            return False
+        for member, code in zip(open_members, codes):
+            self.grid[member][column] = code
+        self.kept_days += 1
+        return True
+
+    def fill_day(self, column):
+        """Assign shifts to everyone working on a day"""
+        open_members = [member for member in range(len(self.members)) if self.grid[member][column] is None]
+        if not open_members or (self.plan and self.keep_planned(column, open_members)):
+            return
+        slots = self.slots(self.dates[column])
+        self.short_slots += max(0, len(slots) - len(open_members))
+        # People beyond the targets work their usual shift (or the team's most needed one)
+        for member in open_members[len(slots):]:
+            usual = self.history.get(self.members[member][1], {}).get('usual')
+            slots.append(usual if usual in self.times else (slots[0] if slots else next(iter(self.times))))
+        slots = sorted(slots[:len(open_members)], key=lambda code: -self.times[code][0])
+
+        # Late shifts go to whoever has had the fewest; the others by latest previous shift
+        # end first, so those who finished late yesterday get the later starts
+        remaining = sorted(open_members, key=lambda member: (self.late[member], member))
+        for code in slots:
+            if self.times[code][1] > self.late_end:
+                choice = next((member for member in remaining if self.rest_ok(member, column, code)), remaining[0])
+                self.late[choice] += 1
+            else:
+                choice = max(remaining, key=lambda member: self.previous_end(member, column))
+            remaining.remove(choice)
+            self.grid[choice][column] = code
+
+        # Swap shifts between team members to repair rest violations
+        for member in open_members:
+            code = self.grid[member][column]
+            if self.rest_ok(member, column, code):
+                continue
+            for partner in open_members:
+                other = self.grid[partner][column]
+                if other != code and self.rest_ok(member, column, other) and self.rest_ok(partner, column, code):
+                    self.grid[member][column], self.grid[partner][column] = other, code
+                    break
+
+    def solve(self):
+        """The filled month: one list of codes per member"""
+        self.place_days_off()
+        for column in range(len(self.dates)):
+            self.fill_day(column)
+        return self.grid
+
+def solve_month(teams, dates, targets, definitions=DEFAULT_SHIFT_DEFINITIONS, rules=None, leave=None,
+                history=None, plan=None):
+    """Fill a month for every team.
+
+    `teams` is a list of (team, [(name, id)]), `targets` {team: {code: count or [7 counts]}},
+    `leave` {(id, date): code} of pre-approved leave, `history` the history_state() of the
+    previous month and `plan` {id: [code or None per date]} of an existing plan to keep
+    where it is still valid. Returns (teams as write_roster_csv() takes them, days kept
+    from the plan, target slots left empty for want of people).
+    """
+    rules = dict(DEFAULT_RULES, **(rules or {}))
+    times = shift_times(definitions)
+    filled = []
+    kept = short = 0
+    for team, members in teams:
+        solver = TeamSolver(members, dates, targets.get(team, {}), times, rules, leave or {}, history or {},
+                            {emp_id: plan[emp_id] for _, emp_id in members if emp_id in (plan or {})})
+        grid = solver.solve()
+        kept += solver.kept_days
+        short += solver.short_slots
+        filled.append((team, [(name, emp_id, row) for (name, emp_id), row in zip(members, grid)]))
+    return filled, kept, short
+
+def read_sheet(path):
+    """Roster of one sheet export"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_roster_csv(f.read())
+
+def read_leave(path, dates):
+    """{(id, date): code} from a CSV with id, date (YYYY-MM-DD) and code columns"""
+    leave = {}
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            day = datetime.date.fromisoformat(row['date'].strip())
+            if dates[0] <= day <= dates[-1]:
+                leave[(row['id'].strip(), day)] = row['code'].strip().upper()
+    return leave
+
+def plan_cells(roster, dates):
+    """{id: [code or None per date]} of a plan sheet for the month"""
+    positions = {header: idx for idx, header in enumerate(roster['headers'])}
+    columns = [positions.get(date_header(day)) for day in dates]
+    plan = {}
+    for emp in roster['allEmployees']:
+        schedule = emp['schedule']
+        plan[emp['id']] = [
+            (schedule[idx].strip().upper() or None) if idx is not None and idx < len(schedule) else None
+            for idx in columns
+        ]
+    return plan
+
+def month_teams(previous, plan_roster=None, history=None):
+    """[(team, [(name, id)])]: the plan's teams, else the previous month's minus leavers"""
+    if plan_roster is not None:
+        return [(team, [(emp['name'], emp['id']) for emp in members])
+                for team, members in plan_roster['teams'].items() if members]
+    teams = {}
+    for emp in previous['employees']:
+        if history is None or emp['id'] in history:
+            teams.setdefault(emp['team'], []).append((emp['name'], emp['id']))
+    return list(teams.items())
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Fill next month's roster from coverage targets and rest rules")
+    parser.add_argument('--month', required=True, help='Month to fill, YYYY-MM')
+    parser.add_argument('--previous', required=True, nargs='+',
+                        help='Sheet export(s) of the previous month(s), oldest first (warm start and teams)')
+    parser.add_argument('--plan', help="Existing sheet for the month: valid team-days are kept, only changes re-solved")
+    parser.add_argument('--targets', help='JSON {team: {code: count or [Mon..Sun counts]}} (default: from --previous)')
+    parser.add_argument('--leave', help='CSV of pre-approved leave with id, date and code columns')
+    parser.add_argument('--min-rest', type=float, default=DEFAULT_RULES['min_rest_hours'],
+                        help='Fewest hours between shifts (default: 11)')
+    parser.add_argument('--max-consecutive', type=int, default=DEFAULT_RULES['max_consecutive_days'],
+                        help='Most working days in a row (default: 6)')
+    parser.add_argument('--output', '-o', help='Sheet CSV to write (default: stdout)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    dates = month_dates(args.month)
+    # The previous sheets end right before the month, which dates their headers
+    previous = history_grid([read_sheet(path) for path in args.previous],
+                            today=dates[0] - datetime.timedelta(days=1))
+    history = history_state(previous)
+    if args.targets:
+        with open(args.targets, 'r', encoding='utf-8') as f:
+            targets = json.load(f)
+    else:
+        targets = targets_from_grid(previous)
+    plan_roster = read_sheet(args.plan) if args.plan else None
+    rules = {'min_rest_hours': args.min_rest, 'max_consecutive_days': args.max_consecutive}
+
+    teams = month_teams(previous, plan_roster, history)
+    filled, kept, short = solve_month(
+        teams, dates, targets, rules=rules,
+        leave=read_leave(args.leave, dates) if args.leave else None,
+        history=history, plan=plan_cells(plan_roster, dates) if plan_roster else None,
+    )
+    elapsed = time.perf_counter() - start
+
+    stream = io.StringIO()
+    write_roster_csv(stream, filled, dates)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            f.write(stream.getvalue())
+    else:
+        sys.stdout.write(stream.getvalue())
+
+    employees = sum(len(members) for _, members in filled)
+    grid = history_grid([parse_roster_csv(stream.getvalue())], today=dates[-1])
+    counts = violation_counts(validate_grid(grid, rules=dict(DEFAULT_RULES, **rules)))
+    summary = ', '.join(f'{count} {rule}' for rule, count in counts.items() if count) or 'no rule violations'
+    print(f"🧩 Filled {employees} employees x {len(dates)} days in {elapsed:.2f}s "
+          f"({kept} team-days kept from the plan, {short} target slots unfilled): {summary}", file=sys.stderr)
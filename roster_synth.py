@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Synthetic Rosters for the Cartup CxP Roster Management System.
+Generates seeded, realistic monthly roster sheets in the exact layout of the published
+Google Sheets, for any number of employees, teams and months: team names only on the
+first row of each team, weekly shift rotations drawn from each team's shift mix, two
+days off a week, holiday and sick/casual/emergency leave, new joiners with blank and
+training (T) days before they start, leavers with blank days after they go, padded names,
+trailing summary counts and the daily count rows at the bottom. The same seed always
+gives the same sheets, so benchmarks and tests can be compared run to run.
+
+    python roster_synth.py --employees 10000 --teams 8 --months 3 --output synthetic/
+"""
+
+import argparse
+import calendar
+import datetime
+import io
+import os
+
+import numpy as np
+
+from roster import SUMMARY_CODES, FOOTER_ROWS, write_roster_csv
+
+# Day codes in generated matrices; index 0 is a blank cell
+CODES = ['', 'M2', 'M3', 'M4', 'D1', 'D2', 'G', 'DO', 'SL', 'CL', 'EL', 'HL', 'T']
+CODE_INDEX = {code: idx for idx, code in enumerate(CODES)}
+SHIFTS = ['M2', 'M3', 'M4', 'D1', 'D2']
+
+# Team name, share of employees, weights of SHIFTS (like the published sheet)
+TEAM_PROFILES = [
+    ('VOICE', 0.15, [0.30, 0.05, 0.00, 0.30, 0.35]),
+    ('Control Tower', 0.25, [0.00, 0.70, 0.00, 0.30, 0.00]),
+    ('CS IR', 0.20, [0.00, 0.85, 0.05, 0.10, 0.00]),
+    ('PSC IR', 0.20, [0.00, 0.80, 0.10, 0.10, 0.00]),
+    ('Digital', 0.15, [0.05, 0.55, 0.00, 0.20, 0.20]),
+    ('TL', 0.05, [0.00, 1.00, 0.00, 0.00, 0.00]),
+]
+
+FIRST_NAMES = [
+    'Nazmul', 'Atquia', 'Shaima', 'Saiful', 'Tahmim', 'Farjana', 'Sirajum', 'Tanvin', 'Iktadar',
+    'Humayera', 'Meem', 'Rafiqul', 'Nusrat', 'Mahmudul', 'Sadia', 'Arif', 'Tasnim', 'Rakib',
+    'Fahima', 'Imran', 'Jannatul', 'Kamrul', 'Lamia', 'Mehedi', 'Nabila', 'Obaidul', 'Priya',
+    'Rashed', 'Sumaiya', 'Tanvir', 'Umme', 'Wasif', 'Yasmin', 'Zahid', 'Cliton', 'Anika',
+]
+LAST_NAMES = [
+    'Hossain', 'Firooz', 'Akhter', 'Islam', 'Hasan', 'Alam', 'Munira', 'Ahmed', 'Maruf', 'Monjur',
+    'Chowdhury', 'Rahman', 'Karim', 'Sultana', 'Uddin', 'Begum', 'Sarkar', 'Khan', 'Das', 'Roy',
+    'Haque', 'Mia', 'Siddique', 'Talukder', 'Bhuiyan', 'Kabir', 'Nahar', 'Parvez', 'Zinia',
+]
+
+# Chances per working day
+SICK_LEAVE = 0.012
+CASUAL_LEAVE = 0.006
+EMERGENCY_LEAVE = 0.002
+SHIFT_SWAP = 0.08
+# Chances per employee
+NEW_JOINER = 0.03
+LEAVER = 0.02
+PADDED_NAME = 0.04
+MISSING_SUMMARY = 0.03
+
+def team_names(count):
+    """Names of `count` teams: the published sheet's teams, then numbered copies"""
+    names = []
+    for idx in range(count):
+        name = TEAM_PROFILES[idx % len(TEAM_PROFILES)][0]
+        names.append(name if idx < len(TEAM_PROFILES) else f'{name} {idx // len(TEAM_PROFILES) + 1}')
+    return names
+
+def month_starts(start, months):
+    """First day of `months` consecutive months from a "YYYY-MM" string"""
+    year, month = (int(part) for part in start.split('-'))
+    firsts = []
+    for _ in range(months):
+        firsts.append(datetime.date(year, month, 1))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return firsts
+
+def make_staff(employees, teams, first, days, seed=0):
+    """Employee table shared by every month from `first` for `days` days: names, IDs, teams,
+    working patterns and the day (from `first`) each employee joins and leaves"""
+    rng = np.random.default_rng([seed, 0])
+    profiles = [TEAM_PROFILES[idx % len(TEAM_PROFILES)] for idx in range(teams)]
+    shares = np.array([share for _, share, _ in profiles])
+    team = np.sort(rng.choice(teams, size=employees, p=shares / shares.sum()))
+    first_name = rng.integers(len(FIRST_NAMES), size=employees)
+    last_name = rng.integers(len(LAST_NAMES), size=employees)
+    padded = rng.random(employees) < PADDED_NAME
+    names = [
+        f'{FIRST_NAMES[f]} {LAST_NAMES[l]}' + ('        ' if pad else '')
+        for f, l, pad in zip(first_name.tolist(), last_name.tolist(), padded.tolist())
+    ]
+    weights = np.array([weights for _, _, weights in profiles], dtype=float)
+    joins = np.where(rng.random(employees) < NEW_JOINER, rng.integers(1, days, size=employees), 0)
+    leaves = np.where(rng.random(employees) < LEAVER, rng.integers(1, days + 1, size=employees), days)
+    return {
+        'teams': team_names(teams),
+        'team': team,
+        'names': names,
+        'ids': [f'SLL-{80000 + idx}' for idx in range(employees)],
+        'shift_cdf': np.cumsum(weights / weights.sum(axis=1, keepdims=True), axis=1),
+        # Weekday of the first of each employee's two weekly days off (Friday most often)
+        'off_day': rng.choice(7, size=employees, p=[0.08, 0.08, 0.08, 0.10, 0.30, 0.26, 0.10]),
+        'first': first,
+        'joins': joins,
+        'leaves': np.maximum(leaves, joins + 1),
+        'missing_summary': rng.random(employees) < MISSING_SUMMARY,
+    }
+
+def month_codes(staff, first, seed=0):
+    """Employees x days matrix of CODES indexes for the month starting at `first`"""
+    rng = np.random.default_rng([seed, first.year, first.month])
+    employees = len(staff['ids'])
+    days = calendar.monthrange(first.year, first.month)[1]
+    weekday = (first.weekday() + np.arange(days)) % 7
+    week = (np.arange(days) + first.weekday()) // 7
+
+    # Weekly shift from the team's mix, with the odd single-day swap
+    cdf = staff['shift_cdf'][staff['team']]
+    weekly = (rng.random((employees, week[-1] + 1))[:, :, None] > cdf[:, None, :]).sum(axis=2)
+    daily = (rng.random((employees, days))[:, :, None] > cdf[:, None, :]).sum(axis=2)
+    shift = np.where(rng.random((employees, days)) < SHIFT_SWAP, daily, weekly[:, week])
+    codes = (np.array([CODE_INDEX[code] for code in SHIFTS], dtype=np.uint8)[np.minimum(shift, len(SHIFTS) - 1)])
+
+    # Two consecutive days off a week, sometimes moved for the week
+    moved = np.where(rng.random((employees, week[-1] + 1)) < 0.2, rng.integers(1, 7, (employees, week[-1] + 1)), 0)
+    off_start = (staff['off_day'][:, None] + moved[:, week]) % 7
+    off = ((weekday[None, :] - off_start) % 7) < 2
+    codes[off] = CODE_INDEX['DO']
+
+    # Leave on working days; sick leave often runs over the next day
+    roll = rng.random((employees, days))
+    working = ~off
+    sick = working & (roll < SICK_LEAVE)
+    sick[:, 1:] |= sick[:, :-1] & working[:, 1:] & (rng.random((employees, days - 1)) < 0.4)
+    codes[sick] = CODE_INDEX['SL']
+    codes[working & (roll >= SICK_LEAVE) & (roll < SICK_LEAVE + CASUAL_LEAVE)] = CODE_INDEX['CL']
+    codes[working & (roll >= SICK_LEAVE + CASUAL_LEAVE) & (roll < SICK_LEAVE + CASUAL_LEAVE + EMERGENCY_LEAVE)] = CODE_INDEX['EL']
+
+    # A public holiday or two, taken by about half of those rostered to work
+    for day in rng.choice(days, size=rng.integers(0, 3), replace=False):
+        codes[working[:, day] & (rng.random(employees) < 0.5), day] = CODE_INDEX['HL']
+
+    # New joiners are blank until they start, with two training days first; leavers are
+    # blank after their last day
+    day = (first - staff['first']).days + np.arange(days)
+    training = (day[None, :] >= staff['joins'][:, None] - 2) & (day[None, :] < staff['joins'][:, None])
+    codes[training] = CODE_INDEX['T']
+    codes[day[None, :] < staff['joins'][:, None] - 2] = CODE_INDEX['']
+    codes[day[None, :] >= staff['leaves'][:, None]] = CODE_INDEX['']
+    return codes
+
+def month_csv(staff, first, seed=0):
+    """One month's roster sheet as CSV text"""
+    codes = month_codes(staff, first, seed)
+    dates = [first + datetime.timedelta(days=day) for day in range(codes.shape[1])]
+    cells = np.array(CODES, dtype=object)[codes].tolist()
+
+    counts = np.stack([(codes == CODE_INDEX[code]).sum(axis=1) for code in SUMMARY_CODES], axis=1)
+    summaries = [
+        [''] * len(SUMMARY_CODES) if missing else [str(count) for count in row]
+        for row, missing in zip(counts.tolist(), staff['missing_summary'].tolist())
+    ]
+    footer_codes = {code for _, codes_counted in FOOTER_ROWS for code in codes_counted}
+    daily = {
+        code: (codes == CODE_INDEX[code]).sum(axis=0).tolist()
+        for code in footer_codes
+    }
+
+    teams = []
+    bounds = np.searchsorted(staff['team'], np.arange(len(staff['teams']) + 1))
+    for idx, name in enumerate(staff['teams']):
+        rows = range(bounds[idx], bounds[idx + 1])
+        if rows:
+            teams.append((name, [(staff['names'][row], staff['ids'][row], cells[row], summaries[row]) for row in rows]))
+
+    stream = io.StringIO()
+    write_roster_csv(stream, teams, dates, footer=daily)
+    return stream.getvalue()
+
+def generate_months(employees=100, teams=6, months=1, start='2025-10', seed=0):
+    """(first day of month, CSV text) of each generated month"""
+    firsts = month_starts(start, months)
+    last = firsts[-1]
+    days = (last - firsts[0]).days + calendar.monthrange(last.year, last.month)[1]
+    staff = make_staff(employees, teams, firsts[0], days, seed)
+    return [(first, month_csv(staff, first, seed)) for first in firsts]
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate seeded synthetic roster sheets')
+    parser.add_argument('--employees', '-n', type=int, default=100, help='Number of employees (default: 100)')
+    parser.add_argument('--teams', type=int, default=len(TEAM_PROFILES), help='Number of teams (default: 6)')
+    parser.add_argument('--months', type=int, default=1, help='Number of months (default: 1)')
+    parser.add_argument('--start', default='2025-10', help='First month as YYYY-MM (default: 2025-10)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument('--output', '-o', default='synthetic', help='Output directory (default: synthetic)')
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    for first, text in generate_months(args.employees, args.teams, args.months, args.start, args.seed):
+        path = os.path.join(args.output, f'roster_{first:%Y-%m}.csv')
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        print(f"🗓️  {path}: {args.employees} employees, {len(text) / 1024:.0f} KB")
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+XLSX Roster Export for the Cartup CxP Roster Management System.
+Writes a roster as an Excel workbook instead of the flat CSV of export-csv: one sheet per
+team (employees down, dates across, header row and ID/name columns frozen), a Summary
+sheet with each team's shift code totals, a Coverage sheet with the number of people on
+shift per team and day, and the shift code Legend of the manual's appendix.
+
+Sheets are streamed row by row straight into the zip file as SpreadsheetML, so memory
+does not grow with the roster and a year of 10,000 employees exports in seconds (openpyxl,
+even in write-only mode, builds a Python object per cell and takes about a minute).
+
+    python roster_xlsx.py --tenant <tenant-id> -o roster.xlsx
+    python roster_xlsx.py roster_2025-*.csv -o roster_2025.xlsx
+"""
+
+import argparse
+import datetime
+import os
+import re
+import time
+import zipfile
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+from i18n import _
+from manual_content import load_content
+from package_writer import DEFAULT_XML_LEVEL
+from roster import combine_grids, grid_days, roster_grid, shift_times
+from tenant_data import DATA_DIR, DEFAULT_SHIFT_DEFINITIONS, load_tenant, shift_code_rows
+
+MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+# Excel stores dates as days since 1899-12-30
+EXCEL_EPOCH = datetime.date(1899, 12, 30).toordinal()
+# Rows joined before each write to the zip stream
+ROW_BATCH = 512
+# Styles of styles.xml: plain, bold header, bold date header
+STYLE_BOLD = 1
+STYLE_DATE = 2
+STYLES = (
+    f'<styleSheet xmlns="{MAIN_NS}">'
+    '<numFmts count="1"><numFmt numFmtId="164" formatCode="d mmm"/></numFmts>'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="3"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '<xf numFmtId="164" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1" applyNumberFormat="1"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+_INVALID_XML = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+def column_letter(index):
+    """0 -> A, 26 -> AA"""
+    letters = ''
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+def sheet_names(titles, reserved=()):
+    """Valid, unique Excel sheet names for `titles` (at most 31 characters, no []:*?/\\)"""
+    used = {name.lower() for name in reserved}
+    names = []
+    for title in titles:
+        base = re.sub(r'[\[\]:*?/\\]', '_', title or '').strip("' ")[:31] or 'Sheet'
+        name, number = base, 2
+        while name.lower() in used:
+            suffix = f' ({number})'
+            name, number = base[:31 - len(suffix)] + suffix, number + 1
+        used.add(name.lower())
+        names.append(name)
+    return names
+
+def text_cell(ref, value, style=0):
+    """Inline string cell"""
+    value = _INVALID_XML.sub('', str(value))
+    space = ' xml:space="preserve"' if value != value.strip() else ''
+    style = f' s="{style}"' if style else ''
+    return f'<c r="{ref}"{style} t="inlineStr"><is><t{space}>{escape(value)}</t></is></c>'
+
+def number_cell(ref, value, style=0):
+    """Numeric cell"""
+    style = f' s="{style}"' if style else ''
+    return f'<c r="{ref}"{style}><v>{value}</v></c>'
+
+def table_row(number, values, style=0):
+    """<row> of text and number cells from column A"""
+    cells = [(text_cell if isinstance(value, str) else number_cell)(f'{column_letter(idx)}{number}', value, style)
+             for idx, value in enumerate(values) if value is not None and value != '']
+    return f'<row r="{number}">{"".join(cells)}</row>'
+
+def sheet_head(freeze=None, widths=()):
+    """Start of a worksheet up to <sheetData>, with the first `freeze` (columns, rows) frozen"""
+    view = ''
+    if freeze:
+        columns, rows = freeze
+        view = (f'<sheetViews><sheetView workbookViewId="0"><pane xSplit="{columns}" ySplit="{rows}" '
+                f'topLeftCell="{column_letter(columns)}{rows + 1}" activePane="bottomRight" state="frozen"/>'
+                '</sheetView></sheetViews>')
+    cols = ''.join(f'<col min="{idx}" max="{idx}" width="{width}" customWidth="1"/>'
+                   for idx, width in enumerate(widths, 1) if width)
+    return f'<worksheet xmlns="{MAIN_NS}" xmlns:r="{REL_NS}">{view}' \
+           + (f'<cols>{cols}</cols>' if cols else '') + '<sheetData>'
+
+SHEET_TAIL = '</sheetData></worksheet>'
+
+def write_rows(stream, rows):
+    """Write an iterable of row XML strings to a binary stream in batches"""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= ROW_BATCH:
+            stream.write(''.join(batch).encode('utf-8'))
+            batch = []
+    if batch:
+        stream.write(''.join(batch).encode('utf-8'))
+
+def team_rows(grid, members, serials):
+    """Row XML of a team sheet: header then one row per employee in `members`"""
+    first = 2
+    letters = [column_letter(first + idx) for idx in range(len(serials))]
+    header = [text_cell('A1', _('Employee ID'), STYLE_BOLD), text_cell('B1', _('Name'), STYLE_BOLD)]
+    header += [number_cell(f'{letter}1', serial, STYLE_DATE) for letter, serial in zip(letters, serials)]
+    yield f'<row r="1">{"".join(header)}</row>'
+    # Shared string number of each code (the string table holds the codes in grid order)
+    matrix = grid['matrix']
+    employees = grid['employees']
+    for number, row in enumerate(members.tolist(), 2):
+        emp = employees[row]
+        suffix = f'{number}" t="s"><v>'
+        cells = [text_cell(f'A{number}', emp.get('id') or ''), text_cell(f'B{number}', emp.get('name') or '')]
+        cells += [f'<c r="{letter}{suffix}{code - 1}</v></c>'
+                  for letter, code in zip(letters, matrix[row].tolist()) if code]
+        yield f'<row r="{number}">{"".join(cells)}</row>'
+
+def shift_code_legend(definitions):
+    """(code, time/type, description) rows of the appendix's Shift Codes Reference"""
+    descriptions = {item['code']: item['description'] for item in load_content()['appendix']['shift_codes']}
+    return [(code, _(time_type), _(description))
+            for code, time_type, description in shift_code_rows(descriptions, {'shift_definitions': definitions})]
+
+def team_summaries(grid, definitions):
+    """Per team: (members row numbers, code totals over grid codes, people on shift per column)"""
+    matrix = grid['matrix']
+    times = shift_times(definitions)
+    working = np.array([code in times for code in grid['codes']])
+    summaries = []
+    for team in range(len(grid['teams'])):
+        members = np.flatnonzero(grid['team_index'] == team)
+        block = matrix[members]
+        totals = np.bincount(block.ravel(), minlength=len(grid['codes']))
+        on_shift = working[block].sum(axis=0) if len(members) else np.zeros(matrix.shape[1], dtype=np.int64)
+        summaries.append((members, totals, on_shift))
+    return summaries
+
+def export_xlsx(grid, output, definitions=DEFAULT_SHIFT_DEFINITIONS, year=None, level=DEFAULT_XML_LEVEL):
+    """Write the workbook to `output`; returns the sheet names"""
+    serials = [int(day) - EXCEL_EPOCH for day in grid_days(grid, year)]
+    summaries = team_summaries(grid, definitions)
+    fixed = [_('Summary'), _('Coverage'), _('Legend')]
+    team_sheets = sheet_names(grid['teams'], fixed)
+    names = team_sheets + fixed
+    codes = [code for code in grid['codes'] if code]
+    times = shift_times(definitions)
+
+    tmp = f'{output}.{os.getpid()}.tmp'
+    try:
+        with zipfile.ZipFile(tmp, 'w', zipfile.ZIP_DEFLATED if level else zipfile.ZIP_STORED,
+                             compresslevel=level or None) as package:
+            def sheet(number, head, rows):
+                with package.open(f'xl/worksheets/sheet{number}.xml', 'w', force_zip64=True) as stream:
+                    stream.write(head.encode('utf-8'))
+                    write_rows(stream, rows)
+                    stream.write(SHEET_TAIL.encode('utf-8'))
+
+            for number, (members, _totals, _on_shift) in enumerate(summaries, 1):
+                sheet(number, sheet_head((2, 1), [12, 24]), team_rows(grid, members, serials))
+
+            number = len(summaries)
+            header = [_('Team'), _('Employees')] + codes + [_('Shifts')]
+            summary = [table_row(1, header, STYLE_BOLD)]
+            for row, (team, (members, totals, _on_shift)) in enumerate(zip(grid['teams'], summaries), 2):
+                shifts = sum(int(totals[idx]) for idx, code in enumerate(grid['codes']) if code in times)
+                summary.append(table_row(row, [team, len(members)] + [int(value) for value in totals[1:]] + [shifts]))
+            sheet(number + 1, sheet_head((1, 1), [24]), summary)
+
+            letters = [column_letter(1 + idx) for idx in range(len(serials))]
+            header = text_cell('A1', _('Team'), STYLE_BOLD) + ''.join(
+                number_cell(f'{letter}1', serial, STYLE_DATE) for letter, serial in zip(letters, serials))
+            coverage = [f'<row r="1">{header}</row>']
+            for row, (team, (_members, _totals, on_shift)) in enumerate(zip(grid['teams'], summaries), 2):
+                coverage.append(f'<row r="{row}">{text_cell(f"A{row}", team)}'
+                                + ''.join(f'<c r="{letter}{row}"><v>{count}</v></c>'
+                                          for letter, count in zip(letters, on_shift.tolist())) + '</row>')
+            sheet(number + 2, sheet_head((1, 1), [24]), coverage)
+
+            legend = [table_row(1, [_('Code'), _('Time/Type'), _('Description')], STYLE_BOLD)]
+            legend += [table_row(row, list(values)) for row, values in enumerate(shift_code_legend(definitions), 2)]
+            sheet(number + 3, sheet_head(None, [8, 18, 40]), legend)
+
+            strings = ''.join(f'<si><t>{escape(_INVALID_XML.sub("", code))}</t></si>' for code in codes)
+            package.writestr('xl/sharedStrings.xml', f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                             f'<sst xmlns="{MAIN_NS}" count="{len(codes)}" uniqueCount="{len(codes)}">{strings}</sst>')
+            package.writestr('xl/styles.xml', '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n' + STYLES)
+            sheets = ''.join(f'<sheet name="{escape(name, {chr(34): "&quot;"})}" sheetId="{idx}" r:id="rId{idx}"/>'
+                             for idx, name in enumerate(names, 1))
+            package.writestr('xl/workbook.xml', '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                             f'<workbook xmlns="{MAIN_NS}" xmlns:r="{REL_NS}"><sheets>{sheets}</sheets></workbook>')
+            rels = ''.join(f'<Relationship Id="rId{idx}" Type="{REL_NS}/worksheet" Target="worksheets/sheet{idx}.xml"/>'
+                           for idx in range(1, len(names) + 1))
+            rels += (f'<Relationship Id="rId{len(names) + 1}" Type="{REL_NS}/styles" Target="styles.xml"/>'
+                     f'<Relationship Id="rId{len(names) + 2}" Type="{REL_NS}/sharedStrings" Target="sharedStrings.xml"/>')
+            package.writestr('xl/_rels/workbook.xml.rels', '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                             f'<Relationships xmlns="{PKG_REL_NS}">{rels}</Relationships>')
+            package.writestr('_rels/.rels', '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                             f'<Relationships xmlns="{PKG_REL_NS}"><Relationship Id="rId1" '
+                             f'Type="{REL_NS}/officeDocument" Target="xl/workbook.xml"/></Relationships>')
+            overrides = ''.join(f'<Override PartName="/xl/worksheets/sheet{idx}.xml" ContentType="application/'
+                                'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                                for idx in range(1, len(names) + 1))
+            package.writestr('[Content_Types].xml', '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                             '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                             '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                             '<Default Extension="xml" ContentType="application/xml"/>'
+                             '<Override PartName="/xl/workbook.xml" ContentType="application/'
+                             'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+                             '<Override PartName="/xl/styles.xml" ContentType="application/'
+                             'vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+                             '<Override PartName="/xl/sharedStrings.xml" ContentType="application/'
+                             f'vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>{overrides}</Types>')
+    except BaseException:
+        os.remove(tmp)
+        raise
+    os.replace(tmp, output)
+    return names
+
+if __name__ == '__main__':
+    from i18n import available_locales, set_locale
+
+    parser = argparse.ArgumentParser(description='Export a roster as an XLSX workbook with one sheet per team')
+    parser.add_argument('csv', nargs='*', help='Roster sheet exports, oldest first (e.g. one per month)')
+    parser.add_argument('--tenant', help="Export a tenant's current roster")
+    parser.add_argument('--data-dir', default=DATA_DIR, help='Application data directory (default: data)')
+    parser.add_argument('--output', '-o', default='roster.xlsx', help='Workbook to write (default: roster.xlsx)')
+    parser.add_argument('--year', type=int, help='Year of the first date column (default: the roster ends at most a few months from now)')
+    parser.add_argument('--level', type=int, choices=range(10), default=DEFAULT_XML_LEVEL,
+                        help=f'Deflate level, 0 to store (default: {DEFAULT_XML_LEVEL})')
+    parser.add_argument('--locale', choices=available_locales(), help='Write headings and the legend in this language')
+    args = parser.parse_args()
+
+    if args.locale:
+        set_locale(args.locale)
+    if args.tenant:
+        tenant = load_tenant(args.tenant, args.data_dir)
+        grid, definitions = roster_grid(tenant['roster']), tenant['shift_definitions']
+    elif args.csv:
+        # Months parsed by an earlier run come from the ingest cache, which this only adds to
+        from roster_ingest import load_months, parse_source
+        grid = combine_grids(load_months([parse_source(path) for path in args.csv]), args.year)
+        definitions = DEFAULT_SHIFT_DEFINITIONS
+    else:
+        parser.error('give roster CSV files or --tenant')
+
+    started = time.perf_counter()
+    names = export_xlsx(grid, args.output, definitions, args.year, args.level)
+    print(f"📊 {args.output}: {len(names)} sheets, {len(grid['employees'])} employees x {len(grid['dates'])} days "
+          f"in {time.perf_counter() - started:.1f}s")
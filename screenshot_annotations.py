@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Screenshot Annotations for the Cartup CxP Roster Management System manual.
+Arrows, highlight boxes and numbered callouts are declared next to each add_screenshot()
+call in generate_manual.py instead of being painted onto the files by hand, so a
+re-captured screen gets its annotations back automatically:
+
+    add_screenshot(doc, 'MANUAL_SCREENSHOTS/client/02_client_dashboard_main.png',
+                   _('Client Dashboard Overview'), annotations=[
+                       {'box': [40, 120, 300, 80], 'label': _('Action Buttons')},
+                       {'highlight': [40, 220, 600, 140]},
+                       {'arrow': [700, 60, 560, 140]},
+                       {'callout': [380, 150]},
+                   ])
+
+Coordinates are pixels of the source image: box and highlight take [x, y, width, height],
+arrow [from x, from y, to x, to y] (the head is at the "to" end) and callout the [x, y]
+centre of a numbered circle (numbered 1, 2, ... in order unless it has a 'number').
+Any shape may have a 'label' and a 'color' ("#RRGGBB").
+
+Rendered images are cached in .cache/annotated/ under a hash of the source image and the
+annotation spec. Before a manual build, every annotation declared in generate_manual.py
+is rendered in one parallel batch, so only new or changed screenshots are drawn.
+
+    python screenshot_annotations.py          # render every declared annotation
+"""
+
+import argparse
+import ast
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageDraw, ImageFont
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(ROOT_DIR, '.cache', 'annotated')
+# Bump when the drawing code changes so old renders are not reused
+RENDER_VERSION = 1
+
+DEFAULT_COLOR = '#E11D48'
+HIGHLIGHT_COLOR = '#FACC15'
+SHAPES = ('box', 'highlight', 'arrow', 'callout')
+# Fonts tried for labels, first found wins; Pillow's built-in font otherwise
+FONT_CANDIDATES = [
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
+    '/usr/share/fonts/truetype/noto/NotoSans-Bold.ttf',
+    '/Library/Fonts/Arial Bold.ttf',
+    '/System/Library/Fonts/Supplemental/Arial Bold.ttf',
+    'C:\\Windows\\Fonts\\arialbd.ttf',
+]
+
+def font_path():
+    """Label font file, or None for Pillow's built-in font"""
+    return next((path for path in FONT_CANDIDATES if os.path.exists(path)), None)
+
+def load_font(size):
+    """Label font at `size` pixels"""
+    path = font_path()
+    return ImageFont.truetype(path, size) if path else ImageFont.load_default(size=size)
+
+def validate(shapes):
+    """Raise ValueError for a malformed annotation spec"""
+    for shape in shapes:
+        kinds = [kind for kind in SHAPES if kind in shape]
+        if len(kinds) != 1:
+            raise ValueError(f'annotation needs exactly one of {", ".join(SHAPES)}: {shape}')
+        expected = 2 if kinds[0] == 'callout' else 4
+        coords = shape[kinds[0]]
+        if len(coords) != expected or not all(isinstance(value, (int, float)) for value in coords):
+            raise ValueError(f'"{kinds[0]}" takes {expected} numbers: {shape}')
+
+def render_key(source, shapes):
+    """Cache key of a screenshot's bytes rendered with `shapes`"""
+    digest = hashlib.sha256(source)
+    digest.update(json.dumps([RENDER_VERSION, os.path.basename(font_path() or ''), shapes],
+                             sort_keys=True, ensure_ascii=False).encode('utf-8'))
+    return digest.hexdigest()
+
+def _rgb(color, alpha=255):
+    color = color.lstrip('#')
+    return tuple(int(color[idx:idx + 2], 16) for idx in (0, 2, 4)) + (alpha,)
+
+def _label(draw, xy, text, color, font, anchor='ls'):
+    """Text on a filled tag, anchored at `xy`"""
+    left, top, right, bottom = draw.textbbox(xy, text, font=font, anchor=anchor)
+    pad = max(3, font.size // 4)
+    draw.rounded_rectangle([left - pad, top - pad, right + pad, bottom + pad], radius=pad, fill=_rgb(color))
+    draw.text(xy, text, font=font, anchor=anchor, fill=(255, 255, 255, 255))
+
+def render(source, shapes):
+    """PNG bytes of the screenshot `source` (bytes) with `shapes` drawn on it"""
+    validate(shapes)
+    image = Image.open(io.BytesIO(source)).convert('RGBA')
+    width = image.width
+    line = max(2, round(width / 400))
+    font = load_font(max(12, round(width / 70)))
+    overlay = Image.new('RGBA', image.size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    number = 0
+    for shape in shapes:
+        color = shape.get('color', HIGHLIGHT_COLOR if 'highlight' in shape else DEFAULT_COLOR)
+        label = shape.get('label')
+        if 'box' in shape or 'highlight' in shape:
+            x, y, w, h = shape.get('box') or shape['highlight']
+            if 'highlight' in shape:
+                draw.rectangle([x, y, x + w, y + h], fill=_rgb(color, 70), outline=_rgb(color), width=line)
+            else:
+                draw.rounded_rectangle([x, y, x + w, y + h], radius=line * 3, outline=_rgb(color), width=line)
+            if label:
+                _label(draw, (x + line, y - line * 3), label, color, font)
+        elif 'arrow' in shape:
+            x1, y1, x2, y2 = shape['arrow']
+            length = max(1.0, ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5)
+            ux, uy = (x2 - x1) / length, (y2 - y1) / length
+            head = line * 6
+            base = (x2 - ux * head, y2 - uy * head)
+            draw.line([x1, y1, base[0], base[1]], fill=_rgb(color), width=line * 2)
+            draw.polygon([(x2, y2), (base[0] - uy * head / 2, base[1] + ux * head / 2),
+                          (base[0] + uy * head / 2, base[1] - ux * head / 2)], fill=_rgb(color))
+            if label:
+                _label(draw, (x1, y1), label, color, font, anchor='mm')
+        else:
+            number = shape.get('number', number + 1)
+            x, y = shape['callout']
+            radius = font.size
+            draw.ellipse([x - radius, y - radius, x + radius, y + radius], fill=_rgb(color),
+                         outline=(255, 255, 255, 255), width=max(1, line // 2))
+            draw.text((x, y), str(number), font=font, anchor='mm', fill=(255, 255, 255, 255))
+            if label:
+                _label(draw, (x + radius * 1.6, y), label, color, font, anchor='lm')
+    result = Image.alpha_composite(image, overlay).convert('RGB')
+    out = io.BytesIO()
+    result.save(out, 'PNG', optimize=True)
+    return out.getvalue()
+
+def cached_path(key, cache_dir=CACHE_DIR):
+    """File of a cached render"""
+    return os.path.join(cache_dir, f'{key}.png')
+
+def annotated_screenshot(source, shapes, cache_dir=CACHE_DIR):
+    """Rendered bytes of a screenshot with annotations, from the cache when possible"""
+    path = cached_path(render_key(source, shapes), cache_dir)
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        pass
+    data = render(source, shapes)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return data
+
+def _render_file(full_path, shapes, cache_dir):
+    with open(full_path, 'rb') as f:
+        annotated_screenshot(f.read(), shapes, cache_dir)
+
+def render_batch(items, jobs=None, cache_dir=CACHE_DIR):
+    """Render [(image path, shapes)] missing from the cache in parallel: (rendered, cached)"""
+    items = [(full_path, shapes) for full_path, shapes in items if os.path.exists(full_path)]
+    missing = []
+    for full_path, shapes in items:
+        with open(full_path, 'rb') as f:
+            key = render_key(f.read(), shapes)
+        if not os.path.exists(cached_path(key, cache_dir)):
+            missing.append((full_path, shapes))
+    workers = min(jobs or os.cpu_count() or 1, len(missing))
+    if workers <= 1:
+        for full_path, shapes in missing:
+            _render_file(full_path, shapes, cache_dir)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_render_file, *zip(*missing), [cache_dir] * len(missing)))
+    return len(missing), len(items) - len(missing)
+
+def _literal(node, translate):
+    """Value of a literal expression node, allowing _('...') and N_('...') for labels"""
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in ('_', 'N_') \
+            and len(node.args) == 1 and not node.keywords:
+        text = _literal(node.args[0], translate)
+        return translate(text) if node.func.id == '_' else text
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return [_literal(item, translate) for item in node.elts]
+    if isinstance(node, ast.Dict):
+        return {_literal(key, translate): _literal(value, translate) for key, value in zip(node.keys, node.values)}
+    return ast.literal_eval(node)
+
+def declared_annotations(source_file=os.path.join(ROOT_DIR, 'generate_manual.py'), translate=None):
+    """[(image path, shapes)] of the add_screenshot() calls in `source_file` with literal
+    annotations; labels are translated with `translate` (i18n._ by default)"""
+    if translate is None:
+        from i18n import _ as translate
+    with open(source_file, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), source_file)
+    found = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == 'add_screenshot'):
+            continue
+        spec = next((kw.value for kw in node.keywords if kw.arg == 'annotations'), None)
+        if spec is None or len(node.args) < 2:
+            continue
+        try:
+            found.append((_literal(node.args[1], translate), _literal(spec, translate)))
+        except (ValueError, TypeError, SyntaxError):
+            # Built at run time; add_screenshot() renders it when it gets there
+            continue
+    return found
+
+def prerender(jobs=None, base_dir=None, cache_dir=CACHE_DIR):
+    """Render every annotation declared in generate_manual.py that is not cached yet"""
+    base_dir = base_dir or os.getcwd()
+    items = [(os.path.join(base_dir, path), shapes) for path, shapes in declared_annotations()]
+    return render_batch(items, jobs, cache_dir)
+
+if __name__ == '__main__':
+    from i18n import available_locales, set_locale
+
+    parser = argparse.ArgumentParser(description='Render the screenshot annotations declared in generate_manual.py')
+    parser.add_argument('--locale', choices=available_locales(), help='Render labels in this language')
+    parser.add_argument('--jobs', '-j', type=int, help='Worker processes (default: one per core)')
+    args = parser.parse_args()
+
+    if args.locale:
+        set_locale(args.locale)
+    declared = declared_annotations()
+    rendered, cached = prerender(args.jobs)
+    print(f"🖍️  {len(declared)} annotated screenshots: {rendered} rendered, {cached} already cached")
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Help Search Index for the Cartup CxP Roster Management System manual.
+Builds a compact, prefix-searchable inverted index of the manual's headings, paragraphs,
+tables and FAQ entries, section by section as chapters are generated, and writes it as
+JSON next to the DOCX so the web app can load it for in-app help search.
+"""
+
+import bisect
+import json
+import re
+
+from docx.oxml.ns import qn
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+from i18n import _
+
+INDEX_VERSION = 1
+
+# Document kinds and how much a match in each one counts
+KIND_HEADING = 'h'
+KIND_FAQ = 'f'
+KIND_PARAGRAPH = 'p'
+KIND_WEIGHTS = {KIND_HEADING: 3, KIND_FAQ: 2, KIND_PARAGRAPH: 1}
+
+SNIPPET_LENGTH = 160
+
+# \w alone splits Bengali words at vowel signs, so the Bengali block is added explicitly
+TOKEN_RE = re.compile(r'[\w\u0980-\u09FF]+', re.UNICODE)
+STOPWORDS = frozenset(
+    'a an and are as at be by can for from how i if in is it of on or the this to '
+    'will with you your'.split()
+)
+
+# (question, answer) labels the FAQ and troubleshooting sections start entries with
+FAQ_LABELS = (('Q:', 'A:'), ('Issue:', 'Solution:'))
+
+def tokenize(text):
+    """Lowercased word tokens of `text`, without stopwords and single characters"""
+    return [
+        tok for tok in TOKEN_RE.findall(text.lower())
+        if len(tok) > 1 and tok not in STOPWORDS
+    ]
+
+def section_anchor(heading):
+    """Stable anchor for a heading: "2.6 Requesting Shift Changes" -> "sec-2-6" """
+    match = re.match(r'^(\d+(?:\.\d+)*)\.?\s', heading)
+    if match:
+        return 'sec-' + match.group(1).replace('.', '-')
+    # Words as the search tokens see them, so Bengali vowel signs do not split a word
+    slug = '-'.join(TOKEN_RE.findall(heading.lower()))
+    return 'sec-' + (slug or 'top')
+
+def _snippet(text):
+    """Shorten text to a single-line snippet"""
+    text = ' '.join(text.split())
+    if len(text) <= SNIPPET_LENGTH:
+        return text
+    return text[:SNIPPET_LENGTH].rsplit(' ', 1)[0] + '…'
+
+def style_names(doc):
+    """Map of paragraph style id -> style name.
+
+    Paragraph.style resolves the default style by scanning every style on each call,
+    which dominates the cost of walking a long document, so callers look names up here.
+    """
+    return {style.style_id: style.name for style in doc.styles}
+
+def paragraph_style(p, names):
+    """Style name of a w:p element using a style_names() map"""
+    return names.get(p.style, 'Normal') if p.style else 'Normal'
+
+def iter_blocks(doc, start=0):
+    """Yield (style name, text) for body blocks of `doc` from child index `start`"""
+    names = style_names(doc)
+    body = doc.element.body
+    for el in list(body.iterchildren())[start:]:
+        if el.tag == qn('w:p'):
+            paragraph = Paragraph(el, doc._body)
+            yield paragraph_style(el, names), paragraph.text
+        elif el.tag == qn('w:tbl'):
+            table = Table(el, doc._body)
+            for row in table.rows:
+                cells = []
+                for cell in row.cells:
+                    if cell.text and cell.text not in cells:
+                        cells.append(cell.text)
+                yield '', ' – '.join(cells)
+
+class SearchIndexBuilder:
+    """Accumulates manual content section by section and emits a compact inverted index"""
+
+    def __init__(self):
+        self.sections = []   # [anchor, title]
+        self.docs = []       # [section number, kind, text snippet]
+        self.postings = {}   # term -> list of doc numbers (ascending)
+        self._pending_question = None
+        self._faq_prefixes = [(_(question) + ' ', _(answer) + ' ') for question, answer in FAQ_LABELS]
+
+    def add_document(self, doc, start=0):
+        """Index every body block of `doc` from child index `start` onwards"""
+        for style, text in iter_blocks(doc, start):
+            self.add_block(style, text)
+        self._flush_question()
+
+    def add_block(self, style, text):
+        """Index one paragraph or table row; headings open a new section"""
+        text = text.strip()
+        if not text:
+            return
+        if style.startswith('Heading') or style == 'Title':
+            self._flush_question()
+            self.sections.append([section_anchor(text), text])
+            self._add_doc(KIND_HEADING, text)
+            return
+        if not self.sections:
+            self.sections.append([section_anchor(''), ''])
+
+        for question, answer in self._faq_prefixes:
+            if text.startswith(question):
+                self._flush_question()
+                self._pending_question = text[len(question):]
+                return
+            if text.startswith(answer) and self._pending_question is not None:
+                question_text = self._pending_question
+                self._pending_question = None
+                self._add_doc(KIND_FAQ, question_text, text[len(answer):])
+                return
+        self._flush_question()
+        self._add_doc(KIND_PARAGRAPH, text)
+
+    def _flush_question(self):
+        """Index a question whose answer never arrived as a plain FAQ entry"""
+        if self._pending_question is not None:
+            question_text = self._pending_question
+            self._pending_question = None
+            self._add_doc(KIND_FAQ, question_text)
+
+    def _add_doc(self, kind, text, extra=''):
+        """Store a searchable entry in the current section and post its terms"""
+        doc_id = len(self.docs)
+        self.docs.append([len(self.sections) - 1, kind, _snippet(text)])
+        for term in set(tokenize(text + ' ' + extra)):
+            self.postings.setdefault(term, []).append(doc_id)
+
+    def to_dict(self):
+        """Serializable index: sorted terms with delta-encoded posting lists"""
+        terms = sorted(self.postings)
+        postings = []
+        for term in terms:
+            previous = 0
+            deltas = []
+            for doc_id in self.postings[term]:
+                deltas.append(doc_id - previous)
+                previous = doc_id
+            postings.append(deltas)
+        return {
+            'v': INDEX_VERSION,
+            'sections': self.sections,
+            'docs': self.docs,
+            'terms': terms,
+            'postings': postings,
+        }
+
+    def write(self, path):
+        """Write the index as compact JSON"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(',', ':'))
+
+def load_index(path):
+    """Load an index written by SearchIndexBuilder.write"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _prefix_docs(index, prefix):
+    """Doc numbers of every term starting with `prefix`"""
+    terms = index['terms']
+    found = set()
+    pos = bisect.bisect_left(terms, prefix)
+    while pos < len(terms) and terms[pos].startswith(prefix):
+        doc_id = 0
+        for delta in index['postings'][pos]:
+            doc_id += delta
+            found.add(doc_id)
+        pos += 1
+    return found
+
+def search(index, query, limit=10):
+    """Entries matching every query word as a prefix, best first: [(anchor, section, kind, snippet)]"""
+    words = tokenize(query)
+    if not words:
+        return []
+    matches = None
+    for word in words:
+        docs = _prefix_docs(index, word)
+        matches = docs if matches is None else matches & docs
+        if not matches:
+            return []
+    docs = index['docs']
+    ranked = sorted(matches, key=lambda d: (-KIND_WEIGHTS[docs[d][1]], d))[:limit]
+    results = []
+    for doc_id in ranked:
+        section_no, kind, snippet = docs[doc_id]
+        anchor, title = index['sections'][section_no]
+        results.append((anchor, title, kind, snippet))
+    return results
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Sheet Download Cache for the Cartup CxP Roster Management System.
+Keeps the last download of every roster sheet URL on disk with its ETag and
+Last-Modified validators and its parsed RosterData, so sheet_sync.py can send
+conditional requests: when Google answers 304 Not Modified nothing is transferred and
+nothing is parsed. Entries unused for longer than the maximum age are dropped, then the
+least recently used ones until the cache fits its size limit.
+
+    python sheet_cache.py             # list cached sheets
+    python sheet_cache.py --clear     # remove them all
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import time
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(ROOT_DIR, '.cache', 'sheets')
+DEFAULT_MAX_BYTES = 256 * 1024 ** 2
+DEFAULT_MAX_AGE = 90 * 24 * 3600
+# Files of one entry: validators, raw CSV, parsed roster
+SUFFIXES = ['.json', '.csv', '.roster.pickle']
+
+class SheetCache:
+    """Per-URL sheet bodies, validators and parsed rosters with age and size eviction"""
+
+    def __init__(self, root=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, max_age=DEFAULT_MAX_AGE):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, url, suffix='.json'):
+        """File of a URL's entry"""
+        return os.path.join(self.root, hashlib.sha256(url.encode('utf-8')).hexdigest()[:32] + suffix)
+
+    def validators(self, url):
+        """Stored validators of a URL: {'etag', 'last_modified', ...}, or None"""
+        try:
+            with open(self.path(url), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get('url') != url or not all(os.path.exists(self.path(url, suffix)) for suffix in SUFFIXES[1:]):
+            return None
+        return meta
+
+    def conditional_headers(self, url):
+        """If-None-Match / If-Modified-Since headers for a cached URL, or {}"""
+        meta = self.validators(url)
+        headers = {}
+        if meta and meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta and meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def load(self, url):
+        """Cached RosterData of a URL after a 304, or None; counts as a use for eviction"""
+        try:
+            with open(self.path(url, '.roster.pickle'), 'rb') as f:
+                roster = pickle.load(f)
+            os.utime(self.path(url))
+        except (OSError, ValueError, pickle.UnpicklingError, EOFError):
+            return None
+        self.hits += 1
+        return roster
+
+    def body_tmp(self, url):
+        """Temporary file to download a URL's body into before store()"""
+        return f'{self.path(url, ".csv")}.{os.getpid()}.tmp'
+
+    def store(self, url, headers, body_tmp, roster):
+        """Keep a fresh download (the body written to body_tmp, its response headers and roster);
+        False when the response has no validators to make it worth keeping"""
+        self.misses += 1
+        if 'etag' not in headers and 'last-modified' not in headers:
+            # A later request could never be answered with 304
+            self.remove(url)
+            return False
+        # Pickle loads about twice as fast as the same roster in JSON; the files are only
+        # ever read back by this cache
+        roster_path = self.path(url, '.roster.pickle')
+        tmp = f'{roster_path}.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as f:
+            pickle.dump(roster, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, roster_path)
+        os.replace(body_tmp, self.path(url, '.csv'))
+        meta = {
+            'url': url,
+            'etag': headers.get('etag'),
+            'last_modified': headers.get('last-modified'),
+            'fetched': time.time(),
+        }
+        # The validators go last, so they never describe a body that is not there yet
+        meta_path = self.path(url)
+        tmp = f'{meta_path}.{os.getpid()}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp, meta_path)
+        return True
+
+    def remove(self, url):
+        """Drop a URL's entry"""
+        for suffix in SUFFIXES:
+            self._remove(self.path(url, suffix))
+
+    def entries(self):
+        """(url, bytes, last used, fetched) of every entry, most recently used first"""
+        result = []
+        for name in os.listdir(self.root):
+            if not name.endswith('.json'):
+                continue
+            key = name[:-len('.json')]
+            try:
+                with open(os.path.join(self.root, name), 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                used = os.path.getmtime(os.path.join(self.root, name))
+                size = sum(os.path.getsize(os.path.join(self.root, key + suffix)) for suffix in SUFFIXES)
+            except (OSError, ValueError):
+                continue
+            result.append((meta.get('url', ''), size, used, meta.get('fetched', used)))
+        return sorted(result, key=lambda entry: -entry[2])
+
+    def prune(self, now=None):
+        """Drop entries unused for max_age, then least recently used ones beyond max_bytes"""
+        now = now or time.time()
+        removed = 0
+        total = 0
+        for url, size, used, _ in self.entries():
+            if now - used > self.max_age or total + size > self.max_bytes:
+                self.remove(url)
+                removed += 1
+            else:
+                total += size
+        # Leftovers of interrupted writes and entries without validators
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            key = name.split('.')[0]
+            if not os.path.exists(os.path.join(self.root, key + '.json')):
+                try:
+                    if now - os.path.getmtime(path) > 3600:
+                        self._remove(path)
+                except OSError:
+                    pass
+        return removed
+
+    def clear(self):
+        """Remove every entry"""
+        for name in os.listdir(self.root):
+            self._remove(os.path.join(self.root, name))
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+if __name__ == '__main__':
+    from size_report import format_size
+
+    parser = argparse.ArgumentParser(description='Inspect or clear the sheet download cache')
+    parser.add_argument('--root', default=CACHE_DIR, help='Cache directory (default: .cache/sheets)')
+    parser.add_argument('--clear', action='store_true', help='Remove every cached sheet')
+    args = parser.parse_args()
+
+    cache = SheetCache(args.root)
+    entries = cache.entries()
+    if args.clear:
+        cache.clear()
+        print(f"🧹 Removed {len(entries)} cached sheets from {args.root}")
+    else:
+        print(f"📦 {args.root}: {len(entries)} sheets, {format_size(sum(entry[1] for entry in entries))}")
+        for url, size, used, _ in entries:
+            print(f"{format_size(size):>10}  {time.strftime('%Y-%m-%d %H:%M', time.localtime(used))}  {url}")
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Google Sheets Roster Sync for the Cartup CxP Roster Management System.
+Fetches the published-CSV link of every month in the tenants' google_links.json
+concurrently, instead of one after another like syncGoogleSheetsForTenant() in
+lib/googleSync.ts. Requests share keep-alive connections with a bounded number per
+host, response bodies are fed to the roster parser as they arrive, and failed requests
+(connection errors, timeouts, 429 and 5xx responses) are retried with exponential
+backoff. Months are merged in link order like the app, so the result is the RosterData
+the app would store. Requests are conditional on the ETag/Last-Modified of the previous
+download (see sheet_cache.py), so unchanged sheets are neither transferred nor parsed.
+Tenant data is only read; exports can be saved for the other tools.
+
+    python sheet_sync.py --tenant <tenant-id>
+    python sheet_sync.py --all -o exports/      # -> exports/<tenant>/roster_<month>.csv
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import ssl
+import time
+from urllib.parse import urljoin, urlsplit
+
+from roster import RosterParser, empty_roster, merge_rosters
+from sheet_cache import CACHE_DIR, SheetCache
+from tenant_data import DATA_DIR, get_tenant_data_dir, read_json
+
+DEFAULT_PER_HOST = 16
+DEFAULT_ATTEMPTS = 4
+DEFAULT_BACKOFF = 0.5
+DEFAULT_TIMEOUT = 30
+MAX_REDIRECTS = 5
+MAX_RETRY_AFTER = 30
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+BODILESS_STATUSES = {204, 304}
+CHUNK_SIZE = 64 * 1024
+
+class FetchError(Exception):
+    """A sheet could not be fetched; `retry` is False when trying again will not help"""
+
+    def __init__(self, message, retry=True, delay=None):
+        super().__init__(message)
+        self.retry = retry
+        self.delay = delay
+
+class SheetFetcher:
+    """HTTP/1.1 GET client on asyncio streams with per-host connection limits and keep-alive"""
+
+    def __init__(self, per_host=DEFAULT_PER_HOST, attempts=DEFAULT_ATTEMPTS, backoff=DEFAULT_BACKOFF,
+                 timeout=DEFAULT_TIMEOUT):
+        self.per_host = per_host
+        self.attempts = attempts
+        self.backoff = backoff
+        self.timeout = timeout
+        self.requests = 0
+        self.retries = 0
+        self._limits = {}   # (scheme, host, port) -> Semaphore
+        self._idle = {}     # (scheme, host, port) -> [(reader, writer)]
+        self._ssl = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        """Close every idle connection"""
+        for connections in self._idle.values():
+            for _, writer in connections:
+                writer.close()
+        self._idle.clear()
+
+    async def _connect(self, key):
+        scheme, host, port = key
+        idle = self._idle.get(key)
+        while idle:
+            reader, writer = idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer
+            writer.close()
+        if scheme == 'https':
+            self._ssl = self._ssl or ssl.create_default_context()
+            return await asyncio.open_connection(host, port, ssl=self._ssl, server_hostname=host)
+        return await asyncio.open_connection(host, port)
+
+    async def _request(self, url, sink, extra_headers):
+        """One GET: (status, headers); the body of a 200 response goes to sink(bytes)"""
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            raise FetchError(f'unsupported URL: {url}', retry=False)
+        key = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == 'https' else 80))
+        limit = self._limits.setdefault(key, asyncio.Semaphore(self.per_host))
+        async with limit:
+            # The timeout starts once a connection slot is free
+            return await asyncio.wait_for(self._exchange(key, parts, sink, extra_headers), self.timeout)
+
+    async def _exchange(self, key, parts, sink, extra_headers):
+        """Send the GET on a pooled connection and read the whole response"""
+        reader, writer = await self._connect(key)
+        reusable = False
+        try:
+            target = (parts.path or '/') + (f'?{parts.query}' if parts.query else '')
+            extra = ''.join(f'{name}: {value}\r\n' for name, value in extra_headers.items())
+            writer.write(f'GET {target} HTTP/1.1\r\nHost: {parts.netloc}\r\n'
+                         f'Accept: text/csv, */*\r\nAccept-Encoding: identity\r\n'
+                         f'User-Agent: cartup-sheet-sync\r\n{extra}\r\n'.encode('latin-1'))
+            await writer.drain()
+            self.requests += 1
+
+            status_line = await reader.readline()
+            if not status_line:
+                raise FetchError('connection closed before the response')
+            status = int(status_line.split()[1])
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            # Only a 200 body is parsed; others are read and dropped to keep the connection usable
+            deliver = sink if status == 200 else (lambda data: None)
+            if status < 200 or status in BODILESS_STATUSES:
+                # Never a body, whatever Content-Length or Transfer-Encoding say
+                reusable = True
+            elif headers.get('transfer-encoding', '').lower() == 'chunked':
+                while True:
+                    size = int((await reader.readline()).split(b';')[0], 16)
+                    if not size:
+                        await reader.readline()
+                        break
+                    deliver(await reader.readexactly(size))
+                    await reader.readexactly(2)
+                reusable = True
+            elif 'content-length' in headers:
+                remaining = int(headers['content-length'])
+                while remaining:
+                    data = await reader.read(min(CHUNK_SIZE, remaining))
+                    if not data:
+                        raise FetchError('connection closed mid-body')
+                    deliver(data)
+                    remaining -= len(data)
+                reusable = True
+            else:
+                while data := await reader.read(CHUNK_SIZE):
+                    deliver(data)
+            reusable = reusable and headers.get('connection', '').lower() != 'close'
+            return status, headers
+        except (ValueError, IndexError) as e:
+            raise FetchError(f'malformed response: {e}')
+        finally:
+            if reusable:
+                self._idle.setdefault(key, []).append((reader, writer))
+            else:
+                writer.close()
+
+    async def fetch(self, url, make_sink, headers=None):
+        """GET `url`, following redirects and retrying with backoff: the final (status, headers).
+
+        `make_sink()` is called for every attempt and returns the function the body is
+        fed to, so a retried download starts over with a fresh parser. With conditional
+        `headers` (If-None-Match, If-Modified-Since) a 304 answer is returned too.
+        """
+        headers = headers or {}
+        for attempt in range(self.attempts):
+            if attempt:
+                self.retries += 1
+            sink = make_sink()
+            try:
+                current = url
+                for _ in range(MAX_REDIRECTS + 1):
+                    status, response = await self._request(current, sink, headers)
+                    if status in REDIRECT_STATUSES and 'location' in response:
+                        current = urljoin(current, response['location'])
+                        continue
+                    break
+                else:
+                    raise FetchError('too many redirects', retry=False)
+                if status == 200 or (status == 304 and headers):
+                    return status, response
+                delay = response.get('retry-after', '')
+                raise FetchError(f'HTTP {status}', retry=status in RETRY_STATUSES,
+                                 delay=min(int(delay), MAX_RETRY_AFTER) if delay.isdigit() else None)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                error = FetchError(f'{type(e).__name__}: {e}')
+            except FetchError as e:
+                error = e
+            if not error.retry or attempt == self.attempts - 1:
+                raise error
+            await asyncio.sleep(error.delay if error.delay is not None
+                                else self.backoff * 2 ** attempt * (0.5 + random.random()))
+
+def copy_export(source, save_path):
+    """Copy a cached sheet to its export path atomically"""
+    tmp = f'{save_path}.{os.getpid()}.tmp'
+    shutil.copyfile(source, tmp)
+    os.replace(tmp, save_path)
+
+async def fetch_sheet(fetcher, url, save_path=None, cache=None):
+    """RosterData of one published sheet, optionally also saving the CSV.
+
+    With a SheetCache the request is conditional, and a 304 answer reuses the cached
+    body and roster instead of downloading and parsing the sheet again.
+    """
+    conditional = cache.conditional_headers(url) if cache else {}
+    body_path = cache.body_tmp(url) if cache else (f'{save_path}.{os.getpid()}.tmp' if save_path else None)
+    state = {}
+
+    def make_sink():
+        state['parser'] = RosterParser()
+        if state.get('file'):
+            state['file'].seek(0)
+            state['file'].truncate()
+        if not body_path:
+            return state['parser'].feed
+        def sink(data):
+            state['parser'].feed(data)
+            state['file'].write(data)
+        return sink
+
+    if save_path:
+        os.makedirs(os.path.dirname(save_path) or '.', exist_ok=True)
+    if body_path:
+        state['file'] = open(body_path, 'wb')
+    try:
+        status, headers = await fetcher.fetch(url, make_sink, conditional)
+        if body_path:
+            state['file'].close()
+        if status == 304:
+            roster = cache.load(url)
+            if roster is None:
+                # Evicted since the request went out: fetch it in full
+                cache.remove(url)
+                return await fetch_sheet(fetcher, url, save_path, cache)
+            if save_path:
+                copy_export(cache.path(url, '.csv'), save_path)
+            return roster
+
+        roster = state['parser'].close()
+        if cache and cache.store(url, headers, body_path, roster):
+            if save_path:
+                copy_export(cache.path(url, '.csv'), save_path)
+        elif save_path:
+            os.replace(body_path, save_path)
+        return roster
+    finally:
+        if body_path:
+            state['file'].close()
+            if os.path.exists(body_path):
+                os.remove(body_path)
+
+def tenant_links(tenant_id, data_dir=DATA_DIR):
+    """{month: link} of a tenant's google_links.json, in stored order"""
+    path = os.path.join(get_tenant_data_dir(tenant_id, data_dir), 'google_links.json')
+    return {month: link for month, link in read_json(path, {}).items() if link}
+
+def all_tenant_ids(data_dir=DATA_DIR):
+    """IDs in data/tenants.json"""
+    return [t['id'] for t in read_json(os.path.join(data_dir, 'tenants.json'), {'tenants': []}).get('tenants', [])
+            if t.get('id')]
+
+async def sync_tenants(links_by_tenant, fetcher, output_dir=None, cache=None):
+    """{tenant: {'roster', 'sheets', 'failed'}} with every tenant's sheets fetched concurrently.
+
+    Like syncGoogleSheetsForTenant(), a sheet that fails is reported and left out of
+    the merged roster. A link shared by several months or tenants is fetched once.
+    """
+    jobs = {}
+    saved = {}
+    copies = []
+    for tenant_id, links in links_by_tenant.items():
+        for month, url in links.items():
+            save_path = os.path.join(output_dir, tenant_id, f'roster_{month}.csv') if output_dir else None
+            if url not in jobs:
+                jobs[url] = asyncio.ensure_future(fetch_sheet(fetcher, url, save_path, cache))
+                saved[url] = save_path
+            elif save_path:
+                copies.append((url, save_path))
+    await asyncio.gather(*jobs.values(), return_exceptions=True)
+    for url, save_path in copies:
+        if not jobs[url].exception():
+            os.makedirs(os.path.dirname(save_path), exist_ok=True)
+            copy_export(saved[url], save_path)
+
+    synced = {tenant_id: {'roster': empty_roster(), 'sheets': 0, 'failed': {}} for tenant_id in links_by_tenant}
+    for tenant_id, links in links_by_tenant.items():
+        for month, url in links.items():
+            error = jobs[url].exception()
+            if error:
+                synced[tenant_id]['failed'][month] = str(error)
+                continue
+            merge_rosters(synced[tenant_id]['roster'], jobs[url].result())
+            synced[tenant_id]['sheets'] += 1
+    return synced
+
+async def main(args):
+    tenant_ids = all_tenant_ids(args.data_dir) if args.all else args.tenant
+    links = {tenant_id: tenant_links(tenant_id, args.data_dir) for tenant_id in tenant_ids}
+    cache = None if args.no_cache else SheetCache(args.cache_dir)
+    started = time.perf_counter()
+    async with SheetFetcher(args.per_host, args.retries + 1, timeout=args.timeout) as fetcher:
+        synced = await sync_tenants(links, fetcher, args.output, cache)
+    elapsed = time.perf_counter() - started
+
+    failures = 0
+    for tenant_id, result in synced.items():
+        total = len(links[tenant_id])
+        print(f"{'✅' if not result['failed'] else '⚠️ '} {tenant_id}: "
+              f"{len(result['roster']['allEmployees'])} employees from {result['sheets']}/{total} sheets")
+        for month, error in result['failed'].items():
+            print(f"   ❌ {month}: {error}")
+        failures += len(result['failed'])
+    print(f"\n🔄 {sum(map(len, links.values()))} sheets in {elapsed:.1f}s "
+          f"({fetcher.requests} requests, {fetcher.retries} retries)")
+    if cache:
+        removed = cache.prune()
+        print(f"📦 {cache.hits} not modified, {cache.misses} downloaded"
+              + (f", {removed} old entries evicted" if removed else ''))
+    if args.output:
+        print(f"📁 Exports written to {args.output}")
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Fetch the roster Google Sheets of tenants concurrently')
+    parser.add_argument('--tenant', action='append', default=[], help='Tenant to sync (repeatable)')
+    parser.add_argument('--all', action='store_true', help='Sync every tenant in data/tenants.json')
+    parser.add_argument('--data-dir', default=DATA_DIR, help='Application data directory (default: data)')
+    parser.add_argument('--output', '-o', help='Save each sheet as <output>/<tenant>/roster_<month>.csv')
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help='Download cache (default: .cache/sheets)')
+    parser.add_argument('--no-cache', action='store_true', help='Download every sheet in full')
+    parser.add_argument('--per-host', type=int, default=DEFAULT_PER_HOST,
+                        help=f'Connections per host (default: {DEFAULT_PER_HOST})')
+    parser.add_argument('--retries', type=int, default=DEFAULT_ATTEMPTS - 1,
+                        help=f'Retries per sheet (default: {DEFAULT_ATTEMPTS - 1})')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f'Seconds per request (default: {DEFAULT_TIMEOUT})')
+    args = parser.parse_args()
+
+    if not args.tenant and not args.all:
+        parser.error('give --tenant or --all')
+    raise SystemExit(asyncio.run(main(args)))
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Output Size Budget Report for the Cartup CxP Roster Management System manual.
+Breaks a generated DOCX package down by part (each image, document.xml, styles, ...),
+maps every image back to the manual section and add_screenshot call that produced it,
+and, given a size budget, recompresses or downscales the largest images until the
+package fits, then reports the quality settings it used.
+"""
+
+import argparse
+import io
+import os
+import re
+import zipfile
+
+from docx import Document
+from docx.opc.packuri import PackURI
+from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
+from PIL import Image
+
+from package_writer import save_document
+from search_index import style_names, paragraph_style
+
+# Settings tried for an image, mildest first. Every step starts again from the original
+# image so quality is only lost once. The displayed size in the document never changes.
+RECOMPRESS_LADDER = [
+    {'format': 'png', 'colors': 256, 'scale': 1.0},
+    {'format': 'jpeg', 'quality': 85, 'scale': 1.0},
+    {'format': 'jpeg', 'quality': 75, 'scale': 1.0},
+    {'format': 'jpeg', 'quality': 70, 'scale': 0.75},
+    {'format': 'jpeg', 'quality': 60, 'scale': 0.5},
+]
+
+CONTENT_TYPES = {'png': 'image/png', 'jpeg': 'image/jpeg'}
+
+def parse_size(text):
+    """Parse sizes like "5MB", "750k" or "1048576" into bytes"""
+    match = re.fullmatch(r'\s*([\d.]+)\s*([kmg]?)i?b?\s*', text.lower())
+    if not match:
+        raise ValueError(f'Invalid size: {text}')
+    factor = {'': 1, 'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3}[match.group(2)]
+    return int(float(match.group(1)) * factor)
+
+def format_size(size):
+    """Human readable byte count"""
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024 or unit == 'MB':
+            return f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
+        size /= 1024
+
+def image_origins(doc):
+    """Map image part name -> [(section, screenshot path, caption)] for every drawing"""
+    names = style_names(doc)
+    origins = {}
+    chapter = section = ''
+    for el in doc.element.body.iterchildren():
+        if el.tag != qn('w:p'):
+            continue
+        style = paragraph_style(el, names)
+        if style in ('Heading 1', 'Heading 2'):
+            text = Paragraph(el, doc._body).text.strip()
+            if style == 'Heading 1':
+                chapter = section = text
+            else:
+                section = text
+            continue
+        for doc_pr in el.xpath('.//wp:docPr'):
+            for r_id in doc_pr.getparent().xpath('.//a:blip/@r:embed'):
+                partname = str(doc.part.rels[r_id].target_part.partname).lstrip('/')
+                origins.setdefault(partname, []).append(
+                    (section or chapter, doc_pr.get('name', ''), doc_pr.get('descr', ''))
+                )
+    return origins
+
+def analyze(path):
+    """Per-part breakdown of a DOCX package, largest first"""
+    doc = Document(path)
+    origins = image_origins(doc)
+    parts = []
+    with zipfile.ZipFile(path) as zf:
+        for info in zf.infolist():
+            parts.append({
+                'name': info.filename,
+                'stored': info.compress_size,
+                'size': info.file_size,
+                'origins': origins.get(info.filename, []),
+            })
+    parts.sort(key=lambda part: -part['stored'])
+    return {'path': path, 'total': os.path.getsize(path), 'parts': parts}
+
+def print_report(report, limit=25):
+    """Print the breakdown produced by analyze()"""
+    print(f"📦 {report['path']}: {format_size(report['total'])}")
+    print(f"{'Stored':>10} {'Raw':>10}  Part")
+    for part in report['parts'][:limit]:
+        print(f"{format_size(part['stored']):>10} {format_size(part['size']):>10}  {part['name']}")
+        for section, source, caption in part['origins']:
+            print(f"{'':>23}↳ {section} — add_screenshot('{source}', '{caption}')")
+    if len(report['parts']) > limit:
+        rest = sum(part['stored'] for part in report['parts'][limit:])
+        print(f"{format_size(rest):>10} {'':>10}  ({len(report['parts']) - limit} smaller parts)")
+
+def recompress(blob, setting):
+    """Re-encode an image blob with one RECOMPRESS_LADDER setting"""
+    with Image.open(io.BytesIO(blob)) as img:
+        img.load()
+        if setting['scale'] < 1.0:
+            size = (max(1, round(img.width * setting['scale'])), max(1, round(img.height * setting['scale'])))
+            img = img.resize(size, Image.LANCZOS)
+        out = io.BytesIO()
+        if setting['format'] == 'png':
+            if img.mode not in ('P', 'L'):
+                img = img.convert('RGBA' if 'A' in img.getbands() else 'RGB').quantize(setting['colors'])
+            img.save(out, format='PNG', optimize=True)
+        else:
+            if img.mode not in ('RGB', 'L'):
+                background = Image.new('RGB', img.size, (255, 255, 255))
+                rgba = img.convert('RGBA')
+                background.paste(rgba, mask=rgba.getchannel('A'))
+                img = background
+            img.save(out, format='JPEG', quality=setting['quality'], optimize=True, progressive=True)
+    return out.getvalue()
+
+def _replace_image(part, blob, fmt):
+    """Swap an image part's bytes, renaming it if the format changed"""
+    ext = 'jpeg' if fmt == 'jpeg' else 'png'
+    partname = str(part.partname)
+    if not partname.endswith('.' + ext):
+        part.partname = PackURI(os.path.splitext(partname)[0] + '.' + ext)
+    part._content_type = CONTENT_TYPES[fmt]
+    part._blob = blob
+
+def _saved_size(doc):
+    """Size of the package as it would be written now"""
+    stream = io.BytesIO()
+    save_document(doc, stream)
+    return stream.tell()
+
+def fit_budget(path, budget, output):
+    """Recompress the largest images of `path` until the package fits `budget` bytes.
+
+    Writes the result to `output` and returns (final size, [(part, origins, setting, before, after)]).
+    """
+    doc = Document(path)
+    origins = image_origins(doc)
+    images = {}
+    for rel in doc.part.rels.values():
+        if not rel.is_external and rel.reltype.endswith('/image'):
+            part = rel.target_part
+            images[str(part.partname)] = {'part': part, 'original': part.blob, 'level': -1, 'setting': None}
+
+    # Images are stored as they are (see package_writer), so swapping one changes the
+    # package by the difference in image bytes; only the result is saved and measured
+    estimate = _saved_size(doc)
+    exhausted = False
+    while True:
+        while estimate > budget:
+            candidates = [img for img in images.values() if img['level'] + 1 < len(RECOMPRESS_LADDER)]
+            if not candidates:
+                exhausted = True
+                break
+            image = max(candidates, key=lambda img: len(img['part'].blob))
+            current = len(image['part'].blob)
+            # Climb the ladder until a setting actually makes this image smaller
+            while image['level'] + 1 < len(RECOMPRESS_LADDER):
+                image['level'] += 1
+                setting = RECOMPRESS_LADDER[image['level']]
+                blob = recompress(image['original'], setting)
+                if len(blob) < current:
+                    _replace_image(image['part'], blob, setting['format'])
+                    image['setting'] = setting
+                    estimate -= current - len(blob)
+                    break
+        save_document(doc, output)
+        size = os.path.getsize(output)
+        if size <= budget or exhausted:
+            break
+        # Renamed parts and content types can leave it a few bytes over: carry on from there
+        estimate = size
+
+    changes = []
+    for name, image in sorted(images.items()):
+        if image['setting'] is None:
+            continue
+        changes.append((
+            str(image['part'].partname).lstrip('/'),
+            origins.get(name.lstrip('/'), []),
+            image['setting'],
+            len(image['original']),
+            len(image['part'].blob),
+        ))
+    return size, changes
+
+def describe_setting(setting):
+    """One-line description of a RECOMPRESS_LADDER setting"""
+    if setting['format'] == 'png':
+        text = f"PNG, {setting['colors']} colors"
+    else:
+        text = f"JPEG, quality {setting['quality']}"
+    if setting['scale'] < 1.0:
+        text += f", scaled to {setting['scale']:.0%}"
+    return text
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Break down a manual DOCX by part and optionally fit it to a size budget')
+    parser.add_argument('docx', nargs='?', default='USER_MANUAL.docx', help='DOCX package to analyze')
+    parser.add_argument('--budget', type=parse_size, help='Target size, e.g. 5MB; recompresses images until it fits')
+    parser.add_argument('-o', '--output', help='Where to write the recompressed package (default: <docx>.budget.docx)')
+    parser.add_argument('--limit', type=int, default=25, help='Number of parts to list')
+    args = parser.parse_args()
+
+    print_report(analyze(args.docx), args.limit)
+    if args.budget:
+        output = args.output or os.path.splitext(args.docx)[0] + '.budget.docx'
+        size, changes = fit_budget(args.docx, args.budget, output)
+        status = '✅ Budget met' if size <= args.budget else '⚠️ Budget not met even at the lowest quality'
+        print(f"\n{status}: {format_size(size)} (budget {format_size(args.budget)}) → {output}")
+        for partname, origins, setting, before, after in changes:
+            source = origins[0][1] if origins else ''
+            print(f"  {partname}: {describe_setting(setting)} ({format_size(before)} → {format_size(after)}) {source}")
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Swap Candidate Index for the Cartup CxP Roster Management System.
+Precomputes, for every employee and date, who they could swap shifts with: a teammate
+working a different shift that day, where both still get the minimum rest before and
+after the swapped shifts. Employees otherwise hunt for a partner by hand before using
+submit-swap-request.
+
+The index is written as one small JSON shard per date, which lib/swapIndex.ts loads on
+demand:
+
+    {"v": 1, "date": "1Oct", "codes": ["D1", "D2", "M2", ...],
+     "teams": {"VOICE": {"D2": [["SLL-88818", 5], ...], ...}}}
+
+Each entry is an employee on that shift and a bit mask over "codes" of the shifts they
+could take instead; "codes" are every defined shift code, sorted. A manifest records a
+digest of each date's inputs (the ID, team and surrounding days of everyone on shift
+that day, shift times and rest rule), so a rebuild only rewrites the shards of dates
+whose inputs changed.
+
+    python swap_index.py --tenant <tenant-id>       # -> data/tenants/<id>/swap_index/
+    python swap_index.py roster.csv -o swap_index/
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+
+import numpy as np
+
+from roster import grid_days, roster_grid, shift_times
+from roster_rules import DEFAULT_RULES, load_rosters
+from tenant_data import DATA_DIR, DEFAULT_SHIFT_DEFINITIONS, get_tenant_data_dir, load_tenant
+
+INDEX_VERSION = 1
+MANIFEST = 'manifest.json'
+
+def shard_name(date):
+    """File name of a date's shard"""
+    return re.sub(r'[^A-Za-z0-9_-]', '_', date) + '.json'
+
+def shift_codes(times):
+    """Shift codes that have times, sorted, so their order (and the mask bits) does not
+    depend on where in the roster each code first appears"""
+    return sorted(times)
+
+def stable_hashes(values):
+    """uint64 hash of each string, the same in every build"""
+    return np.array([int.from_bytes(hashlib.sha256(value.encode()).digest()[:8], 'little') for value in values],
+                    dtype=np.uint64)
+
+def rest_feasibility(grid, times, min_rest, columns, year=None):
+    """(employees, len(columns), shift codes) booleans: could the employee work each shift that day
+    with at least `min_rest` minutes of rest before and after it?"""
+    matrix = grid['matrix']
+    codes = shift_codes(times)
+    days = grid_days(grid, year)
+    rows = matrix.shape[0]
+    starts = np.array([times[code][0] if code in times else 0 for code in grid['codes']], dtype=np.float64)
+    ends = np.array([times[code][1] if code in times else 0 for code in grid['codes']], dtype=np.float64)
+    working = np.array([code in times for code in grid['codes']])
+
+    columns = np.asarray(columns, dtype=np.int64)
+    previous_end = np.full((rows, len(columns)), -np.inf)
+    next_start = np.full((rows, len(columns)), np.inf)
+    has_previous = columns > 0
+    has_next = columns < matrix.shape[1] - 1
+    if has_previous.any():
+        cols = columns[has_previous]
+        cells = matrix[:, cols - 1]
+        gap = (days[cols] - days[cols - 1]) * 1440
+        previous_end[:, has_previous] = np.where(working[cells], ends[cells] - gap, -np.inf)
+    if has_next.any():
+        cols = columns[has_next]
+        cells = matrix[:, cols + 1]
+        gap = (days[cols + 1] - days[cols]) * 1440
+        next_start[:, has_next] = np.where(working[cells], starts[cells] + gap, np.inf)
+
+    code_starts = np.array([times[code][0] for code in codes], dtype=np.float64)
+    code_ends = np.array([times[code][1] for code in codes], dtype=np.float64)
+    return ((code_starts - previous_end[:, :, None] >= min_rest) &
+            (next_start[:, :, None] - code_ends >= min_rest))
+
+def date_shard(grid, column, feasible, codes):
+    """Shard of one date from its rest_feasibility() slice (employees x shift codes)"""
+    number_of = {code: idx for idx, code in enumerate(grid['codes'])}
+    bits = 1 << np.arange(len(codes), dtype=np.int64)
+    teams = {}
+    for idx, code in enumerate(codes):
+        if code not in number_of:
+            continue
+        rows = np.flatnonzero(grid['matrix'][:, column] == number_of[code])
+        if not len(rows):
+            continue
+        # Shifts each of them could take instead of their own
+        masks = (feasible[rows] * bits).sum(axis=1) & ~bits[idx]
+        for row, mask in zip(rows.tolist(), masks.tolist()):
+            team = grid['employees'][row]['team']
+            teams.setdefault(team, {}).setdefault(code, []).append([grid['employees'][row]['id'], mask])
+    return {'v': INDEX_VERSION, 'date': grid['dates'][column], 'codes': codes, 'teams': teams}
+
+def date_digests(grid, times, min_rest):
+    """Digest of everything each date's shard is built from: the shift times and rest rule,
+    and the ID, team and three days around the date of everyone on a shift that day.
+
+    Cells are hashed by code string, not by grid code number (numbers follow the order
+    codes first appear in, so one edited cell could renumber them all), and nobody off
+    shift that day is included, so hires, leavers and edits only touch their own dates.
+    """
+    matrix = grid['matrix']
+    common = hashlib.sha256(json.dumps({
+        'v': INDEX_VERSION, 'codes': shift_codes(times), 'times': times, 'min_rest': min_rest,
+    }, sort_keys=True).encode()).digest()
+    code_hashes = stable_hashes(grid['codes'])
+    row_hashes = stable_hashes(f"{emp['id']}\x1f{emp['team']}" for emp in grid['employees'])
+    on_shift = np.array([code in times for code in grid['codes']], dtype=bool)
+    days = grid_days(grid)
+    digests = {}
+    for column, date in enumerate(grid['dates']):
+        digest = hashlib.sha256(common)
+        rows = np.flatnonzero(on_shift[matrix[:, column]])
+        first, last = max(0, column - 1), min(matrix.shape[1], column + 2)
+        # Which neighbouring days exist matters, not just their cells
+        digest.update(f'{column - first}:{last - column}'.encode())
+        digest.update(row_hashes[rows].tobytes())
+        digest.update(np.ascontiguousarray(code_hashes[matrix[rows, first:last]]).tobytes())
+        digest.update(np.diff(days[first:last]).tobytes())
+        digests[date] = digest.hexdigest()[:20]
+    return digests
+
+def read_manifest(output_dir):
+    """Manifest of an index directory, or an empty one"""
+    try:
+        with open(os.path.join(output_dir, MANIFEST), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('v') == INDEX_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {'v': INDEX_VERSION, 'shards': {}}
+
+def write_json(path, data):
+    """Write compact JSON atomically"""
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp, path)
+
+def build_index(grid, output_dir, definitions=DEFAULT_SHIFT_DEFINITIONS, min_rest_hours=DEFAULT_RULES['min_rest_hours'],
+                full=False):
+    """Write the shards of dates whose inputs changed and the manifest: (written, unchanged, removed)"""
+    times = shift_times(definitions)
+    min_rest = min_rest_hours * 60
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = read_manifest(output_dir)
+    digests = date_digests(grid, times, min_rest)
+    stale = [column for column, date in enumerate(grid['dates'])
+             if full or manifest['shards'].get(date) != digests[date]
+             or not os.path.exists(os.path.join(output_dir, shard_name(date)))]
+
+    codes = shift_codes(times)
+    if stale:
+        feasible = rest_feasibility(grid, times, min_rest, stale)
+        for position, column in enumerate(stale):
+            shard = date_shard(grid, column, feasible[:, position], codes)
+            write_json(os.path.join(output_dir, shard_name(grid['dates'][column])), shard)
+
+    removed = [date for date in manifest['shards'] if date not in digests]
+    for date in removed:
+        try:
+            os.remove(os.path.join(output_dir, shard_name(date)))
+        except OSError:
+            pass
+    write_json(os.path.join(output_dir, MANIFEST), {'v': INDEX_VERSION, 'shards': digests})
+    return len(stale), len(grid['dates']) - len(stale), len(removed)
+
+def swap_candidates(shard, employee_id):
+    """(id, shift) of everyone `employee_id` could swap with, from one shard"""
+    for team in shard['teams'].values():
+        for code, entries in team.items():
+            own = next((mask for emp_id, mask in entries if emp_id == employee_id), None)
+            if own is None:
+                continue
+            mine = shard['codes'].index(code)
+            return [
+                (emp_id, other)
+                for idx, other in enumerate(shard['codes']) if own >> idx & 1
+                for emp_id, mask in team.get(other, []) if mask >> mine & 1
+            ]
+    return []
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build the per-date swap candidate index')
+    parser.add_argument('csv', nargs='*', help='Roster sheet exports (merged in order)')
+    parser.add_argument('--tenant', help="Index a tenant's current roster")
+    parser.add_argument('--data-dir', default=DATA_DIR, help='Application data directory (default: data)')
+    parser.add_argument('--output', '-o', help='Index directory (default: data/tenants/<id>/swap_index)')
+    parser.add_argument('--min-rest', type=float, default=DEFAULT_RULES['min_rest_hours'],
+                        help='Fewest hours between shifts (default: 11)')
+    parser.add_argument('--full', action='store_true', help='Rewrite every shard')
+    args = parser.parse_args()
+
+    if args.tenant:
+        tenant = load_tenant(args.tenant, args.data_dir)
+        roster, definitions = tenant['roster'], tenant['shift_definitions']
+        output = args.output or os.path.join(get_tenant_data_dir(args.tenant, args.data_dir), 'swap_index')
+    elif args.csv and args.output:
+        roster, definitions, output = load_rosters(args.csv), DEFAULT_SHIFT_DEFINITIONS, args.output
+    else:
+        parser.error('give --tenant, or roster CSV files and --output')
+
+    written, unchanged, removed = build_index(roster_grid(roster), output, definitions, args.min_rest, args.full)
+    print(f"🔁 {output}: {written} shards written, {unchanged} unchanged, {removed} removed")
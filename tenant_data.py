@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Tenant Data Loader for the Cartup CxP Roster Management System manual.
+Reads a tenant's data directory (data/tenants/<tenant_id>) read-only, using the same
+files lib/dataStore.tenant.ts writes, so the manual can show real shift codes, teams
+and roster figures instead of example data.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+from i18n import N_
+
+DATA_DIR = 'data'
+
+# Same defaults getShiftDefinitionsForTenant() falls back to in lib/dataStore.tenant.ts
+DEFAULT_SHIFT_DEFINITIONS = {
+    'M2': N_('8 AM – 5 PM'),
+    'M3': N_('9 AM – 6 PM'),
+    'M4': N_('10 AM – 7 PM'),
+    'D1': N_('12 PM – 9 PM'),
+    'D2': N_('1 PM – 10 PM'),
+    'DO': 'OFF',
+    'SL': N_('Sick Leave'),
+    'CL': N_('Casual Leave'),
+    'EL': N_('Emergency Leave'),
+    'HL': N_('Holiday Leave'),
+}
+
+# Files of data/tenants/<id>/ the manual reads, in load_tenant() order
+TENANT_FILES = ['google_data.json', 'admin_data.json', 'settings.json', 'admin_users.json', 'google_links.json']
+
+DATE_HEADER_RE = re.compile(r'^\d{1,2}[-.\s]*(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)', re.I)
+
+# Parsed JSON files keyed by absolute path: (mtime_ns, size, data)
+_json_cache = {}
+
+def read_json(path, fallback):
+    """Read a JSON file, reusing the parsed result while the file is unchanged on disk.
+
+    The returned object is shared between callers and must be treated as read-only.
+    """
+    key = os.path.abspath(path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        return fallback
+    cached = _json_cache.get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    try:
+        with open(key, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return fallback
+    _json_cache[key] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+def files_fingerprint(paths):
+    """Short hash of the paths' modification times and sizes; changes whenever one of them does"""
+    digest = hashlib.sha1()
+    for path in paths:
+        try:
+            st = os.stat(path)
+            digest.update(f'{path}:{st.st_mtime_ns}:{st.st_size};'.encode())
+        except OSError:
+            digest.update(f'{path}:missing;'.encode())
+    return digest.hexdigest()[:16]
+
+def clear_cache():
+    """Drop every cached parsed file"""
+    _json_cache.clear()
+
+def get_tenant_data_dir(tenant_id, data_dir=DATA_DIR):
+    """Mirror of getTenantDataDir() in lib/constants.ts"""
+    return os.path.join(data_dir, 'tenants', tenant_id)
+
+def is_date_header(header):
+    """True for roster headers like "1Oct" or "15-Jan" (not the trailing summary columns)"""
+    return bool(header and DATE_HEADER_RE.match(header.strip()))
+
+def _dedupe_teams(roster):
+    """Keep each employee only in their current team, like deduplicateEmployeeTeamChanges()"""
+    current = {}
+    for team_name, employees in roster.get('teams', {}).items():
+        for emp in employees:
+            current[emp.get('id')] = emp.get('currentTeam') or team_name
+    return {
+        team_name: [emp for emp in employees if current.get(emp.get('id')) == team_name]
+        for team_name, employees in roster.get('teams', {}).items()
+    }
+
+def _merge_display(google, admin):
+    """Google roster with admin modifications applied on top, like mergeDisplay()"""
+    teams = {name: list(emps) for name, emps in _dedupe_teams(google).items()}
+    for team_name, admin_emps in _dedupe_teams(admin).items():
+        merged = teams.setdefault(team_name, [])
+        positions = {emp.get('id'): idx for idx, emp in enumerate(merged)}
+        for emp in admin_emps:
+            if emp.get('id') in positions:
+                merged[positions[emp['id']]] = emp
+            else:
+                merged.append(emp)
+    # mergeDisplay() keeps the Google headers; the admin ones only stand in for a tenant
+    # that has never synced, whose Google roster has none
+    headers = google.get('headers') or admin.get('headers') or []
+    return {
+        'teams': teams,
+        'headers': list(headers),
+        'allEmployees': [emp for emps in teams.values() for emp in emps],
+    }
+
+def tenant_paths(tenant_id, data_dir=DATA_DIR):
+    """Every file load_tenant() reads: TENANT_FILES then data/tenants.json"""
+    tenant_dir = get_tenant_data_dir(tenant_id, data_dir)
+    return [os.path.join(tenant_dir, name) for name in TENANT_FILES] + [os.path.join(data_dir, 'tenants.json')]
+
+def tenant_fingerprint(tenant_id, data_dir=DATA_DIR):
+    """load_tenant()'s fingerprint without loading the tenant"""
+    return files_fingerprint(tenant_paths(tenant_id, data_dir))
+
+def load_tenant(tenant_id, data_dir=DATA_DIR):
+    """Load a tenant's roster, shift definitions, teams and settings without writing anything"""
+    tenant_dir = get_tenant_data_dir(tenant_id, data_dir)
+    if not os.path.isdir(tenant_dir):
+        raise FileNotFoundError(f'Tenant data directory not found: {tenant_dir}')
+
+    paths = tenant_paths(tenant_id, data_dir)
+    empty_roster = {'teams': {}, 'headers': [], 'allEmployees': []}
+    google = read_json(paths[0], empty_roster)
+    admin = read_json(paths[1], empty_roster)
+    settings = read_json(paths[2], {'autoSyncEnabled': False})
+    admin_users = read_json(paths[3], {'users': []})
+    google_links = read_json(paths[4], {})
+
+    tenant = {}
+    for t in read_json(paths[5], {'tenants': []}).get('tenants', []):
+        if t.get('id') == tenant_id:
+            tenant = t
+            break
+
+    shift_definitions = settings.get('shiftDefinitions') or DEFAULT_SHIFT_DEFINITIONS
+    roster = _merge_display(google, admin)
+
+    return {
+        'id': tenant_id,
+        'name': tenant.get('settings', {}).get('organization_name') or tenant.get('name') or tenant_id,
+        'roster': roster,
+        'teams': roster['teams'],
+        'shift_definitions': {code: desc for code, desc in shift_definitions.items() if code},
+        'settings': settings,
+        'admin_users': admin_users.get('users', []),
+        'google_links': google_links,
+        # Identifies this version of the tenant's data, for caches of anything built from it
+        'fingerprint': files_fingerprint(paths),
+    }
+
+def shift_code_rows(descriptions, tenant=None):
+    """(code, time/type, description) rows for the Shift Codes Reference table.
+
+    `descriptions` maps shift codes to their description (manual_content/appendix.yaml).
+    """
+    definitions = tenant['shift_definitions'] if tenant else DEFAULT_SHIFT_DEFINITIONS
+    rows = []
+    for code, time in definitions.items():
+        if time == 'OFF':
+            time = N_('Day Off')
+        rows.append((code, time, descriptions.get(code, '')))
+    return rows
+
+def admin_user_rows(tenant):
+    """(role, username, full name) rows for the tenant's admin accounts; passwords are never read out"""
+    return [
+        (user.get('role', ''), user.get('username', ''), user.get('full_name', ''))
+        for user in tenant['admin_users']
+    ]
+
+def active_employees(employees):
+    """Employees that have not been soft-deleted"""
+    return [emp for emp in employees if emp.get('status', 'active') != 'inactive']
+
+def example_employee_id(tenant=None, default='SLL-88717'):
+    """A real employee ID from the tenant's roster to use in examples"""
+    if tenant:
+        for emp in active_employees(tenant['roster']['allEmployees']):
+            if emp.get('id'):
+                return emp['id']
+    return default
+
+def team_rows(tenant):
+    """(team, active employee count) rows sorted by team name"""
+    return [
+        (team_name, len(active_employees(employees)))
+        for team_name, employees in sorted(tenant['teams'].items())
+        if team_name
+    ]
+
+def roster_summary(tenant):
+    """Date columns plus per-code shift counts for the tenant's current display roster"""
+    headers = tenant['roster']['headers']
+    date_idx = [idx for idx, h in enumerate(headers) if is_date_header(h)]
+    counts = {}
+    employees = active_employees(tenant['roster']['allEmployees'])
+    for emp in employees:
+        schedule = emp.get('schedule', [])
+        for idx in date_idx:
+            if idx < len(schedule):
+                code = (schedule[idx] or '').strip().upper()
+                if code:
+                    counts[code] = counts.get(code, 0) + 1
+    return {
+        'dates': [headers[idx] for idx in date_idx],
+        'employees': len(employees),
+        'code_counts': counts,
+    }
@@ -0,0 +1,37 @@
+"""HTML help rendering of annotated screenshots."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+from docx import Document
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from doc_cursor import DocCursor
+from generate_manual import add_screenshot
+from html_manual import render_html
+
+class AnnotatedScreenshotTest(unittest.TestCase):
+    def test_html_shows_the_annotated_image(self):
+        with tempfile.TemporaryDirectory() as root:
+            source = os.path.join(root, 'screen.png')
+            Image.new('RGB', (200, 100), 'white').save(source)
+            doc = DocCursor(Document())
+            doc.add_heading('1. Introduction', 1)
+            add_screenshot(doc, source, 'Dashboard', annotations=[{'highlight': [0, 0, 200, 100]}])
+
+            output = os.path.join(root, 'html')
+            pages = render_html(doc.document, output)
+            with open(pages[-1], 'r', encoding='utf-8') as f:
+                page = f.read()
+            assets = os.path.join(output, 'assets')
+            fallback = next(name for name in os.listdir(assets) if name.endswith('.png') and name in page)
+            with Image.open(os.path.join(assets, fallback)) as img:
+                # The highlight tints the whole of the plain white screenshot
+                self.assertNotEqual(img.convert('RGB').getpixel((100, 50)), (255, 255, 255))
+
+if __name__ == '__main__':
+    unittest.main()
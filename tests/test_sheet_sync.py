@@ -0,0 +1,78 @@
+"""Conditional sheet fetches against a keep-alive HTTP/1.1 stand-in for Google Sheets."""
+
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sheet_cache import SheetCache
+from sheet_sync import SheetFetcher, fetch_sheet
+
+CSV = (b'Employee ID,Name,Team,01-Oct,02-Oct\r\n'
+       b'SLL-88818,Tanvin Ahmed,VOICE,M2,D1\r\n')
+ETAG = '"v1"'
+
+class SheetHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    length_on_304 = False
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        if self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.send_header('ETag', ETAG)
+            if self.length_on_304:
+                self.send_header('Content-Length', str(len(CSV)))
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/csv')
+        self.send_header('ETag', ETAG)
+        self.send_header('Content-Length', str(len(CSV)))
+        self.end_headers()
+        self.wfile.write(CSV)
+
+    def log_message(self, *args):
+        pass
+
+class ConditionalFetchTest(unittest.TestCase):
+    def serve(self, handler):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        server.connections = set()
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def fetch_twice(self, handler):
+        server = self.serve(handler)
+        url = f'http://127.0.0.1:{server.server_address[1]}/sheet.csv'
+
+        async def run():
+            with tempfile.TemporaryDirectory() as root:
+                cache = SheetCache(root)
+                async with SheetFetcher(attempts=1, timeout=2) as fetcher:
+                    first = await fetch_sheet(fetcher, url, cache=cache)
+                    second = await fetch_sheet(fetcher, url, cache=cache)
+                    return first, second, fetcher.requests
+        return asyncio.run(run()) + (server.connections,)
+
+    def test_304_without_body_on_kept_alive_connection(self):
+        first, second, requests, connections = self.fetch_twice(SheetHandler)
+        self.assertEqual(second, first)
+        self.assertEqual(requests, 2)
+        self.assertEqual(len(connections), 1)
+
+    def test_304_with_content_length_has_no_body(self):
+        handler = type('LengthHandler', (SheetHandler,), {'length_on_304': True})
+        first, second, requests, connections = self.fetch_twice(handler)
+        self.assertEqual(second, first)
+        self.assertEqual(len(connections), 1)
+
+if __name__ == '__main__':
+    unittest.main()